@@ -0,0 +1,328 @@
+import streamlit as st
+import pandas as pd
+import datetime
+
+from ppic_data import get_attendance_by_date, upsert_attendance_day, upsert_attendance_days, save_holidays
+from ppic_payroll import (
+    calculate_overtime_hours, ATTENDANCE_STATUSES, build_attendance_grid,
+    validate_attendance_grid, summarize_attendance_grid, calculate_payroll_period
+)
+from ppic_timeclock import read_punch_log, build_import_plan
+from ppic_export import render_export_panel
+
+
+# ===== MENU: ABSENSI - TAB BASED WITH SEARCH =====
+def render():
+    st.header("📝 ABSENSI PEKERJA HARIAN")
+    st.caption("Input kehadiran pekerja oleh Mandor")
+    
+    workers = st.session_state["workers"]
+    attendance_list = st.session_state["attendance"]
+    
+    if not workers:
+        st.warning("⚠️ Belum ada data pekerja. Silakan tambah pekerja di menu Database → Pekerja Harian")
+        st.stop()
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["📝 Input Absensi", "📋 Riwayat Absensi", "📊 Laporan", "⏱️ Import Mesin Absen"])
+    
+    with tab1:
+        st.markdown("### 📅 Input Absensi")
+        
+        col_date1, col_date2 = st.columns(2)
+        with col_date1:
+            attendance_date = st.date_input("Tanggal Absensi", datetime.date.today(), key="attendance_date")
+        with col_date2:
+            st.info(f"📆 {attendance_date.strftime('%A, %d %B %Y')}")
+        
+        date_str = str(attendance_date)
+        existing_attendance = get_attendance_by_date(date_str)
+        
+        if existing_attendance:
+            st.warning(f"⚠️ Absensi tanggal {date_str} sudah ada. Anda bisa mengeditnya.")
+            existing_records = existing_attendance.get("records", {})
+        else:
+            existing_records = {}
+        
+        st.markdown("---")
+        
+        # ===== GRID ABSENSI HARIAN WITH CONFIRMATION =====
+        st.markdown("### 🗂️ Grid Absensi Harian")
+        st.info("💡 Default: Semua hadir jam 08:00. Ubah status yang tidak masuk, isi Jam Pulang saat check-out (lewat 16:00 = overtime).")
+        
+        grid_key = f"attendance_grid_{date_str}"
+        edited_grid = st.data_editor(
+            build_attendance_grid(workers, existing_records),
+            column_config={
+                "worker_id": None,
+                "name": st.column_config.TextColumn("Nama", disabled=True),
+                "position": st.column_config.TextColumn("Posisi", disabled=True),
+                "status": st.column_config.SelectboxColumn("Status", options=ATTENDANCE_STATUSES, required=True),
+                "check_in": st.column_config.TimeColumn("Jam Masuk", format="HH:mm", step=60),
+                "check_out": st.column_config.TimeColumn("Jam Pulang", format="HH:mm", step=60)
+            },
+            num_rows="fixed",
+            hide_index=True,
+            use_container_width=True,
+            key=grid_key
+        )
+        
+        records_df, grid_errors = validate_attendance_grid(edited_grid)
+        summary = summarize_attendance_grid(records_df)
+        
+        col_sum1, col_sum2, col_sum3, col_sum4, col_sum5 = st.columns(5)
+        col_sum1.metric("✅ Hadir", summary["hadir"])
+        col_sum2.metric("❌ Tidak Hadir", summary["tidak_hadir"])
+        col_sum3.metric("📝 Izin", summary["izin"])
+        col_sum4.metric("🏥 Sakit", summary["sakit"])
+        col_sum5.metric("⏰ Overtime", f"{summary['overtime_hours']:.1f} jam", f"{summary['overtime_workers']} pekerja", delta_color="off")
+        
+        if summary["overtime_workers"] > 0:
+            with st.expander(f"⏰ Rincian Overtime (Rp {summary['overtime_cost']:,.0f})"):
+                ot_df = records_df[records_df["overtime_hours"] > 0][["name", "check_in", "check_out", "overtime_hours", "overtime_cost"]]
+                ot_df.columns = ["Nama", "Jam Masuk", "Jam Pulang", "Jam Overtime", "Biaya (Rp)"]
+                st.dataframe(ot_df, use_container_width=True, hide_index=True)
+        
+        if grid_errors:
+            st.error("❌ Data belum valid:\n\n" + "\n".join(f"- {msg}" for msg in grid_errors[:10]))
+            if len(grid_errors) > 10:
+                st.caption(f"... dan {len(grid_errors) - 10} error lainnya")
+        
+        # CONFIRMATION SYSTEM
+        if "confirm_save_grid" not in st.session_state:
+            st.session_state["confirm_save_grid"] = False
+        
+        if st.session_state["confirm_save_grid"] and not grid_errors:
+            st.warning(
+                f"⚠️ KONFIRMASI: Simpan absensi **{date_str}** untuk **{summary['total_workers']} pekerja** "
+                f"(Hadir {summary['hadir']}, Overtime {summary['overtime_hours']:.1f} jam / Rp {summary['overtime_cost']:,.0f}). "
+                "Pastikan semua data sudah benar!"
+            )
+            
+            col_conf1, col_conf2 = st.columns(2)
+            
+            with col_conf1:
+                if st.button("✅ YA, SIMPAN SEKARANG", use_container_width=True, type="primary", key="confirm_yes_grid"):
+                    st.session_state["confirm_save_grid"] = False
+                    if upsert_attendance_day(date_str, records_df, summary):
+                        # Grid dibangun ulang dari data tersimpan
+                        st.session_state.pop(grid_key, None)
+                        st.success(f"✅ Absensi {date_str} tersimpan ({summary['total_workers']} pekerja) pada {datetime.datetime.now().strftime('%H:%M:%S')}")
+                        st.balloons()
+                    else:
+                        st.error("❌ Gagal menyimpan data! Silakan coba lagi.")
+            
+            with col_conf2:
+                if st.button("❌ BATAL", use_container_width=True, type="secondary", key="confirm_no_grid"):
+                    st.session_state["confirm_save_grid"] = False
+                    st.rerun()
+        else:
+            if st.button("💾 SIMPAN ABSENSI", use_container_width=True, type="primary", key="save_grid", disabled=bool(grid_errors)):
+                st.session_state["confirm_save_grid"] = True
+                st.rerun()
+    
+    # ===== TAB RIWAYAT (Keep existing code) =====
+    with tab2:
+        st.markdown("### 📋 Riwayat Absensi")
+        
+        if attendance_list:
+            sorted_attendance = sorted(attendance_list, key=lambda x: x.get("date", ""), reverse=True)
+            
+            for att in sorted_attendance[:30]:
+                date_display = att.get("date", "Unknown")
+                hadir = att.get("hadir", 0)
+                total = att.get("total_workers", 0)
+                pct = (hadir / total * 100) if total > 0 else 0
+                ot_hours = att.get("overtime_hours", 0)
+                
+                with st.expander(f"📅 {date_display} | Hadir: {hadir}/{total} ({pct:.0f}%) | ⏰ OT: {ot_hours:.1f}h"):
+                    col_sum1, col_sum2, col_sum3, col_sum4 = st.columns(4)
+                    col_sum1.metric("✅ Hadir", att.get("hadir", 0))
+                    col_sum2.metric("❌ Tidak Hadir", att.get("tidak_hadir", 0))
+                    col_sum3.metric("📝 Izin", att.get("izin", 0))
+                    col_sum4.metric("🏥 Sakit", att.get("sakit", 0))
+                    
+                    if ot_hours > 0:
+                        st.info(f"⏰ Total Overtime: {ot_hours:.1f} jam")
+                    
+                    st.markdown("---")
+                    st.markdown("**Detail:**")
+                    
+                    records = att.get("records", {})
+                    for worker_id, record in records.items():
+                        status = record.get("status", "Unknown")
+                        
+                        if status == "Hadir":
+                            badge_color = "#10B981"
+                            icon = "✅"
+                        elif status == "Tidak Hadir":
+                            badge_color = "#EF4444"
+                            icon = "❌"
+                        elif status == "Izin":
+                            badge_color = "#3B82F6"
+                            icon = "📝"
+                        else:
+                            badge_color = "#F59E0B"
+                            icon = "🏥"
+                        
+                        ot_text = ""
+                        if status == "Hadir":
+                            ot = calculate_overtime_hours(record.get("check_in", "08:00"), record.get("check_out", "16:00"))
+                            if ot > 0:
+                                ot_text = f" ⏰ {ot:.1f}h"
+                        
+                        st.markdown(f"""
+                        <div style="display: flex; justify-content: space-between; padding: 8px 0; border-bottom: 1px solid #374151;">
+                            <span>{icon} <strong>{record.get('name', 'Unknown')}</strong></span>
+                            <span>{record.get('check_in', '-')} → {record.get('check_out', '-')}{ot_text}</span>
+                            <span style="background: {badge_color}; color: white; padding: 3px 10px; border-radius: 10px; font-size: 0.85em;">{status}</span>
+                        </div>
+                        """, unsafe_allow_html=True)
+        else:
+            st.info("📝 Belum ada data absensi")
+    
+    # ===== TAB LAPORAN (Keep existing code) =====
+    with tab3:
+        st.markdown("### 📊 Laporan Kehadiran")
+        
+        if attendance_list:
+            col_rep1, col_rep2 = st.columns(2)
+            with col_rep1:
+                start_date = st.date_input("Dari Tanggal", datetime.date.today() - datetime.timedelta(days=30), key="report_start")
+            with col_rep2:
+                end_date = st.date_input("Sampai Tanggal", datetime.date.today(), key="report_end")
+            
+            filtered = [a for a in attendance_list if start_date <= datetime.datetime.strptime(a.get("date", "2000-01-01"), "%Y-%m-%d").date() <= end_date]
+            
+            if filtered:
+                total_days = len(filtered)
+                avg_hadir = sum(a.get("hadir", 0) for a in filtered) / total_days
+                avg_pct = (avg_hadir / len(workers) * 100) if workers else 0
+                total_overtime_hours = sum(a.get("overtime_hours", 0) for a in filtered)
+                
+                col_rsum1, col_rsum2, col_rsum3, col_rsum4 = st.columns(4)
+                col_rsum1.metric("📅 Total Hari", total_days)
+                col_rsum2.metric("📊 Rata-rata Hadir", f"{avg_hadir:.1f}")
+                col_rsum3.metric("📈 Rata-rata %", f"{avg_pct:.1f}%")
+                col_rsum4.metric("⏰ Total Overtime", f"{total_overtime_hours:.1f}h")
+                
+                st.markdown("---")
+                st.markdown("#### 👷 Statistik & Payroll Per Pekerja")
+                
+                payroll_df, working_days = calculate_payroll_period(attendance_list, workers, start_date, end_date)
+                st.caption(f"📆 {working_days} hari kerja dalam periode (Senin-Sabtu, di luar hari libur & frozen)")
+                
+                stats_df = pd.DataFrame({
+                    "Nama": payroll_df["name"],
+                    "Hadir": payroll_df["hadir"].astype(int),
+                    "Tidak Hadir": payroll_df["tidak_hadir"].astype(int),
+                    "Izin": payroll_df["izin"].astype(int),
+                    "Sakit": payroll_df["sakit"].astype(int),
+                    "Overtime (jam)": payroll_df["overtime_hours"].round(1),
+                    "% Kehadiran": (payroll_df["hadir"] / total_days * 100).round(1),
+                    "Upah Reguler (Rp)": payroll_df["regular_cost"].round(0),
+                    "Biaya Lembur (Rp)": payroll_df["overtime_cost"].round(0),
+                    "Total (Rp)": payroll_df["total_cost"].round(0)
+                })
+                st.dataframe(stats_df, use_container_width=True, hide_index=True)
+                
+                col_pay1, col_pay2, col_pay3 = st.columns(3)
+                col_pay1.metric("💵 Upah Reguler", f"Rp {payroll_df['regular_cost'].sum():,.0f}")
+                col_pay2.metric("⏰ Biaya Lembur", f"Rp {payroll_df['overtime_cost'].sum():,.0f}")
+                col_pay3.metric("💰 Total Payroll", f"Rp {payroll_df['total_cost'].sum():,.0f}")
+                
+                st.markdown("#### 📥 Export Laporan")
+                render_export_panel("absensi_export", stats_df, f"laporan_absensi_{start_date}_{end_date}")
+            else:
+                st.info("Tidak ada data dalam rentang tanggal tersebut")
+        else:
+            st.info("📝 Belum ada data absensi")
+    
+        # Kalender libur payroll (frozen dates otomatis ikut dihitung libur)
+        with st.expander("📅 Kalender Hari Libur Payroll"):
+            holidays = st.session_state["holidays"]
+            holidays_df = pd.DataFrame(holidays, columns=["date", "name"])
+            holidays_df["date"] = pd.to_datetime(holidays_df["date"], errors="coerce").dt.date
+            edited_holidays = st.data_editor(
+                holidays_df,
+                column_config={
+                    "date": st.column_config.DateColumn("Tanggal", required=True),
+                    "name": st.column_config.TextColumn("Keterangan")
+                },
+                num_rows="dynamic",
+                hide_index=True,
+                use_container_width=True,
+                key="holidays_editor"
+            )
+            if st.button("💾 Simpan Hari Libur", use_container_width=True, key="save_holidays_btn"):
+                edited_holidays = edited_holidays.dropna(subset=["date"]).drop_duplicates("date").sort_values("date")
+                new_holidays = [
+                    {"date": str(row.date), "name": row.name if isinstance(row.name, str) else ""}
+                    for row in edited_holidays.itertuples()
+                ]
+                st.session_state["holidays"] = new_holidays
+                if save_holidays(new_holidays):
+                    st.success(f"✅ {len(new_holidays)} hari libur tersimpan!")
+                    st.rerun()
+    
+    # ===== TAB IMPORT MESIN ABSEN =====
+    with tab4:
+        st.markdown("### ⏱️ Import Log Mesin Absen (Fingerprint)")
+        st.caption("Upload export CSV mesin fingerprint. Scan pertama per hari = jam masuk, scan terakhir = jam pulang.")
+        
+        col_imp1, col_imp2 = st.columns([3, 1])
+        with col_imp1:
+            punch_file = st.file_uploader("File CSV Punch Log", type=["csv", "txt"], key="punch_upload")
+        with col_imp2:
+            punch_dayfirst = st.checkbox("Tanggal DD/MM/YYYY", value=True, key="punch_dayfirst")
+        
+        if punch_file is not None:
+            read_status = st.empty()
+            try:
+                daily_punches, punch_stats = read_punch_log(
+                    punch_file, workers, dayfirst=punch_dayfirst,
+                    on_chunk=lambda rows: read_status.caption(f"📥 {rows:,} baris dibaca...")
+                )
+            except ValueError as e:
+                st.error(f"❌ {e}")
+            else:
+                import_diff, import_days = build_import_plan(daily_punches, workers, attendance_list)
+                action_counts = import_diff["action"].value_counts()
+                read_status.caption(f"📥 {punch_stats['rows']:,} baris dibaca → {len(import_diff):,} record harian")
+                
+                col_m1, col_m2, col_m3, col_m4, col_m5 = st.columns(5)
+                col_m1.metric("🆕 Baru", int(action_counts.get("Baru", 0)))
+                col_m2.metric("✏️ Update", int(action_counts.get("Update", 0)))
+                col_m3.metric("✅ Sama", int(action_counts.get("Sama", 0)))
+                col_m4.metric("❌ Error", int(action_counts.get("Error", 0)))
+                col_m5.metric("⚠️ Tidak Dikenal", int(punch_stats["unmatched"].sum()) + punch_stats["bad_time"])
+                
+                if len(punch_stats["unmatched"]) > 0:
+                    with st.expander(f"⚠️ {len(punch_stats['unmatched'])} ID/nama tidak cocok dengan data pekerja"):
+                        st.dataframe(
+                            punch_stats["unmatched"].rename_axis("ID / Nama").reset_index(name="Jumlah Scan"),
+                            use_container_width=True, hide_index=True
+                        )
+                if punch_stats["bad_time"] > 0:
+                    st.warning(f"⚠️ {punch_stats['bad_time']} baris dengan waktu scan tidak valid dilewati")
+                
+                # Dry-run diff
+                st.markdown("#### 🔍 Preview Perubahan (Dry Run)")
+                show_unchanged = st.checkbox("Tampilkan record yang tidak berubah", value=False, key="punch_show_same")
+                diff_view = import_diff if show_unchanged else import_diff[import_diff["action"] != "Sama"]
+                diff_view = diff_view[[
+                    "action", "date", "name", "status_lama", "check_in_lama", "check_in",
+                    "check_out_lama", "check_out", "overtime_hours", "error"
+                ]].sort_values(["date", "name"])
+                diff_view.columns = [
+                    "Aksi", "Tanggal", "Nama", "Status Lama", "Masuk Lama", "Masuk Baru",
+                    "Pulang Lama", "Pulang Baru", "Overtime (jam)", "Error"
+                ]
+                st.dataframe(diff_view, use_container_width=True, hide_index=True, height=350)
+                
+                apply_count = int(action_counts.get("Baru", 0) + action_counts.get("Update", 0))
+                if st.button(f"📥 IMPORT {apply_count} RECORD ({len(import_days)} hari)", use_container_width=True, type="primary", disabled=apply_count == 0, key="punch_import_btn"):
+                    if upsert_attendance_days(import_days):
+                        st.success(f"✅ {apply_count} record absensi dari {len(import_days)} hari berhasil diimport!")
+                        st.rerun()
+                    else:
+                        st.error("❌ Gagal menyimpan data! Silakan coba lagi.")
@@ -0,0 +1,96 @@
+import streamlit as st
+import pandas as pd
+import datetime
+import plotly.express as px
+
+from ppic_charts import get_cached_figure
+from ppic_export import render_export_panel
+
+
+# ===== MENU: ANALYTICS =====
+def render():
+    st.header("📈 ANALISIS & LAPORAN")
+    
+    df = st.session_state["data_produksi"]
+    
+    if not df.empty:
+        # Ensure Due Date is datetime for comparisons
+        df_analysis = df.copy()
+        df_analysis['Due Date'] = pd.to_datetime(df_analysis['Due Date'])
+        
+        tab1, tab2, tab3 = st.tabs(["📊 Overview", "👥 By Buyer", "📦 By Product"])
+        
+        with tab1:
+            st.subheader("Performance Overview")
+            col1, col2, col3, col4 = st.columns(4)
+            
+            total_qty = df_analysis["Qty"].sum()
+            # Convert today to Timestamp for comparison
+            today_ts = pd.Timestamp(datetime.date.today())
+            on_time_orders = len(df_analysis[df_analysis["Due Date"] >= today_ts])
+            completion_rate = (df_analysis["Progress"].str.rstrip('%').astype('float').mean())
+            total_buyers = df_analysis["Buyer"].nunique()
+            
+            col1.metric("Total Quantity", f"{total_qty:,} pcs")
+            col2.metric("On-Time Orders", on_time_orders)
+            col3.metric("Avg Completion", f"{completion_rate:.1f}%")
+            col4.metric("Total Buyers", total_buyers)
+            
+            st.markdown("---")
+            
+            col_chart1, col_chart2 = st.columns(2)
+            
+            with col_chart1:
+                def build_priority_figure():
+                    priority_count = df_analysis["Prioritas"].value_counts()
+                    return px.bar(x=priority_count.index, y=priority_count.values,
+                                  title="Orders by Priority")
+                
+                st.plotly_chart(get_cached_figure("analytics_priority", (), build_priority_figure), use_container_width=True)
+            
+            with col_chart2:
+                def build_stage_figure():
+                    stage_count = df_analysis["Proses Saat Ini"].value_counts()
+                    return px.pie(values=stage_count.values, names=stage_count.index,
+                                  title="Orders by Stage")
+                
+                st.plotly_chart(get_cached_figure("analytics_stage", (), build_stage_figure), use_container_width=True)
+        
+        with tab2:
+            st.subheader("Analysis by Buyer")
+            buyer_stats = df_analysis.groupby("Buyer").agg({
+                "Order ID": "count",
+                "Qty": "sum",
+                "Progress": lambda x: x.str.rstrip('%').astype('float').mean()
+            }).rename(columns={"Order ID": "Total Orders", "Qty": "Total Qty", "Progress": "Avg Progress"})
+            buyer_stats["Avg Progress"] = buyer_stats["Avg Progress"].round(1).astype(str) + "%"
+            
+            st.dataframe(buyer_stats, use_container_width=True)
+            
+            fig_buyer = get_cached_figure(
+                "analytics_buyer", (),
+                lambda: px.bar(buyer_stats, y="Total Orders", title="Total Orders per Buyer")
+            )
+            st.plotly_chart(fig_buyer, use_container_width=True)
+        
+        with tab3:
+            st.subheader("Analysis by Product")
+            product_stats = df_analysis.groupby("Produk").agg({
+                "Order ID": "count",
+                "Qty": "sum"
+            }).rename(columns={"Order ID": "Total Orders", "Qty": "Total Qty"})
+            product_stats = product_stats.sort_values("Total Orders", ascending=False).head(10)
+            
+            st.dataframe(product_stats, use_container_width=True)
+            
+            fig_product = get_cached_figure(
+                "analytics_product", (),
+                lambda: px.bar(product_stats, y="Total Qty", title="Top 10 Products by Quantity")
+            )
+            st.plotly_chart(fig_product, use_container_width=True)
+        
+        st.markdown("---")
+        st.subheader("💾 Export Laporan")
+        render_export_panel("analytics_export", df, f"ppic_report_{datetime.date.today()}", date_column="Order Date")
+    else:
+        st.info("📝 Belum ada data untuk dianalisis.")
@@ -0,0 +1,356 @@
+import streamlit as st
+import pandas as pd
+import datetime
+
+from ppic_config import CONTAINER_TYPES
+from ppic_data import save_containers
+
+
+@st.fragment
+def render_simulator(df):
+    """Container simulator panel; cart changes only rerun this fragment"""
+    st.info("💡 **Mode Simulasi**: Simulasi loading container berdasarkan packing size yang sudah diinput, tanpa menunggu produksi selesai.")
+    
+    # Container type selection
+    st.markdown("### 🚢 Select Container Type")
+    col_type1, col_type2, col_type3, col_type4 = st.columns(4)
+    
+    with col_type1:
+        container_type = st.selectbox(
+            "Container Type",
+            list(CONTAINER_TYPES.keys()),
+            index=list(CONTAINER_TYPES.keys()).index(st.session_state["selected_container_type"]),
+            key="container_type_select"
+        )
+        st.session_state["selected_container_type"] = container_type
+    
+    with col_type2:
+        selected_specs = CONTAINER_TYPES[container_type]
+        st.metric("Capacity", f"{selected_specs['capacity_cbm']} m³")
+    
+    with col_type3:
+        st.metric("Max Weight", f"{selected_specs['max_weight_kg']:,} kg")
+    
+    with col_type4:
+        st.markdown(f"<div style='background: {selected_specs['color']}; height: 40px; border-radius: 5px;'></div>", unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("### 📦 Available Orders for Simulation")
+        
+        # Filter options
+        col_filter1, col_filter2, col_filter3 = st.columns(3)
+        
+        with col_filter1:
+            filter_buyer = st.multiselect("Filter by Buyer", df["Buyer"].unique().tolist(), key="sim_buyer_filter")
+        
+        with col_filter2:
+            filter_product = st.multiselect("Filter by Product", df["Produk"].unique().tolist(), key="sim_product_filter")
+        
+        with col_filter3:
+            search_order = st.text_input("🔍 Search Order ID", key="sim_search")
+        
+        # Apply filters
+        df_filtered = df.copy()
+        if filter_buyer:
+            df_filtered = df_filtered[df_filtered["Buyer"].isin(filter_buyer)]
+        if filter_product:
+            df_filtered = df_filtered[df_filtered["Produk"].isin(filter_product)]
+        if search_order:
+            df_filtered = df_filtered[df_filtered["Order ID"].str.contains(search_order, case=False, na=False)]
+        
+        # Filter out orders with zero CBM
+        df_filtered = df_filtered[df_filtered["Total CBM"] > 0]
+        
+        st.info(f"📦 {len(df_filtered)} orders available for simulation")
+        
+        # Display available orders with better styling
+        if not df_filtered.empty:
+            # Sort by due date
+            df_filtered_sorted = df_filtered.sort_values("Due Date")
+            
+            for idx, order in df_filtered_sorted.iterrows():
+                # Check if already in cart
+                in_cart = order['Order ID'] in [item['Order ID'] for item in st.session_state["container_cart"]]
+                
+                # Order card - FIXED: Separate variables to avoid f-string issues
+                border_style = "border-color: #10B981; border-width: 2px;" if in_cart else ""
+                status_color = "#10B981" if in_cart else "#9CA3AF"
+                status_text = "✅ In Container" if in_cart else ""
+                
+                st.markdown(f"""
+                <div class="order-card" style="{border_style}">
+                    <strong style="color: #3B82F6; font-size: 1.1em;">{order['Order ID']}</strong>
+                    <span style="color: {status_color}; margin-left: 10px; font-size: 0.9em;">{status_text}</span>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                col_o1, col_o2, col_o3, col_o4 = st.columns([3, 1.5, 1.5, 1])
+                
+                with col_o1:
+                    st.caption(f"**{order['Buyer']}** | {order['Produk']}")
+                    st.caption(f"🏭 Progress: {order['Progress']} | 📅 Due: {order['Due Date']}")
+                
+                with col_o2:
+                    st.metric("Qty", f"{order['Qty']} pcs", label_visibility="collapsed")
+                    st.caption(f"Qty: {order['Qty']} pcs")
+                
+                with col_o3:
+                    cbm_value = order.get('Total CBM', 0)
+                    st.metric("CBM", f"{cbm_value:.4f}", label_visibility="collapsed")
+                    st.caption(f"CBM: {cbm_value:.6f} m³")
+                
+                with col_o4:
+                    if not in_cart:
+                        if st.button("➕ Add", key=f"add_sim_{order['Order ID']}", use_container_width=True, type="primary"):
+                            # Check if fits in container
+                            current_cbm = sum([item['Total CBM'] for item in st.session_state["container_cart"]])
+                            new_total = current_cbm + cbm_value
+                            
+                            if new_total <= selected_specs['capacity_cbm']:
+                                st.session_state["container_cart"].append({
+                                    "Order ID": order['Order ID'],
+                                    "Buyer": order['Buyer'],
+                                    "Produk": order['Produk'],
+                                    "Qty": order['Qty'],
+                                    "CBM per Pcs": order.get('CBM per Pcs', 0),
+                                    "Total CBM": cbm_value,
+                                    "Progress": order['Progress'],
+                                    "Due Date": str(order['Due Date'])
+                                })
+                                st.success("✅ Added!")
+                                st.rerun(scope="fragment")
+                            else:
+                                st.error(f"❌ Exceeds capacity! ({new_total:.3f} > {selected_specs['capacity_cbm']} m³)")
+                    else:
+                        st.button("✓ Added", key=f"added_sim_{order['Order ID']}", disabled=True, use_container_width=True)
+                
+                st.markdown("<div style='margin: 5px 0; border-bottom: 1px solid #374151;'></div>", unsafe_allow_html=True)
+        else:
+            st.warning("No orders available with packing data. Please add packing size information to orders.")
+    
+    with col2:
+        st.markdown(f"### 🚢 {container_type}")
+        
+        # Calculate current load
+        current_items = st.session_state["container_cart"]
+        total_cbm_loaded = sum([item['Total CBM'] for item in current_items])
+        total_qty_loaded = sum([item['Qty'] for item in current_items])
+        percentage_loaded = (total_cbm_loaded / selected_specs['capacity_cbm']) * 100
+        
+        # Visual representation
+        color = selected_specs['color']
+        st.markdown(f"""
+        <div class="container-visual" style="border-color: {color};">
+            <h4 style='color: white; margin-bottom: 15px;'>Container Load Status</h4>
+            <p style='color: #D1D5DB; margin: 5px 0;'>Type: <strong>{container_type}</strong></p>
+            <p style='color: #D1D5DB; margin: 5px 0;'>Capacity: {selected_specs['capacity_cbm']} m³</p>
+            <div class="container-progress" style="margin: 15px 0;">
+                <div class="container-fill" style="width: {min(percentage_loaded, 100):.1f}%; background: {color};"></div>
+            </div>
+            <div style='text-align: center; margin: 15px 0;'>
+                <h2 style='color: white; margin: 5px 0;'>{total_cbm_loaded:.6f} m³</h2>
+                <p style='color: #10B981; font-size: 1.2em; margin: 5px 0;'>{percentage_loaded:.1f}% Full</p>
+                <p style='color: #60A5FA; margin: 5px 0;'>Available: {selected_specs['capacity_cbm'] - total_cbm_loaded:.6f} m³</p>
+                <p style='color: #F59E0B; margin: 5px 0;'>Total Qty: {total_qty_loaded:,} pcs</p>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Items in container
+        if current_items:
+            st.markdown("#### 📦 Items in Container:")
+            
+            for idx, item in enumerate(current_items):
+                st.markdown(f"""
+                <div style='background-color: #1F2937; padding: 10px; margin: 8px 0; border-radius: 5px; border-left: 3px solid {color};'>
+                    <strong style='color: #60A5FA;'>{item['Order ID']}</strong><br>
+                    <span style='color: #D1D5DB; font-size: 0.9em;'>{item['Buyer']}</span><br>
+                    <span style='color: #9CA3AF; font-size: 0.85em;'>{item['Produk']}</span><br>
+                    <div style='margin-top: 5px;'>
+                        <span style='color: #10B981;'>📦 {item['Qty']} pcs</span> | 
+                        <span style='color: #F59E0B;'>📏 {item['Total CBM']:.6f} m³</span>
+                    </div>
+                    <span style='color: #6B7280; font-size: 0.8em;'>Progress: {item['Progress']}</span>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                if st.button("🗑️ Remove", key=f"remove_sim_{idx}", use_container_width=True):
+                    st.session_state["container_cart"].pop(idx)
+                    st.rerun(scope="fragment")
+            
+            st.markdown("---")
+            
+            # Container name input
+            container_name = st.text_input("Container Name (Optional)", 
+                                          placeholder=f"CONT-{datetime.datetime.now().strftime('%Y%m%d')}",
+                                          key="container_name_input")
+            
+            container_notes = st.text_area("Notes", 
+                                          placeholder="Add any notes about this container load...",
+                                          height=80,
+                                          key="container_notes")
+            
+            col_btn1, col_btn2 = st.columns(2)
+            
+            with col_btn1:
+                if st.button("💾 Save Simulation", use_container_width=True, type="primary"):
+                    # Generate container ID
+                    if container_name:
+                        cont_id = container_name
+                    else:
+                        cont_id = f"CONT-{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
+                    
+                    # Save container data
+                    container_data = {
+                        "container_id": cont_id,
+                        "date": str(datetime.date.today()),
+                        "type": container_type,
+                        "capacity": selected_specs['capacity_cbm'],
+                        "loaded_cbm": total_cbm_loaded,
+                        "percentage": percentage_loaded,
+                        "total_qty": total_qty_loaded,
+                        "items": current_items.copy(),
+                        "notes": container_notes if container_notes else "",
+                        "simulation_mode": True
+                    }
+                    
+                    containers = st.session_state["containers"]
+                    containers.append(container_data)
+                    st.session_state["containers"] = containers
+                    
+                    if save_containers(containers):
+                        st.success(f"✅ Container simulation '{cont_id}' saved successfully!")
+                        st.balloons()
+                        st.session_state["container_cart"] = []
+                        st.rerun()
+            
+            with col_btn2:
+                if st.button("🗑️ Clear All", use_container_width=True, type="secondary"):
+                    st.session_state["container_cart"] = []
+                    st.rerun(scope="fragment")
+        else:
+            st.info("📦 Container is empty\n\nAdd orders from the left panel to start simulation.")
+
+
+# ===== MENU: CONTAINER LOADING =====
+def render():
+    st.header("🚢 CONTAINER LOADING SIMULATION")
+    
+    df = st.session_state["data_produksi"]
+    
+    # Add CSS for order cards
+    st.markdown("""
+    <style>
+    .order-card {
+        background: #1F2937;
+        border: 1px solid #374151;
+        border-radius: 8px;
+        padding: 12px;
+        margin: 8px 0;
+        transition: all 0.2s ease;
+    }
+    
+    .order-card:hover {
+        border-color: #3B82F6;
+        box-shadow: 0 4px 6px rgba(59, 130, 246, 0.2);
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    if not df.empty:
+        tab1, tab2 = st.tabs(["📦 Container Simulator", "📋 Container History"])
+        
+        with tab1:
+            render_simulator(df)
+        
+        with tab2:
+            st.markdown("### 📋 Container Loading History")
+            
+            containers = st.session_state["containers"]
+            
+            if containers:
+                # Add filter
+                col_hist1, col_hist2 = st.columns(2)
+                with col_hist1:
+                    filter_type = st.multiselect("Filter by Container Type", 
+                                                list(CONTAINER_TYPES.keys()),
+                                                key="hist_type_filter")
+                with col_hist2:
+                    search_hist = st.text_input("🔍 Search Container ID", key="hist_search")
+                
+                # Apply filters
+                filtered_containers = containers
+                if filter_type:
+                    filtered_containers = [c for c in filtered_containers if c['type'] in filter_type]
+                if search_hist:
+                    filtered_containers = [c for c in filtered_containers if search_hist.lower() in c['container_id'].lower()]
+                
+                st.info(f"📦 Showing {len(filtered_containers)} of {len(containers)} container simulations")
+                
+                for idx, container in enumerate(reversed(filtered_containers)):
+                    is_simulation = container.get('simulation_mode', False)
+                    
+                    with st.expander(
+                        f"🚢 {container['container_id']} - {container['date']} {'📝 (Simulation)' if is_simulation else ''}",
+                        expanded=False
+                    ):
+                        col_c1, col_c2, col_c3, col_c4 = st.columns(4)
+                        
+                        with col_c1:
+                            st.metric("Type", container['type'])
+                        with col_c2:
+                            st.metric("Loaded", f"{container['loaded_cbm']:.6f} m³")
+                        with col_c3:
+                            st.metric("Utilization", f"{container['percentage']:.1f}%")
+                        with col_c4:
+                            st.metric("Total Qty", f"{container.get('total_qty', 0):,} pcs")
+                        
+                        if container.get('notes'):
+                            st.markdown(f"**📝 Notes:** {container['notes']}")
+                        
+                        st.markdown("#### Items in Container:")
+                        
+                        # Create summary table
+                        items_df = pd.DataFrame(container['items'])
+                        if not items_df.empty:
+                            display_df = items_df[['Order ID', 'Buyer', 'Produk', 'Qty', 'Total CBM']]
+                            display_df['Total CBM'] = display_df['Total CBM'].apply(lambda x: f"{x:.6f} m³")
+                            display_df['Qty'] = display_df['Qty'].apply(lambda x: f"{x:,} pcs")
+                            
+                            st.dataframe(display_df, use_container_width=True, hide_index=True)
+                            
+                            # Summary statistics
+                            st.markdown("---")
+                            col_sum1, col_sum2, col_sum3 = st.columns(3)
+                            with col_sum1:
+                                st.metric("Total Orders", len(container['items']))
+                            with col_sum2:
+                                unique_buyers = items_df['Buyer'].nunique()
+                                st.metric("Unique Buyers", unique_buyers)
+                            with col_sum3:
+                                unique_products = items_df['Produk'].nunique()
+                                st.metric("Unique Products", unique_products)
+                        
+                        # Delete button
+                        if st.button("🗑️ Delete Container", key=f"del_cont_{idx}_{container['container_id']}", type="secondary"):
+                            if st.session_state.get(f"confirm_del_cont_{idx}", False):
+                                # Find original index in full list
+                                original_idx = len(containers) - 1 - idx
+                                containers.pop(original_idx)
+                                st.session_state["containers"] = containers
+                                if save_containers(containers):
+                                    st.success("✅ Container deleted!")
+                                    del st.session_state[f"confirm_del_cont_{idx}"]
+                                    st.rerun()
+                            else:
+                                st.session_state[f"confirm_del_cont_{idx}"] = True
+                                st.warning("⚠️ Click again to confirm deletion!")
+                                st.rerun()
+            else:
+                st.info("📝 No container simulations saved yet. Create your first simulation in the 'Container Simulator' tab!")
+    else:
+        st.info("📝 No orders available. Please create orders first in 'Input Pesanan Baru'.")
@@ -0,0 +1,464 @@
+import streamlit as st
+import datetime
+import json
+import plotly.express as px
+
+from ppic_config import TOTAL_STORAGE_AREA_M2, STORAGE_ZONES
+from ppic_data import (
+    get_tracking_status_from_progress, calculate_production_metrics, get_frozen_date_range,
+    get_tracking_stages
+)
+from ppic_payroll import calculate_monthly_overtime_metrics
+from ppic_planning import (
+    calculate_storage_snapshot, get_storage_ledger, record_storage_snapshot,
+    calculate_zone_usage, STORAGE_TREND_RANGES, get_storage_snapshots, forecast_storage_area,
+    STORAGE_FORECAST_DAYS, get_headcount_factor, LOAD_HORIZON_OPTIONS, project_stage_load,
+    get_calendar_month_data
+)
+from ppic_inventory import get_inventory_balances
+from ppic_charts import get_cached_figure, build_storage_trend_figure, build_stage_load_figure
+
+
+# ===== MENU: DASHBOARD =====
+def render():
+    st.title("📊 Dashboard PT JAVA CONNECTION")
+    
+    df = st.session_state["data_produksi"]
+    
+    if not df.empty:
+        df['Tracking Status'] = df.apply(lambda row: get_tracking_status_from_progress(row['Progress']), axis=1)
+        
+        # ===== TOP METRICS ROW =====
+        st.markdown("### 📈 Key Metrics")
+        col_m1, col_m2, col_m3, col_m4 = st.columns(4)
+
+        total_orders = len(df)
+        ongoing = len(df[df["Tracking Status"] == "On Going"])
+        done = len(df[df["Tracking Status"] == "Done"])
+        total_qty = df["Qty"].sum()
+
+        col_m1.metric("📦 Total Orders", total_orders)
+        col_m2.metric("🔄 On Going", ongoing)
+        col_m3.metric("✅ Done", done)
+        col_m4.metric("📊 Total Qty", f"{total_qty:,}")
+
+        # Saldo material (materialised di ledger inventory, tanpa scan riwayat)
+        balances = get_inventory_balances()
+        if not balances.empty:
+            col_i1, col_i2, col_i3, col_i4 = st.columns(4)
+            col_i1.metric("🧱 Material", len(balances))
+            col_i2.metric("⚠️ Stok Kurang", int((balances["available"] < 0).sum()))
+            col_i3.metric("🔒 Reserved untuk Order", int((balances["reserved"] > 0).sum()))
+            col_i4.metric("🚚 On Order", int((balances["on_order"] > 0).sum()))
+
+        st.markdown("---")
+
+        # ===== PRODUCTION OVERVIEW - SIMPLE CARDS =====
+        st.markdown("### 📦 Production Overview")
+
+        # Calculate all metrics
+        wip_qty, wip_cbm, finished_qty, finished_cbm, shipping_qty, shipping_cbm = calculate_production_metrics(df)
+        storage_snapshot = calculate_storage_snapshot(df)
+        storage_used_m2 = sum(data["area"] for data in storage_snapshot.values())
+        storage_percentage = (storage_used_m2 / TOTAL_STORAGE_AREA_M2) * 100
+        storage_available = TOTAL_STORAGE_AREA_M2 - storage_used_m2
+
+        # Calculate floor areas
+        wip_stages = ["Warehouse", "Fitting 1", "Amplas", "Revisi 1", "Spray", "Fitting 2", "Revisi Fitting 2"]
+        wip_floor = sum(storage_snapshot[stage]["area"] for stage in wip_stages)
+        finished_floor = storage_snapshot["Packaging"]["area"]
+        if not get_storage_ledger():
+            record_storage_snapshot(df)
+
+        # Storage status color
+        if storage_percentage > 90:
+            bar_color = "#EF4444"
+            status_text = "CRITICAL"
+            status_icon = "⚠️"
+        elif storage_percentage > 70:
+            bar_color = "#F59E0B"
+            status_text = "HIGH"
+            status_icon = "⚡"
+        else:
+            bar_color = "#3B82F6"
+            status_text = "NORMAL"
+            status_icon = "✅"
+
+        # Simple 3-column layout
+        col1, col2, col3 = st.columns(3)
+
+        # Storage Card
+        with col1:
+            with st.container():
+                st.markdown(f"#### 📦 Storage Capacity")
+                st.markdown(f"**Status:** {status_icon} {status_text}")
+                st.progress(storage_percentage / 100)
+                st.metric("Usage", f"{storage_percentage:.1f}%")
+                
+                subcol1, subcol2, subcol3 = st.columns(3)
+                subcol1.metric("Used", f"{storage_used_m2:.1f} m²")
+                subcol2.metric("Available", f"{storage_available:.1f} m²")
+                subcol3.metric("Total", f"{TOTAL_STORAGE_AREA_M2:.0f} m²")
+
+        # WIP Card
+        with col2:
+            with st.container():
+                st.markdown("#### 🏭 Work in Progress")
+                st.metric("Quantity", f"{wip_qty:,} pcs", label_visibility="collapsed")
+                st.markdown(f"**Quantity:** {wip_qty:,} pcs")
+                st.caption(f"📦 Volume: {wip_cbm:.4f} m³")
+                st.caption(f"📐 Floor: {wip_floor:.2f} m²")
+
+        # Finished Card
+        with col3:
+            with st.container():
+                st.markdown("#### ✅ Finished Goods")
+                st.metric("Quantity", f"{finished_qty:,} pcs", label_visibility="collapsed")
+                st.markdown(f"**Quantity:** {finished_qty:,} pcs")
+                st.caption(f"📦 Volume: {finished_cbm:.4f} m³")
+                st.caption(f"📐 Floor: {finished_floor:.2f} m²")
+
+        # Storage per zone
+        zone_cols = st.columns(len(STORAGE_ZONES))
+        for zone_col, (zone, zone_usage) in zip(zone_cols, calculate_zone_usage(storage_snapshot).items()):
+            zone_pct = zone_usage["used"] / zone_usage["area"] * 100 if zone_usage["area"] > 0 else 0
+            zone_col.metric(f"📍 {zone}", f"{zone_usage['used']:.1f} / {zone_usage['area']:.0f} m²", f"{zone_pct:.0f}%", delta_color="off")
+            zone_col.progress(min(zone_pct, 100) / 100)
+
+        # ===== STORAGE TREND & FORECAST =====
+        if st.toggle("📈 Tren & Forecast Storage", key="show_storage_trend"):
+            col_range, col_forecast = st.columns([1, 3])
+            with col_range:
+                trend_range = st.selectbox("Rentang", list(STORAGE_TREND_RANGES.keys()), index=1, key="storage_trend_range")
+            
+            now = datetime.datetime.now()
+            start_ts = (now - datetime.timedelta(days=STORAGE_TREND_RANGES[trend_range])).strftime("%Y-%m-%d %H:%M:%S")
+            snapshots = get_storage_snapshots(start_ts, now.strftime("%Y-%m-%d %H:%M:%S"))
+            forecast_dates, forecast_area, saturation_date = forecast_storage_area(df)
+            
+            with col_forecast:
+                col_f1, col_f2 = st.columns(2)
+                col_f1.metric(f"Forecast {STORAGE_FORECAST_DAYS} Hari", f"{forecast_area[-1]:.1f} m²",
+                              delta=f"{forecast_area[-1] - storage_used_m2:+.1f} m²", delta_color="inverse")
+                if saturation_date:
+                    col_f2.metric("⚠️ Storage Penuh", saturation_date.strftime('%d %b %Y'))
+                else:
+                    col_f2.metric("Storage Penuh", f"> {STORAGE_FORECAST_DAYS} hari")
+            
+            trend_params = (trend_range, datetime.date.today(), tuple(get_frozen_date_range()), get_headcount_factor())
+            st.plotly_chart(
+                get_cached_figure("storage_trend", trend_params,
+                                  lambda: build_storage_trend_figure(snapshots, forecast_dates, forecast_area, start_ts)),
+                use_container_width=True
+            )
+            st.caption("Forecast memakai rencana produksi: barang masuk storage saat Warehouse dimulai dan keluar setelah Packaging selesai.")
+
+        st.markdown("---")
+
+        # ===== WORKSTATION LOAD =====
+        st.markdown("### 🏭 Workstation Load")
+
+        col_horizon, col_load_info = st.columns([1, 3])
+        with col_horizon:
+            load_horizon = st.selectbox("Horizon (hari kerja)", LOAD_HORIZON_OPTIONS, index=1, key="load_horizon")
+
+        load_stages, load_dates, stage_load, stage_capacity = project_stage_load(df, load_horizon)
+        overloaded = stage_load > stage_capacity[:, None]
+
+        with col_load_info:
+            col_l1, col_l2, col_l3 = st.columns(3)
+            col_l1.metric("Overloaded Cells", int(overloaded.sum()))
+            col_l2.metric("Days Overloaded", int(overloaded.any(axis=0).sum()))
+            if overloaded.any():
+                worst_stage = load_stages[int(overloaded.sum(axis=1).argmax())]
+                col_l3.metric("Bottleneck", worst_stage)
+            else:
+                col_l3.metric("Bottleneck", "-")
+
+        load_params = (load_horizon, tuple(get_frozen_date_range()), datetime.date.today(), get_headcount_factor())
+        st.plotly_chart(
+            get_cached_figure("stage_load", load_params, lambda: build_stage_load_figure(load_stages, load_dates, stage_load, stage_capacity)),
+            use_container_width=True
+        )
+        st.caption("Sisa qty tiap order dibagi rata ke sisa tahap antara hari ini dan Due Date. ⚠️ = load melebihi kapasitas workstation.")
+
+        st.markdown("---")
+
+        # ===== OVERTIME ANALYTICS - SIMPLE LAYOUT =====
+        st.markdown("### ⏰ Overtime Analytics")
+
+        attendance_list = st.session_state.get("attendance", [])
+        today = datetime.date.today()
+
+        col_month, col_info = st.columns([1, 3])
+        with col_month:
+            months = ["Januari", "Februari", "Maret", "April", "Mei", "Juni",
+                     "Juli", "Agustus", "September", "Oktober", "November", "Desember"]
+            selected_month_idx = st.selectbox(
+                "📅 Bulan",
+                range(1, 13),
+                index=today.month - 1,
+                format_func=lambda x: f"{months[x-1]} {today.year}",
+                key="dashboard_overtime_month"
+            )
+
+        ot_metrics = calculate_monthly_overtime_metrics(attendance_list, today.year, selected_month_idx)
+
+        with col_info:
+            workers_count = ot_metrics['total_workers']
+            ot_workers = ot_metrics['workers_with_overtime']
+
+        # Simple 5-column metrics
+        col1, col2, col3, col4, col5 = st.columns(5)
+
+        with col1:
+            st.metric(
+                "Total Overtime",
+                f"{ot_metrics['total_overtime_hours']:.1f} jam",
+                delta=None if ot_metrics['total_overtime_hours'] == 0 else f"⚠️ Active"
+            )
+            st.caption(f"{months[selected_month_idx-1]}")
+
+        with col2:
+            avg_ot = ot_metrics['total_overtime_hours'] / max(ot_metrics['total_workers'], 1)
+            st.metric("Avg OT/Worker", f"{avg_ot:.1f} jam")
+            st.caption("per pekerja")
+
+        with col3:
+            st.metric("Avg OT Rate", f"{ot_metrics['avg_overtime_rate']:.1f}%")
+            st.caption("dari jam kerja")
+
+        with col4:
+            st.metric("Total Cost", f"Rp {ot_metrics['total_overtime_cost']:,.0f}")
+            st.caption("tarif per pekerja")
+
+        with col5:
+            st.metric("Cost Increase", f"+{ot_metrics['cost_increase_pct']:.1f}%")
+            st.caption("vs regular cost")
+
+        st.markdown("---")
+
+        # ===== RECENT ORDERS =====
+        st.markdown("### 🕒 Recent Orders")
+        
+        col_filter1, col_filter2 = st.columns([2, 1])
+        with col_filter1:
+            buyers_list = ["-- All Buyers --"] + sorted(df["Buyer"].unique().tolist())
+            selected_buyer_filter = st.selectbox("Filter by Buyer", buyers_list, key="recent_buyer_filter")
+        with col_filter2:
+            search_recent = st.text_input("🔍 Search", key="search_recent_orders", placeholder="Order ID/Product")
+        
+        if selected_buyer_filter and selected_buyer_filter != "-- All Buyers --":
+            recent_df = df[df["Buyer"] == selected_buyer_filter].sort_values("Order Date", ascending=False)
+        else:
+            recent_df = df.sort_values("Order Date", ascending=False)
+        
+        if search_recent:
+            recent_df = recent_df[
+                recent_df["Order ID"].str.contains(search_recent, case=False, na=False) | 
+                recent_df["Produk"].str.contains(search_recent, case=False, na=False)
+            ]
+        
+        st.caption(f"📊 Showing {len(recent_df)} orders")
+        
+        for idx, row in recent_df.head(10).iterrows():
+            col1, col2, col3, col4 = st.columns([2.5, 2, 1, 0.5])
+            
+            with col1:
+                st.markdown(f"**{row['Order ID']}**")
+                st.caption(f"{row['Buyer']} | {row['Produk']}")
+            
+            with col2:
+                st.caption(f"Order: {row['Order Date']}")
+                st.caption(f"Due: {row['Due Date']}")
+            
+            with col3:
+                progress_val = int(row['Progress'].rstrip('%'))
+                st.progress(progress_val / 100)
+                st.caption(f"{row['Progress']}")
+            
+            with col4:
+                if row['Tracking Status'] == 'Done':
+                    st.success("✅")
+                else:
+                    st.info("🔄")
+            
+            st.divider()
+        
+        st.markdown("---")
+        
+        # ===== PRODUCTION CALENDAR =====
+        col_cal, col_chart = st.columns([2, 1])
+        
+        with col_cal:
+            st.markdown("### 📅 Production Calendar")
+            
+            today = datetime.date.today()
+            current_month = today.month
+            current_year = today.year
+            
+            col_month, col_year = st.columns(2)
+            with col_month:
+                months = ["Januari", "Februari", "Maret", "April", "Mei", "Juni", 
+                         "Juli", "Agustus", "September", "Oktober", "November", "Desember"]
+                selected_month = st.selectbox("Bulan", months, index=current_month - 1, key="cal_month")
+                month_num = months.index(selected_month) + 1
+            
+            with col_year:
+                years = list(range(current_year - 1, current_year + 3))
+                selected_year = st.selectbox("Tahun", years, index=1, key="cal_year")
+            
+            # Orders grouped per due date for the selected month (cached per data version)
+            month_data = get_calendar_month_data(df, selected_year, month_num)
+            month_order_count = sum(len(day_data["orders"]) for day_data in month_data.values())
+            
+            if month_data:
+                st.markdown(f"**📌 {month_order_count} orders di bulan ini**")
+            
+            # Create calendar view
+            import calendar
+            cal = calendar.monthcalendar(selected_year, month_num)
+            
+            days = ["Sen", "Sel", "Rab", "Kam", "Jum", "Sab", "Min"]
+            header_cols = st.columns(7)
+            for i, day in enumerate(days):
+                header_cols[i].markdown(f"<center><b>{day}</b></center>", unsafe_allow_html=True)
+            
+            for week in cal:
+                week_cols = st.columns(7)
+                for i, day in enumerate(week):
+                    if day == 0:
+                        week_cols[i].markdown("")
+                    else:
+                        date_obj = datetime.date(selected_year, month_num, day)
+                        day_data = month_data.get(date_obj)
+                        
+                        if day_data:
+                            order_count = len(day_data["orders"])
+                            done_count = day_data["done"]
+                            ongoing_count = day_data["ongoing"]
+                            tooltip_text = day_data["tooltip"]
+                            
+                            if done_count == order_count:
+                                bg_color = "#10B981"
+                                status_label = "All Done"
+                            elif date_obj < today:
+                                bg_color = "#EF4444"
+                                status_label = "Overdue"
+                            elif date_obj == today:
+                                bg_color = "#F59E0B"
+                                status_label = "Due Today"
+                            else:
+                                bg_color = "#3B82F6"
+                                status_label = "Upcoming"
+                            
+                            week_cols[i].markdown(f"""
+                            <div style='background-color: {bg_color}; padding: 5px; border-radius: 5px; text-align: center; cursor: pointer;' 
+                                 title="{status_label}&#10;{order_count} orders&#10;Done: {done_count} | Ongoing: {ongoing_count}&#10;&#10;{tooltip_text}">
+                                <b style='color: white;'>{day}</b><br>
+                                <span style='color: white; font-size: 10px;'>{order_count}</span>
+                            </div>
+                            """, unsafe_allow_html=True)
+                        elif date_obj == today:
+                            week_cols[i].markdown(f"<div style='padding: 5px; text-align: center; border: 2px solid #3B82F6; border-radius: 5px;' title='Today'><b>{day}</b></div>", unsafe_allow_html=True)
+                        else:
+                            week_cols[i].markdown(f"<div style='padding: 5px; text-align: center;'>{day}</div>", unsafe_allow_html=True)
+        
+            # Calendar Legend
+            st.markdown("---")
+            st.markdown("**📖 Calendar Legend:**")
+            col_leg1, col_leg2, col_leg3, col_leg4 = st.columns(4)
+            col_leg1.markdown("🟢 **All Done** - All orders completed")
+            col_leg2.markdown("🔴 **Overdue** - Past due date")
+            col_leg3.markdown("🟠 **Due Today** - Due today")
+            col_leg4.markdown("🔵 **Upcoming** - Future orders")
+            
+            # Expandable details for each date with orders
+            if month_data:
+                st.markdown("---")
+                st.markdown("**📋 Orders Details by Date:**")
+                
+                for date_obj, day_data in month_data.items():
+                    orders_on_date = day_data["orders"]
+                    done_count = day_data["done"]
+                    ongoing_count = day_data["ongoing"]
+                    
+                    # Date status icon
+                    if done_count == len(orders_on_date):
+                        date_icon = "🟢"
+                    elif date_obj < today:
+                        date_icon = "🔴"
+                    elif date_obj == today:
+                        date_icon = "🟠"
+                    else:
+                        date_icon = "🔵"
+                    
+                    with st.expander(f"{date_icon} **{date_obj.strftime('%d %B %Y')}** - {len(orders_on_date)} orders (✅ {done_count} | 🔄 {ongoing_count})"):
+                        for order in orders_on_date:
+                            status_icon = "✅" if order['Tracking Status'] == 'Done' else "🔄"
+                            progress_val = int(order['Progress'].rstrip('%'))
+                            
+                            col_ord1, col_ord2 = st.columns([3, 1])
+                            with col_ord1:
+                                st.markdown(f"{status_icon} **{order['Order ID']}** - {order['Buyer']}")
+                                st.caption(f"📦 {order['Produk']} | Qty: {order['Qty']} pcs")
+                            with col_ord2:
+                                st.progress(progress_val / 100)
+                                st.caption(f"{order['Progress']}")
+                            st.divider()
+        
+        with col_chart:
+            st.markdown("### 📊 Status Distribution")
+            
+            def build_status_figure():
+                status_dist = df["Tracking Status"].value_counts()
+                fig_status = px.pie(
+                    values=status_dist.values, 
+                    names=status_dist.index,
+                    color_discrete_map={"On Going": "#3B82F6", "Done": "#10B981"},
+                    hole=0.4
+                )
+                fig_status.update_traces(textposition='inside', textinfo='percent+label')
+                fig_status.update_layout(showlegend=True, height=250, margin=dict(t=0, b=0, l=0, r=0))
+                return fig_status
+            
+            st.plotly_chart(get_cached_figure("dashboard_status", (), build_status_figure), use_container_width=True)
+        
+        st.markdown("---")
+        
+        # ===== PRODUCTION PROGRESS BY STAGE =====
+        st.markdown("### 🏭 Production Progress by Stage")
+        
+        def build_stages_figure():
+            stages = get_tracking_stages()
+            stage_data = {stage: 0 for stage in stages}
+            
+            for tracking_json in df["Tracking"]:
+                try:
+                    tracking_data = json.loads(tracking_json)
+                    for stage, data in tracking_data.items():
+                        qty = data.get("qty", 0)
+                        if stage in stage_data:
+                            stage_data[stage] += qty
+                except:
+                    pass
+            
+            fig_stages = px.bar(
+                x=list(stage_data.values()),
+                y=list(stage_data.keys()),
+                orientation='h',
+                color=list(stage_data.values()),
+                color_continuous_scale='Blues'
+            )
+            fig_stages.update_layout(
+                xaxis_title="Quantity (pcs)",
+                yaxis_title="",
+                showlegend=False,
+                height=300,
+                margin=dict(t=10, b=10)
+            )
+            return fig_stages
+        
+        st.plotly_chart(get_cached_figure("dashboard_stages", (), build_stages_figure), use_container_width=True)
+    else:
+        st.info("📝 Belum ada data. Silakan input pesanan baru.")
@@ -0,0 +1,316 @@
+import streamlit as st
+import pandas as pd
+import datetime
+
+from ppic_config import (
+    ROLE_PERMISSIONS_PATH, DEFAULT_DAILY_WAGE, DEFAULT_HOURLY_RATE, BOM_UNITS, SUPPLIER_DEFAULT_LEAD_DAYS
+)
+from ppic_auth import get_permission_audit, get_user_capabilities, get_role_display_name
+from ppic_images import show_image_thumbnail
+from ppic_mrp import BOM_COLUMNS, normalize_bom
+from ppic_inventory import sync_order_materials
+from ppic_data import (
+    save_buyers, save_products, save_product_image, save_suppliers, save_workers,
+    get_product_by_name, get_product_by_sku, next_product_sku, get_dataset
+)
+
+
+# ===== MENU: DATABASE - WITH WORKERS TAB =====
+def render():
+    st.header("💾 DATABASE MANAGEMENT")
+    
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["👥 Buyers", "📦 Products", "🏭 Suppliers", "👷 Pekerja Harian", "🔐 Hak Akses"])
+    
+    # ===== TAB: BUYERS =====
+    with tab1:
+        st.subheader("👥 Manage Buyers")
+        buyers = st.session_state["buyers"]
+        
+        if buyers:
+            for idx, buyer in enumerate(buyers):
+                with st.expander(f"👤 {buyer['name']}"):
+                    st.write(f"**Alamat:** {buyer.get('address', '-')}")
+                    st.write(f"**Contact:** {buyer.get('contact', '-')}")
+                    if st.button("🗑️ Hapus", key=f"del_buyer_{idx}"):
+                        buyers.pop(idx)
+                        st.session_state["buyers"] = buyers
+                        save_buyers(buyers)
+                        st.rerun()
+        
+        st.markdown("---")
+        st.markdown("### ➕ Add New Buyer")
+        with st.form("add_buyer_form", clear_on_submit=True):
+            new_name = st.text_input("Nama Buyer *")
+            new_address = st.text_area("Alamat", height=80)
+            new_contact = st.text_input("Contact")
+            
+            if st.form_submit_button("➕ Add Buyer", use_container_width=True, type="primary"):
+                if new_name:
+                    buyers.append({"name": new_name, "address": new_address, "contact": new_contact, "profile": ""})
+                    st.session_state["buyers"] = buyers
+                    save_buyers(buyers)
+                    st.success(f"✅ Buyer '{new_name}' ditambahkan!")
+                    st.rerun()
+    
+    # ===== TAB: PRODUCTS =====
+    with tab2:
+        st.subheader("📦 Manage Products")
+        products = st.session_state["products"]
+        
+        if products:
+            st.info(f"📦 {len(products)} products in database")
+            for idx, product in enumerate(products):
+                with st.expander(f"📦 {product.get('name', 'N/A')} ({product.get('sku', '-')})"):
+                    col_p1, col_p2, col_p3 = st.columns([2, 2, 1])
+                    with col_p1:
+                        st.write(f"**Material:** {product.get('material', '-')}")
+                        st.write(f"**Finishing:** {product.get('finishing', '-')}")
+                        st.write(f"**Product Size:** {product.get('product_size_p', 0)} x {product.get('product_size_l', 0)} x {product.get('product_size_t', 0)} cm")
+                    with col_p2:
+                        st.write(f"**Packing Size:** {product.get('packing_size_p', 0)} x {product.get('packing_size_l', 0)} x {product.get('packing_size_t', 0)} cm")
+                        st.write(f"**Max Stack:** {product.get('max_stack', 1)} unit")
+                        st.write(f"**CBM:** produk {product.get('product_cbm', 0):.6f} | packing {product.get('packing_cbm', 0):.6f} m³")
+                        if product.get("is_knockdown", False):
+                            st.write(f"**CBM per Set (KD):** {product.get('knockdown_set_cbm', 0):.6f} m³")
+                    with col_p3:
+                        show_image_thumbnail(product.get("image_path", ""), key=f"prod_{idx}", width=100)
+                        if st.button("🗑️ Delete", key=f"del_prod_{idx}"):
+                            products.pop(idx)
+                            st.session_state["products"] = products
+                            save_products(products)
+                            st.rerun()
+                    
+                    st.markdown("**🧾 Bill of Materials** (kebutuhan per pcs / set)")
+                    edited_bom = st.data_editor(
+                        pd.DataFrame(product.get("bom", []), columns=BOM_COLUMNS),
+                        column_config={
+                            "material": st.column_config.TextColumn("Material", required=True),
+                            "unit": st.column_config.SelectboxColumn("Satuan", options=BOM_UNITS, default="pcs"),
+                            "qty": st.column_config.NumberColumn("Qty per Pcs", min_value=0.0, format="%.4f"),
+                            "price": st.column_config.NumberColumn("Harga/Unit (Rp)", min_value=0, format="%d")
+                        },
+                        num_rows="dynamic",
+                        hide_index=True,
+                        use_container_width=True,
+                        key=f"bom_editor_{idx}"
+                    )
+                    if st.button("💾 Simpan BOM", key=f"save_bom_{idx}"):
+                        product["bom"] = normalize_bom(edited_bom.to_dict("records"))
+                        st.session_state["products"] = products
+                        if save_products(products):
+                            # Order terbuka produk ini langsung me-reserve material
+                            sync_order_materials(get_dataset("data_produksi"))
+                            st.success(f"✅ BOM {product.get('name', '')} disimpan ({len(product['bom'])} material)")
+                            st.rerun()
+        
+        st.markdown("---")
+        st.markdown("### ➕ Add New Product")
+        
+        with st.form("add_product_form", clear_on_submit=True):
+            col1, col2 = st.columns(2)
+            with col1:
+                new_prod_name = st.text_input("Nama Produk *")
+                new_prod_sku = st.text_input("SKU", placeholder=f"Kosongkan untuk otomatis ({next_product_sku(products)})")
+                new_prod_material = st.text_input("Material")
+                new_prod_finishing = st.text_input("Finishing")
+            with col2:
+                st.markdown("**Product Size (cm)**")
+                c1, c2, c3 = st.columns(3)
+                np_p = c1.number_input("P", min_value=0.0,value=None, step=0.1, key="np_p", placeholder="0.00")
+                np_l = c2.number_input("L", min_value=0.0,value=None, step=0.1, key="np_l", placeholder="0.00")
+                np_t = c3.number_input("T", min_value=0.0,value=None, step=0.1, key="np_t", placeholder="0.00")
+                
+                st.markdown("**Packing Size (cm)**")
+                c4, c5, c6 = st.columns(3)
+                npack_p = c4.number_input("P", min_value=0.0,value=None, step=0.1, key="npack_p", placeholder="0.00")
+                npack_l = c5.number_input("L", min_value=0.0,value=None, step=0.1, key="npack_l", placeholder="0.00")
+                npack_t = c6.number_input("T", min_value=0.0,value=None, step=0.1, key="npack_t", placeholder="0.00")
+                
+                new_prod_max_stack = st.number_input("Max Stack (unit per tumpukan)", min_value=1, value=1, step=1, key="np_max_stack")
+            
+            new_prod_desc = st.text_area("Description", height=60)
+            new_prod_image = st.file_uploader("Upload Gambar", type=['jpg', 'jpeg', 'png'])
+            
+            if st.form_submit_button("➕ Add Product", use_container_width=True, type="primary"):
+                if new_prod_name and get_product_by_name(new_prod_name):
+                    st.warning(f"⚠️ Produk '{new_prod_name}' sudah ada!")
+                elif new_prod_sku and get_product_by_sku(new_prod_sku.strip()):
+                    st.warning(f"⚠️ SKU '{new_prod_sku}' sudah dipakai!")
+                elif new_prod_name:
+                    image_path = ""
+                    if new_prod_image:
+                        image_path = save_product_image(new_prod_image, new_prod_name)
+                    
+                    new_product = {
+                        "sku": new_prod_sku.strip(),
+                        "name": new_prod_name,
+                        "material": new_prod_material,
+                        "finishing": new_prod_finishing,
+                        "product_size_p": np_p,
+                        "product_size_l": np_l,
+                        "product_size_t": np_t,
+                        "packing_size_p": npack_p,
+                        "packing_size_l": npack_l,
+                        "packing_size_t": npack_t,
+                        "max_stack": int(new_prod_max_stack),
+                        "description": new_prod_desc,
+                        "image_path": image_path,
+                        "is_knockdown": False,
+                        "knockdown_pieces": [],
+                        "bom": []
+                    }
+                    products.append(new_product)
+                    st.session_state["products"] = products
+                    save_products(products)
+                    st.success(f"✅ Product '{new_prod_name}' ditambahkan!")
+                    st.rerun()
+    
+    # ===== TAB: SUPPLIERS =====
+    with tab3:
+        st.subheader("🏭 Manage Suppliers")
+        suppliers = st.session_state["suppliers"]
+        
+        if suppliers:
+            for idx, supplier in enumerate(suppliers):
+                with st.expander(f"🏭 {supplier.get('name', 'N/A')}"):
+                    st.write(f"**Alamat:** {supplier.get('address', '-')}")
+                    st.write(f"**Spesialisasi:** {supplier.get('specialization', '-')}")
+                    st.write(f"**Contact:** {supplier.get('contact', '-')}")
+                    st.write(f"**Janji Lead Time:** {supplier.get('lead_time_days', SUPPLIER_DEFAULT_LEAD_DAYS)} hari")
+                    if st.button("🗑️ Hapus", key=f"del_supp_{idx}"):
+                        suppliers.pop(idx)
+                        st.session_state["suppliers"] = suppliers
+                        save_suppliers(suppliers)
+                        st.rerun()
+        
+        st.markdown("### ➕ Add New Supplier")
+        with st.form("add_supplier_form", clear_on_submit=True):
+            new_supp_name = st.text_input("Nama Supplier *",placeholder="")
+            new_supp_address = st.text_area("Alamat", height=80,placeholder="")
+            new_supp_spec = st.text_input("Spesialisasi",placeholder="")
+            new_supp_contact = st.text_input("Contact",placeholder="")
+            new_supp_lead = st.number_input("Janji Lead Time (hari)", min_value=0, value=SUPPLIER_DEFAULT_LEAD_DAYS, step=1)
+            
+            if st.form_submit_button("➕ Add Supplier", use_container_width=True, type="primary"):
+                if new_supp_name:
+                    suppliers.append({
+                        "name": new_supp_name,
+                        "address": new_supp_address,
+                        "specialization": new_supp_spec,
+                        "contact": new_supp_contact,
+                        "lead_time_days": int(new_supp_lead)
+                    })
+                    st.session_state["suppliers"] = suppliers
+                    save_suppliers(suppliers)
+                    st.success(f"✅ Supplier '{new_supp_name}' ditambahkan!")
+                    st.rerun()
+    
+    # ===== TAB: PEKERJA HARIAN - NEW =====
+    with tab4:
+        st.subheader("👷 Manage Pekerja Harian")
+        workers = st.session_state["workers"]
+        
+        if workers:
+            st.info(f"👷 {len(workers)} pekerja terdaftar")
+            
+            for idx, worker in enumerate(workers):
+                with st.expander(f"👤 {worker.get('name', 'N/A')} - {worker.get('position', '-')}"):
+                    col_w1, col_w2, col_w3 = st.columns([2, 2, 1])
+                    with col_w1:
+                        st.write(f"**Nama:** {worker.get('name', '-')}")
+                        st.write(f"**Posisi:** {worker.get('position', '-')}")
+                    with col_w2:
+                        st.write(f"**No. HP:** {worker.get('phone', '-')}")
+                        st.write(f"**Alamat:** {worker.get('address', '-')}")
+                        st.write(f"**Upah:** Rp {worker.get('daily_wage', DEFAULT_DAILY_WAGE):,.0f}/hari | Rp {worker.get('hourly_rate', DEFAULT_HOURLY_RATE):,.0f}/jam")
+                    with col_w3:
+                        if st.button("🗑️ Hapus", key=f"del_worker_{idx}"):
+                            workers.pop(idx)
+                            st.session_state["workers"] = workers
+                            save_workers(workers)
+                            st.success("Pekerja dihapus!")
+                            st.rerun()
+        else:
+            st.info("👷 Belum ada pekerja terdaftar")
+        
+        st.markdown("---")
+        st.markdown("### ➕ Tambah Pekerja Baru")
+        
+        with st.form("add_worker_form", clear_on_submit=True):
+            col_nw1, col_nw2 = st.columns(2)
+            with col_nw1:
+                new_worker_name = st.text_input("Nama Pekerja *", placeholder="Nama lengkap")
+                new_worker_position = st.selectbox("Posisi", [
+                    "Tukang Kayu", "Tukang Finishing", "Helper", "Packing", "QC", "Lainnya"
+                ])
+            with col_nw2:
+                new_worker_phone = st.text_input("No. HP", placeholder="08xxxxxxxxxx")
+                new_worker_address = st.text_input("Alamat", placeholder="Alamat singkat")
+            col_nw3, col_nw4 = st.columns(2)
+            with col_nw3:
+                new_worker_daily_wage = st.number_input("Upah Harian (Rp)", min_value=0, value=DEFAULT_DAILY_WAGE, step=1000)
+            with col_nw4:
+                new_worker_hourly_rate = st.number_input("Upah per Jam - Lembur (Rp)", min_value=0, value=DEFAULT_HOURLY_RATE, step=100)
+            
+            if st.form_submit_button("➕ Tambah Pekerja", use_container_width=True, type="primary"):
+                if new_worker_name:
+                    # Generate unique ID
+                    worker_id = f"WRK-{len(workers)+1:03d}"
+                    
+                    new_worker = {
+                        "id": worker_id,
+                        "name": new_worker_name,
+                        "position": new_worker_position,
+                        "phone": new_worker_phone,
+                        "address": new_worker_address,
+                        "daily_wage": new_worker_daily_wage,
+                        "hourly_rate": new_worker_hourly_rate,
+                        "joined_date": str(datetime.date.today())
+                    }
+                    workers.append(new_worker)
+                    st.session_state["workers"] = workers
+                    if save_workers(workers):
+                        st.success(f"✅ Pekerja '{new_worker_name}' berhasil ditambahkan!")
+                        st.rerun()
+                else:
+                    st.warning("⚠️ Nama pekerja harus diisi!")
+        
+        # Bulk import option
+        st.markdown("---")
+        st.markdown("### 📋 Import Cepat (Bulk)")
+        st.caption("Masukkan nama pekerja, satu per baris")
+        
+        bulk_names = st.text_area("Daftar Nama", placeholder="Budi\nAndi\nSiti\n...", height=100, key="bulk_workers")
+        bulk_position = st.selectbox("Posisi Default", ["Tukang Kayu", "Tukang Finishing", "Helper", "Packing", "QC"], key="bulk_position")
+        
+        if st.button("📤 Import Semua", use_container_width=True):
+            if bulk_names:
+                names = [n.strip() for n in bulk_names.split("\n") if n.strip()]
+                added = 0
+                for name in names:
+                    worker_id = f"WRK-{len(workers)+1:03d}"
+                    workers.append({
+                        "id": worker_id,
+                        "name": name,
+                        "position": bulk_position,
+                        "phone": "",
+                        "address": "",
+                        "daily_wage": DEFAULT_DAILY_WAGE,
+                        "hourly_rate": DEFAULT_HOURLY_RATE,
+                        "joined_date": str(datetime.date.today())
+                    })
+                    added += 1
+                
+                st.session_state["workers"] = workers
+                if save_workers(workers):
+                    st.success(f"✅ {added} pekerja berhasil ditambahkan!")
+                    st.rerun()
+    
+    # ===== TAB: HAK AKSES =====
+    with tab5:
+        st.subheader("🔐 Matriks Hak Akses")
+        st.caption(f"Default di kode, bisa ditimpa per role lewat file `{ROLE_PERMISSIONS_PATH}`")
+        st.dataframe(get_permission_audit(), use_container_width=True)
+        
+        my_capabilities = get_user_capabilities()
+        st.info(f"Role Anda: **{get_role_display_name(st.session_state.get('user_role'))}** - {len(my_capabilities)} menu/aksi")
@@ -0,0 +1,306 @@
+import streamlit as st
+import pandas as pd
+import datetime
+
+from ppic_data import save_frozen_dates, freeze_date_range, unfreeze_date_range, get_frozen_index
+from ppic_export import render_export_panel
+
+
+# ===== MENU: FROZEN ZONE (REPLACE ENTIRE SECTION) =====
+def render():
+    st.header("❄️ FROZEN ZONE - DATE LOCKING SYSTEM")
+    st.caption("🔒 Lock specific dates to prevent NEW order creation")
+    
+    tab1, tab2 = st.tabs(["🔒 Manage Frozen Dates", "📊 Frozen Dates Report"])
+    
+    with tab1:
+        st.markdown("### ❄️ Freeze/Unfreeze Dates")
+        
+        st.markdown("""
+        <div style='background: #DBEAFE; border: 2px solid #3B82F6; border-radius: 8px; padding: 15px; margin: 15px 0;'>
+            <h4 style='color: #1E40AF; margin: 0 0 10px 0;'>ℹ️ HOW IT WORKS</h4>
+            <p style='color: #1E3A8A; margin: 0; font-size: 0.9rem;'>
+                When a date is <strong>FROZEN</strong>:
+            </p>
+            <ul style='color: #1E3A8A; margin: 10px 0 0 20px; font-size: 0.9rem;'>
+                <li>❌ <strong>Cannot create NEW orders</strong> with that Order Date or Due Date</li>
+                <li>✅ <strong>Can still update progress</strong> of existing orders</li>
+                <li>✅ <strong>Can still edit</strong> existing orders</li>
+            </ul>
+            <p style='color: #1E3A8A; margin: 10px 0 0 0; font-size: 0.85rem; font-style: italic;'>
+                💡 Use this to prevent new work instructions on closed dates (month-end, audits, etc)
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # Freeze new date
+        st.markdown("#### 🆕 Freeze New Date")
+        
+        col_freeze1, col_freeze2 = st.columns([2, 1])
+        
+        with col_freeze1:
+            with st.container():
+                col_date1, col_date2 = st.columns(2)
+                
+                with col_date1:
+                    freeze_date = st.date_input(
+                        "Select Date to Freeze",
+                        datetime.date.today(),
+                        key="freeze_date_input"
+                    )
+                
+                with col_date2:
+                    freeze_mode = st.radio(
+                        "Freeze Mode",
+                        ["Single Date", "Date Range"],
+                        key="freeze_mode",
+                        horizontal=True
+                    )
+                
+                if freeze_mode == "Date Range":
+                    freeze_end_date = st.date_input(
+                        "End Date (Range)",
+                        freeze_date + datetime.timedelta(days=7),
+                        key="freeze_end_date"
+                    )
+                
+                freeze_reason = st.text_area(
+                    "Reason for Freezing *",
+                    placeholder="Example: Month-end closing, Audit period, Holiday shutdown, System maintenance...",
+                    height=80,
+                    key="freeze_reason_input"
+                )
+        
+        with col_freeze2:
+            st.markdown("**Preview**")
+            
+            if freeze_mode == "Single Date":
+                st.info(f"📅 Date: {freeze_date}")
+                days_count = 1
+            else:
+                st.info(f"📅 From: {freeze_date}")
+                st.info(f"📅 To: {freeze_end_date}")
+                days_count = (freeze_end_date - freeze_date).days + 1
+            
+            st.metric("Days to Freeze", days_count)
+            
+            st.markdown("---")
+            st.caption("**Effect:**")
+            st.caption("❌ Block new orders")
+            st.caption("✅ Allow progress updates")
+            st.caption("✅ Allow edits")
+        
+        if st.button("🔒 FREEZE DATE(S)", use_container_width=True, type="primary", key="freeze_dates_btn"):
+            if freeze_reason:
+                freeze_end = freeze_date if freeze_mode == "Single Date" else freeze_end_date
+                
+                frozen_dates, added_count, existing_count = freeze_date_range(
+                    st.session_state["frozen_dates"], freeze_date, freeze_end,
+                    freeze_reason, st.session_state.get("user_name", "Owner")
+                )
+                st.session_state["frozen_dates"] = frozen_dates
+                
+                if save_frozen_dates(frozen_dates):
+                    if added_count > 0:
+                        st.success(f"✅ {added_count} date(s) successfully frozen!")
+                    if existing_count > 0:
+                        st.warning(f"⚠️ {existing_count} date(s) were already frozen")
+                    st.balloons()
+                    st.rerun()
+            else:
+                st.warning("⚠️ Please provide a reason for freezing!")
+        
+        st.markdown("---")
+        
+        # List of frozen dates
+        st.markdown("#### 📋 Currently Frozen Dates")
+        
+        frozen_dates = st.session_state["frozen_dates"]
+        
+        if not frozen_dates:
+            st.info("📝 No dates are currently frozen")
+        else:
+            # Sort by start date
+            sorted_frozen = sorted(frozen_dates, key=lambda x: x["start"], reverse=True)
+            
+            st.info(f"🔒 **{len(get_frozen_index())}** dates currently frozen in **{len(sorted_frozen)}** period(s)")
+            
+            # Search/filter
+            col_search1, col_search2 = st.columns(2)
+            with col_search1:
+                search_frozen_date = st.text_input("🔍 Search Date", key="search_frozen_date", placeholder="YYYY-MM-DD")
+            with col_search2:
+                show_past = st.checkbox("Show Past Dates", value=False, key="show_past_frozen")
+            
+            # Filter: cocok jika teks ada di start/end, atau tanggal lengkap berada di dalam interval
+            filtered_frozen = sorted_frozen
+            if search_frozen_date:
+                filtered_frozen = [
+                    f for f in filtered_frozen
+                    if search_frozen_date in f["start"] or search_frozen_date in f["end"]
+                    or f["start"] <= search_frozen_date <= f["end"]
+                ]
+            
+            today = str(datetime.date.today())
+            if not show_past:
+                filtered_frozen = [f for f in filtered_frozen if f["end"] >= today]
+            
+            st.caption(f"Showing {len(filtered_frozen)} of {len(sorted_frozen)} frozen periods")
+            
+            # Display frozen periods
+            for idx, frozen in enumerate(filtered_frozen):
+                start_str, end_str = frozen["start"], frozen["end"]
+                date_str = start_str if start_str == end_str else f"{start_str} → {end_str}"
+                days_count = (datetime.date.fromisoformat(end_str) - datetime.date.fromisoformat(start_str)).days + 1
+                reason = frozen.get("reason", "-")
+                frozen_by = frozen.get("frozen_by", "Owner")
+                frozen_at = frozen.get("frozen_at", "-")
+                
+                is_past = end_str < today
+                
+                # Card styling
+                if is_past:
+                    card_style = "background: #374151; border: 1px solid #6B7280; border-radius: 8px; padding: 15px; margin: 8px 0;"
+                    date_badge = f"🕐 <span style='background: #6B7280; color: white; padding: 4px 12px; border-radius: 12px; font-size: 0.85em;'>{date_str}</span>"
+                else:
+                    card_style = "background: #1E3A8A; border: 2px solid #3B82F6; border-radius: 8px; padding: 15px; margin: 8px 0;"
+                    date_badge = f"❄️ <span style='background: #3B82F6; color: white; padding: 4px 12px; border-radius: 12px; font-weight: bold; font-size: 0.9em;'>{date_str}</span>"
+                
+                st.markdown(f"<div style='{card_style}'>", unsafe_allow_html=True)
+                
+                col1, col2, col3 = st.columns([2, 2, 1])
+                
+                with col1:
+                    st.markdown(date_badge, unsafe_allow_html=True)
+                    st.caption(f"**Reason:** {reason} | **Days:** {days_count}")
+                
+                with col2:
+                    st.caption(f"**Frozen By:** {frozen_by}")
+                    st.caption(f"**Frozen At:** {frozen_at}")
+                
+                with col3:
+                    if st.button("🔓 Unfreeze", key=f"unfreeze_date_{start_str}_{end_str}", use_container_width=True, type="secondary"):
+                        frozen_dates_list = unfreeze_date_range(st.session_state["frozen_dates"], start_str, end_str)
+                        
+                        st.session_state["frozen_dates"] = frozen_dates_list
+                        
+                        if save_frozen_dates(frozen_dates_list):
+                            st.success(f"✅ Date {date_str} unfrozen!")
+                            st.rerun()
+                
+                st.markdown("</div>", unsafe_allow_html=True)
+            
+            # Unfreeze sebagian periode
+            with st.expander("🔓 Unfreeze Date Range"):
+                col_unf1, col_unf2, col_unf3 = st.columns([2, 2, 1])
+                with col_unf1:
+                    unfreeze_start = st.date_input("From", datetime.date.today(), key="unfreeze_start")
+                with col_unf2:
+                    unfreeze_end = st.date_input("To", datetime.date.today(), key="unfreeze_end")
+                with col_unf3:
+                    st.markdown("<br>", unsafe_allow_html=True)
+                    if st.button("🔓 Unfreeze", use_container_width=True, key="unfreeze_range_btn"):
+                        frozen_dates_list = unfreeze_date_range(st.session_state["frozen_dates"], unfreeze_start, unfreeze_end)
+                        st.session_state["frozen_dates"] = frozen_dates_list
+                        if save_frozen_dates(frozen_dates_list):
+                            st.success(f"✅ {unfreeze_start} → {unfreeze_end} unfrozen!")
+                            st.rerun()
+    
+    with tab2:
+        st.markdown("### 📊 Frozen Dates Report")
+        
+        frozen_dates = st.session_state["frozen_dates"]
+        
+        if not frozen_dates:
+            st.info("📝 No frozen dates in database")
+        else:
+            # Metrics
+            col_met1, col_met2, col_met3, col_met4 = st.columns(4)
+            
+            frozen_index = get_frozen_index()
+            total_frozen = len(frozen_index)
+            today = datetime.date.today()
+            
+            future_frozen = sum(1 for day in frozen_index if day >= str(today))
+            past_frozen = total_frozen - future_frozen
+            
+            # Count orders that WOULD BE affected (orders with those dates)
+            df = st.session_state["data_produksi"]
+            affected_orders = 0
+            
+            if not df.empty:
+                frozen_day_keys = list(frozen_index)
+                affected_mask = (
+                    df["Order Date"].astype(str).isin(frozen_day_keys) |
+                    df["Due Date"].astype(str).isin(frozen_day_keys)
+                )
+                affected_orders = int(affected_mask.sum())
+            
+            col_met1.metric("Total Frozen Dates", total_frozen)
+            col_met2.metric("Future Dates", future_frozen)
+            col_met3.metric("Past Dates", past_frozen)
+            col_met4.metric("Orders with Frozen Dates", affected_orders)
+            
+            st.caption("💡 Orders with frozen dates can still be updated/edited, but NO NEW orders can be created with these dates")
+            
+            st.markdown("---")
+            
+            # Table view
+            report_data = []
+            for frozen in frozen_dates:
+                report_data.append({
+                    "Start": frozen["start"],
+                    "End": frozen["end"],
+                    "Days": (datetime.date.fromisoformat(frozen["end"]) - datetime.date.fromisoformat(frozen["start"])).days + 1,
+                    "Reason": frozen.get("reason", "-"),
+                    "Frozen By": frozen.get("frozen_by", "-"),
+                    "Frozen At": frozen.get("frozen_at", "-")
+                })
+            
+            report_df = pd.DataFrame(report_data)
+            report_df = report_df.sort_values("Start", ascending=False)
+            
+            st.dataframe(report_df, use_container_width=True, hide_index=True)
+            
+            # Export
+            render_export_panel("frozen_export", report_df, f"frozen_dates_report_{datetime.date.today()}", date_column="Start")
+            
+            st.markdown("---")
+            
+            # Bulk unfreeze
+            st.markdown("#### 🗑️ Bulk Operations")
+            
+            col_bulk1, col_bulk2 = st.columns(2)
+            
+            with col_bulk1:
+                if st.button("🗑️ Clear All Past Dates", use_container_width=True, type="secondary"):
+                    if st.session_state.get("confirm_clear_past", False):
+                        yesterday = datetime.date.today() - datetime.timedelta(days=1)
+                        frozen_dates_list = unfreeze_date_range(st.session_state["frozen_dates"], datetime.date.min, yesterday)
+                        
+                        st.session_state["frozen_dates"] = frozen_dates_list
+                        
+                        if save_frozen_dates(frozen_dates_list):
+                            st.success("✅ All past frozen dates cleared!")
+                            del st.session_state["confirm_clear_past"]
+                            st.rerun()
+                    else:
+                        st.session_state["confirm_clear_past"] = True
+                        st.warning("⚠️ Click again to confirm!")
+                        st.rerun()
+            
+            with col_bulk2:
+                if st.button("🗑️ Clear ALL Frozen Dates", use_container_width=True, type="secondary"):
+                    if st.session_state.get("confirm_clear_all", False):
+                        st.session_state["frozen_dates"] = []
+                        
+                        if save_frozen_dates([]):
+                            st.success("✅ All frozen dates cleared!")
+                            del st.session_state["confirm_clear_all"]
+                            st.rerun()
+                    else:
+                        st.session_state["confirm_clear_all"] = True
+                        st.warning("⚠️ Click again to confirm!")
+                        st.rerun()
@@ -0,0 +1,114 @@
+import streamlit as st
+import pandas as pd
+import datetime
+
+from ppic_data import get_frozen_date_range, get_tracking_stages
+from ppic_planning import (
+    GANTT_LEVELS, build_gantt_rows, GANTT_ROWS_PER_VIEW, GANTT_PRIORITY_COLORS,
+    get_production_schedule
+)
+from ppic_charts import get_cached_figure, build_gantt_figure
+
+
+# ===== MENU: GANTT CHART =====
+def render():
+    st.header("📊 GANTT CHART PRODUKSI")
+    
+    df = st.session_state["data_produksi"]
+    
+    if not df.empty:
+        col_filter1, col_filter2 = st.columns(2)
+        with col_filter1:
+            filter_buyers = st.multiselect("Filter Buyer", df["Buyer"].unique(), default=df["Buyer"].unique())
+        with col_filter2:
+            filter_priority = st.multiselect("Filter Priority", ["High", "Medium", "Low"], default=["High", "Medium", "Low"])
+        
+        df_filtered = df[df["Buyer"].isin(filter_buyers) & df["Prioritas"].isin(filter_priority)].copy()
+        
+        if not df_filtered.empty:
+            col_level, col_window = st.columns([1, 2])
+            with col_level:
+                gantt_level = st.radio("Tampilan", GANTT_LEVELS, horizontal=True, key="gantt_level")
+            
+            gantt_rows = build_gantt_rows(df_filtered, gantt_level)
+            total_rows = len(gantt_rows)
+            
+            # Only draw the rows inside the visible window
+            window_start = 0
+            if total_rows > GANTT_ROWS_PER_VIEW:
+                with col_window:
+                    window_start = st.slider(
+                        f"Baris (menampilkan {GANTT_ROWS_PER_VIEW} dari {total_rows})",
+                        min_value=0,
+                        max_value=total_rows - GANTT_ROWS_PER_VIEW,
+                        value=0,
+                        step=max(1, GANTT_ROWS_PER_VIEW // 2),
+                        key="gantt_window"
+                    )
+            window_rows = gantt_rows.iloc[window_start:window_start + GANTT_ROWS_PER_VIEW]
+            
+            gantt_params = (
+                tuple(filter_buyers), tuple(filter_priority), gantt_level, window_start,
+                tuple(get_frozen_date_range()), datetime.date.today()
+            )
+            fig = get_cached_figure("gantt", gantt_params, lambda: build_gantt_figure(window_rows))
+            st.plotly_chart(fig, use_container_width=True)
+            
+            legend_items = " | ".join(f"<span style='color: {color};'>■</span> {priority}" for priority, color in GANTT_PRIORITY_COLORS.items())
+            st.caption(f"{legend_items} | Bar tipis = progress | Arsir = due date frozen | Garis merah = hari ini", unsafe_allow_html=True)
+            
+            st.markdown("---")
+            st.subheader("📋 Order Timeline Summary")
+            
+            if gantt_level == "Order Line":
+                summary_df = df_filtered[["Order ID", "Buyer", "Produk", "Order Date", "Due Date", 
+                                         "Progress", "Prioritas"]].copy()
+                summary_df["Order Date"] = pd.to_datetime(summary_df["Order Date"]).dt.strftime('%Y-%m-%d')
+                summary_df["Due Date"] = pd.to_datetime(summary_df["Due Date"]).dt.strftime('%Y-%m-%d')
+            else:
+                summary_df = gantt_rows.rename(columns={"Task": gantt_level, "Start": "Order Date", "Finish": "Due Date"})
+                summary_df["Order Date"] = summary_df["Order Date"].dt.strftime('%Y-%m-%d')
+                summary_df["Due Date"] = summary_df["Due Date"].dt.strftime('%Y-%m-%d')
+                summary_df["Progress"] = summary_df["Progress"].round(0).astype(int).astype(str) + "%"
+            
+            st.dataframe(summary_df, use_container_width=True, hide_index=True)
+            
+            st.markdown("---")
+            st.subheader("🗓️ Rencana Produksi (Kapasitas Terbatas)")
+            
+            schedule = get_production_schedule(df)
+            st.caption(f"Kapasitas workstation × headcount {schedule['headcount_factor']:.0%} (rata-rata kehadiran). "
+                       f"Hari Minggu dan tanggal frozen tidak dihitung sebagai hari kerja.")
+            
+            plan_rows = []
+            for order_id in df_filtered["Order ID"].astype(str):
+                plan = schedule["plans"].get(order_id)
+                if not plan or not plan["stages"]:
+                    continue
+                row_data = {
+                    "Order ID": order_id,
+                    "Planned Start": str(plan["planned_start"]),
+                    "Planned Finish": str(plan["planned_finish"]),
+                    "Due Date": str(plan["due_date"]),
+                    "Status": "⚠️ Terlambat" if plan["late"] else "✅ On Time"
+                }
+                for stage, stage_plan in plan["stages"].items():
+                    row_data[stage] = f"{stage_plan['start'].strftime('%d/%m')} - {stage_plan['finish'].strftime('%d/%m')}"
+                plan_rows.append(row_data)
+            
+            if plan_rows:
+                plan_df = pd.DataFrame(plan_rows)
+                late_count = int((plan_df["Status"] == "⚠️ Terlambat").sum())
+                col_plan1, col_plan2 = st.columns(2)
+                col_plan1.metric("Order Direncanakan", len(plan_df))
+                col_plan2.metric("Diprediksi Terlambat", late_count)
+                
+                stage_columns = [stage for stage in get_tracking_stages() if stage in plan_df.columns]
+                plan_df = plan_df[["Order ID", "Planned Start", "Planned Finish", "Due Date", "Status"] + stage_columns]
+                st.dataframe(plan_df.fillna("-"), use_container_width=True, hide_index=True)
+            else:
+                st.success("✅ Semua order pada filter ini sudah selesai")
+        else:
+            st.warning("Tidak ada data sesuai filter")
+    else:
+        st.info("📝 Belum ada data untuk membuat Gantt Chart.")
@@ -0,0 +1,532 @@
+import streamlit as st
+import pandas as pd
+import datetime
+import json
+import os
+
+from ppic_images import get_thumbnail
+from ppic_import import validate_import, commit_import, IMPORT_FIELDS
+from ppic_planning import replan_production_schedule
+from ppic_mrp import refresh_mrp_orders
+from ppic_data import (
+    get_buyer_names, get_product_by_name, get_product_index, calculate_cbm, calculate_floor_area_m2,
+    is_date_frozen, save_uploaded_image, add_history_entry, init_tracking_data,
+    get_tracking_stages, save_data, allocate_order_id
+)
+
+
+@st.fragment
+def render_knockdown_editor():
+    """Knockdown piece editor; add/remove piece only reruns this fragment"""
+    st.markdown("### 🔧 Kelola Knockdown Pieces")
+    
+    with st.expander("➕ Tambah Piece Baru", expanded=True):
+        col_kd1, col_kd2, col_kd3, col_kd4 = st.columns([2, 1, 2, 1])
+        
+        with col_kd1:
+            piece_name = st.text_input("Nama Piece", placeholder="Body, Door, Shelf", key="piece_name")
+        with col_kd2:
+            piece_qty = st.number_input("Qty per Set", min_value=1, value=1, key="piece_qty")
+        with col_kd3:
+            st.caption("**Packing Size (cm)**")
+            col_kd_p1, col_kd_p2, col_kd_p3 = st.columns(3)
+            with col_kd_p1:
+                piece_p = st.number_input("P", min_value=0.0, value=0.0, format="%.2f", key="piece_p", step=0.01)
+            with col_kd_p2:
+                piece_l = st.number_input("L", min_value=0.0, value=0.0, format="%.2f", key="piece_l", step=0.01)
+            with col_kd_p3:
+                piece_t = st.number_input("T", min_value=0.0, value=0.0, format="%.2f", key="piece_t", step=0.01)
+        with col_kd4:
+            piece_cbm = calculate_cbm(piece_p, piece_l, piece_t) * piece_qty
+            st.metric("CBM Piece", f"{piece_cbm:.6f}")
+            
+            if st.button("➕ Add Piece", use_container_width=True, type="primary", key="add_piece_btn"):
+                if piece_name and piece_cbm > 0:
+                    new_piece = {"name": piece_name, "qty_per_set": piece_qty, "p": piece_p, "l": piece_l, "t": piece_t, "cbm": piece_cbm}
+                    st.session_state["knockdown_pieces"].append(new_piece)
+                    st.success(f"✅ Piece '{piece_name}' ditambahkan!")
+                    st.rerun(scope="fragment")
+                else:
+                    st.warning("⚠️ Nama dan dimensi harus diisi!")
+    
+    if st.session_state["knockdown_pieces"]:
+        st.markdown("#### 📋 Pieces dalam Set")
+        for idx, piece in enumerate(st.session_state["knockdown_pieces"]):
+            col_p1, col_p2 = st.columns([4, 1])
+            with col_p1:
+                st.markdown(f"**{idx+1}. {piece['name']}** (x{piece['qty_per_set']}) - {piece['p']:.2f} × {piece['l']:.2f} × {piece['t']:.2f} cm = {piece['cbm']:.6f} m³")
+            with col_p2:
+                if st.button("🗑️", key=f"remove_piece_{idx}"):
+                    st.session_state["knockdown_pieces"].pop(idx)
+                    st.rerun(scope="fragment")
+
+
+@st.fragment
+def render_bulk_import():
+    """Import PO CSV/XLSX: validasi per chunk dulu, lalu semua baris valid masuk dalam satu save"""
+    st.caption(f"Kolom yang dikenali: {', '.join(IMPORT_FIELDS)}. Wajib: Qty dan Produk/SKU; kolom lain boleh kosong.")
+    
+    col_imp1, col_imp2, col_imp3 = st.columns(3)
+    with col_imp1:
+        default_buyer = st.selectbox("Buyer default", [""] + get_buyer_names(), key="import_buyer")
+    with col_imp2:
+        default_order_date = st.date_input("Order Date default", datetime.date.today(), key="import_order_date")
+    with col_imp3:
+        default_priority = st.selectbox("Prioritas default", ["Medium", "High", "Low"], key="import_priority")
+    
+    uploaded = st.file_uploader("File PO (CSV / XLSX)", type=["csv", "xlsx"], key="import_file")
+    if uploaded is None:
+        st.session_state.pop("order_import", None)
+        return
+    
+    if st.button("🔍 Validasi File", use_container_width=True, key="import_validate_btn"):
+        try:
+            with st.spinner("Membaca dan memvalidasi file..."):
+                result = validate_import(uploaded, {
+                    "buyer": default_buyer, "order_date": default_order_date, "prioritas": default_priority
+                })
+            result["file"] = (uploaded.name, uploaded.size)
+            st.session_state["order_import"] = result
+        except ValueError as e:
+            st.session_state.pop("order_import", None)
+            st.error(f"❌ {e}")
+    
+    result = st.session_state.get("order_import")
+    if not result or result["file"] != (uploaded.name, uploaded.size):
+        return
+    
+    rows, errors = result["rows"], result["errors"]
+    col_m1, col_m2, col_m3 = st.columns(3)
+    col_m1.metric("Baris Data", result["total"])
+    col_m2.metric("Baris Valid", len(rows))
+    col_m3.metric("Baris Error", errors["Baris"].nunique())
+    
+    if not errors.empty:
+        st.warning(f"⚠️ {len(errors)} error ditemukan")
+        st.dataframe(errors, use_container_width=True, hide_index=True)
+    if rows.empty:
+        return
+    
+    with st.expander(f"📋 Preview {len(rows)} baris valid ({rows['group'].nunique()} order)"):
+        st.dataframe(
+            rows[["line", "group", "Buyer", "Produk", "Qty", "Order Date", "Due Date", "Prioritas", "CBM per Pcs", "Total CBM"]],
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    skip_errors = True
+    if not errors.empty:
+        skip_errors = st.checkbox("Import baris valid saja (lewati baris error)", key="import_skip_errors")
+    
+    if st.button("📥 IMPORT ORDER", use_container_width=True, type="primary", disabled=not skip_errors, key="import_commit_btn"):
+        new_df = commit_import(rows)
+        if new_df is not None:
+            new_ids = new_df["Order ID"].tolist()
+            replan_production_schedule(st.session_state["data_produksi"], new_ids)
+            refresh_mrp_orders(st.session_state["data_produksi"], new_ids)
+            st.session_state.pop("order_import", None)
+            st.session_state["order_import_done"] = f"✅ {len(new_df)} baris ({rows['group'].nunique()} order) berhasil diimport!"
+            st.rerun()
+
+
+def render():
+    st.markdown("<h2 style='margin: 0;'>📋 Form Input Pesanan Baru (Multi-Product)</h2>", unsafe_allow_html=True)
+    
+    if "order_import_done" in st.session_state:
+        st.success(st.session_state.pop("order_import_done"))
+    
+    with st.expander("📥 Import Order Massal (CSV / Excel)"):
+        render_bulk_import()
+    
+    if "input_products" not in st.session_state:
+        st.session_state["input_products"] = []
+    
+    st.markdown("#### 📦 Informasi Order")
+    
+    col_order1, col_order2, col_order3, col_order4 = st.columns(4)
+    
+    with col_order1:
+        order_date = st.date_input("Order Date", datetime.date.today(), key="input_order_date")
+    
+    with col_order2:
+        buyers_list = get_buyer_names()
+        buyer = st.selectbox("Buyer Name", buyers_list, key="input_buyer")
+    
+    with col_order3:
+        due_date = st.date_input("Due Date", datetime.date.today() + datetime.timedelta(days=30), key="input_due")
+    
+    with col_order4:
+        prioritas = st.selectbox("Prioritas", ["High", "Medium", "Low"], key="input_priority")
+    
+    st.markdown("---")
+    st.markdown("#### 📦 Tambah Produk ke Order")
+    
+    col_type1, col_type2 = st.columns([1, 3])
+    with col_type1:
+        is_knockdown = st.checkbox("🔧 Produk Knockdown", key="is_knockdown_check")
+    
+    with col_type2:
+        if is_knockdown:
+            st.info("💡 **Mode Knockdown**: Produk terdiri dari beberapa pieces")
+        else:
+            st.info("📦 **Mode Normal**: Satu produk = satu packing size")
+
+    # Product selection with auto-fill
+    with st.container():
+        col1, col2, col3 = st.columns([1, 1, 1])
+        
+        with col1:
+            st.markdown("**Product Information**")
+            products_list = st.session_state["products"]
+            
+            if "selected_product_cache" not in st.session_state:
+                st.session_state["selected_product_cache"] = ""
+            if "knockdown_pieces" not in st.session_state:
+                st.session_state["knockdown_pieces"] = []
+            if "autofill_image_path" not in st.session_state:
+                st.session_state["autofill_image_path"] = ""
+            
+            if products_list:
+                product_names = list(get_product_index()["name"])
+                produk_option = st.selectbox(
+                    "Pilih Produk", 
+                    ["-- Input Manual --", "-- Pilih dari Database --"] + product_names, 
+                    key="form_produk_select"
+                )
+                
+                # Auto-fill logic
+                if produk_option != st.session_state["selected_product_cache"]:
+                    st.session_state["selected_product_cache"] = produk_option
+                    
+                    if produk_option in ["-- Input Manual --", "-- Pilih dari Database --"]:
+                        st.session_state["form_material"] = ""
+                        st.session_state["form_finishing"] = ""
+                        st.session_state["form_desc"] = ""
+                        st.session_state["prod_p"] = 0.0
+                        st.session_state["prod_l"] = 0.0
+                        st.session_state["prod_t"] = 0.0
+                        st.session_state["pack_p"] = 0.0
+                        st.session_state["pack_l"] = 0.0
+                        st.session_state["pack_t"] = 0.0
+                        st.session_state["form_max_stack"] = 1
+                        st.session_state["knockdown_pieces"] = []
+                        st.session_state["autofill_image_path"] = ""
+                        st.rerun()
+                    else:
+                        selected_product = get_product_by_name(produk_option)
+                        if selected_product:
+                            st.session_state["form_material"] = selected_product.get("material", "")
+                            st.session_state["form_finishing"] = selected_product.get("finishing", "")
+                            st.session_state["form_desc"] = selected_product.get("description", "")
+                            st.session_state["prod_p"] = float(selected_product.get("product_size_p", 0))
+                            st.session_state["prod_l"] = float(selected_product.get("product_size_l", 0))
+                            st.session_state["prod_t"] = float(selected_product.get("product_size_t", 0))
+                            st.session_state["pack_p"] = float(selected_product.get("packing_size_p", 0))
+                            st.session_state["pack_l"] = float(selected_product.get("packing_size_l", 0))
+                            st.session_state["pack_t"] = float(selected_product.get("packing_size_t", 0))
+                            st.session_state["form_max_stack"] = int(selected_product.get("max_stack", 1))
+                            st.session_state["autofill_image_path"] = selected_product.get("image_path", "")
+                            
+                            if selected_product.get("is_knockdown", False):
+                                pieces = selected_product.get("knockdown_pieces", [])
+                                st.session_state["knockdown_pieces"] = [piece.copy() for piece in pieces]
+                            else:
+                                st.session_state["knockdown_pieces"] = []
+                            
+                            st.rerun()
+                
+                if produk_option == "-- Input Manual --":
+                    produk_name = st.text_input("Nama Produk Manual", key="form_produk_manual")
+                elif produk_option not in ["-- Input Manual --", "-- Pilih dari Database --"]:
+                    produk_name = produk_option
+                    st.success(f"✅ Product '{produk_name}' loaded")
+                else:
+                    produk_name = ""
+                    st.info("📝 Pilih produk dari dropdown")
+            else:
+                st.warning("⚠️ Product database kosong")
+                produk_name = st.text_input("Nama Produk", key="form_produk")
+            
+            qty = st.number_input("Quantity (unit)" if not is_knockdown else "Quantity (set)", 
+                                 min_value=1, value=1, key="form_qty")
+            
+            uploaded_image = st.file_uploader("Upload Gambar Produk", type=['jpg', 'jpeg', 'png'], key="form_image")
+            
+            # Show database image if available
+            db_image_path = st.session_state.get("autofill_image_path", "")
+            if db_image_path and os.path.exists(db_image_path) and not uploaded_image:
+                st.image(get_thumbnail(db_image_path), caption="📷 From Database", width=150)
+            
+        with col2:
+            st.markdown("**Specifications**")
+            
+            material = st.text_input("Material", placeholder="Contoh: Kayu Jati", key="form_material")
+            finishing = st.text_input("Finishing", placeholder="Contoh: Natural", key="form_finishing")
+            
+            st.markdown("**Product Size (cm)**")
+            col_ps1, col_ps2, col_ps3 = st.columns(3)
+            with col_ps1:
+                prod_p = st.number_input("P", min_value=0.0, value=None, format="%.2f", key="prod_p", step=0.01, placeholder="0.00")
+            with col_ps2:
+                prod_l = st.number_input("L", min_value=0.0, value=None, format="%.2f", key="prod_l", step=0.01, placeholder="0.00")
+            with col_ps3:
+                prod_t = st.number_input("T", min_value=0.0, value=None, format="%.2f", key="prod_t", step=0.01, placeholder="0.00")
+            
+            product_cbm = calculate_cbm(prod_p, prod_l, prod_t)
+            floor_area = calculate_floor_area_m2(prod_p, prod_l)
+            if product_cbm > 0:
+                st.success(f"📦 Product CBM: **{product_cbm:.6f} m³**")
+                st.caption(f"📐 Floor area: {floor_area:.4f} m² per unit")
+            else:
+                st.info("📦 Product CBM: 0.000000 m³")
+            
+            max_stack = st.number_input("Max Stack (unit per tumpukan)", min_value=1, value=1, step=1, key="form_max_stack")
+        
+        with col3:
+            if not is_knockdown:
+                st.markdown("**Packing Information**")
+                st.markdown("**Packing Size (cm)**")
+                col_pack1, col_pack2, col_pack3 = st.columns(3)
+                with col_pack1:
+                    pack_p = st.number_input("P", min_value=0.0, value=None, format="%.2f", key="pack_p", step=0.01, placeholder="0.00")
+                with col_pack2:
+                    pack_l = st.number_input("L", min_value=0.0, value=None, format="%.2f", key="pack_l", step=0.01, placeholder="0.00")
+                with col_pack3:
+                    pack_t = st.number_input("T", min_value=0.0, value=None, format="%.2f", key="pack_t", step=0.01, placeholder="0.00")
+                
+                cbm_per_pcs = calculate_cbm(pack_p, pack_l, pack_t)
+                total_cbm = cbm_per_pcs * qty
+                
+                if cbm_per_pcs > 0:
+                    st.success(f"📦 CBM per Unit: **{cbm_per_pcs:.6f} m³**")
+                    st.info(f"📦 Total CBM: **{total_cbm:.6f} m³**")
+                else:
+                    st.info("📦 CBM per Unit: 0.000000 m³")
+            else:
+                st.markdown("**🔧 Knockdown Pieces**")
+                if st.session_state["knockdown_pieces"]:
+                    total_cbm_per_set = sum([p["cbm"] for p in st.session_state["knockdown_pieces"]])
+                    total_cbm = total_cbm_per_set * qty
+                    st.success(f"📦 CBM per Set: **{total_cbm_per_set:.6f} m³**")
+                    st.info(f"📦 Total CBM: **{total_cbm:.6f} m³**")
+                    st.caption(f"✓ {len(st.session_state['knockdown_pieces'])} pieces")
+                else:
+                    st.warning("⚠️ Belum ada piece")
+                    total_cbm = 0
+                    cbm_per_pcs = 0
+                
+                pack_p, pack_l, pack_t = 0, 0, 0
+                cbm_per_pcs = total_cbm / qty if qty > 0 else 0
+
+    description = st.text_area("Description", placeholder="Deskripsi produk...", height=50, key="form_desc")
+    keterangan = st.text_area("Keterangan Tambahan", placeholder="Catatan khusus...", height=50, key="form_notes")
+    
+    # Knockdown pieces management
+    if is_knockdown:
+        st.markdown("---")
+        render_knockdown_editor()
+    
+    # Add product button
+    if st.button("➕ Tambah Produk ke Order", use_container_width=True, type="primary", key="add_product_btn"):
+        if produk_name and qty > 0:
+            if is_knockdown and not st.session_state["knockdown_pieces"]:
+                st.warning("⚠️ Produk knockdown harus memiliki minimal 1 piece!")
+            else:
+                if is_knockdown:
+                    total_cbm_per_set = sum([p["cbm"] for p in st.session_state["knockdown_pieces"]])
+                    total_cbm = total_cbm_per_set * qty
+                    cbm_per_pcs = total_cbm_per_set
+                    knockdown_pieces_data = st.session_state["knockdown_pieces"].copy()
+                else:
+                    cbm_per_pcs = calculate_cbm(pack_p, pack_l, pack_t)
+                    total_cbm = cbm_per_pcs * qty
+                    knockdown_pieces_data = []
+                
+                # Use database image if no new upload
+                final_image = uploaded_image
+                final_image_path = st.session_state.get("autofill_image_path", "")
+                
+                temp_product = {
+                    "nama": produk_name,
+                    "qty": qty,
+                    "material": material if material else "-",
+                    "finishing": finishing if finishing else "-",
+                    "description": description if description else "-",
+                    "prod_p": prod_p,
+                    "prod_l": prod_l,
+                    "prod_t": prod_t,
+                    "product_cbm": product_cbm,
+                    "max_stack": max_stack,
+                    "pack_p": pack_p if not is_knockdown else 0,
+                    "pack_l": pack_l if not is_knockdown else 0,
+                    "pack_t": pack_t if not is_knockdown else 0,
+                    "cbm_per_pcs": cbm_per_pcs,
+                    "total_cbm": total_cbm,
+                    "keterangan": keterangan if keterangan else "-",
+                    "image": final_image,
+                    "image_path_from_db": final_image_path,
+                    "is_knockdown": is_knockdown,
+                    "knockdown_pieces": knockdown_pieces_data
+                }
+                
+                st.session_state["input_products"].append(temp_product)
+                
+                # Reset form
+                # st.session_state["form_material"] = ""
+                # st.session_state["form_finishing"] = ""
+                # st.session_state["form_desc"] = ""
+                # st.session_state["prod_p"] = 0.0
+                # st.session_state["prod_l"] = 0.0
+                # st.session_state["prod_t"] = 0.0
+                # st.session_state["pack_p"] = 0.0
+                # st.session_state["pack_l"] = 0.0
+                # st.session_state["pack_t"] = 0.0
+                # st.session_state["selected_product_cache"] = ""
+                # st.session_state["knockdown_pieces"] = []
+                # st.session_state["autofill_image_path"] = ""
+                # st.success(f"✅ Produk '{produk_name}' ditambahkan!")
+                # st.rerun()
+        else:
+            st.warning("⚠️ Harap isi nama produk dan quantity!")
+    
+    # Display added products
+    if st.session_state["input_products"]:
+        st.markdown("---")
+        st.markdown("### 📋 Daftar Produk dalam Order Ini")
+        
+        for idx, product in enumerate(st.session_state["input_products"]):
+            knockdown_badge = " 🔧" if product.get("is_knockdown", False) else ""
+            with st.expander(f"📦 {idx + 1}. {product['nama']}{knockdown_badge} ({product['qty']} unit) - CBM: {product['total_cbm']:.6f} m³"):
+                col_d1, col_d2, col_d3 = st.columns([2, 2, 1])
+                with col_d1:
+                    st.write(f"**Material:** {product['material']}")
+                    st.write(f"**Finishing:** {product['finishing']}")
+                with col_d2:
+                    st.write(f"**CBM per Unit:** {product['cbm_per_pcs']:.6f} m³")
+                    st.write(f"**Total CBM:** {product['total_cbm']:.6f} m³")
+                with col_d3:
+                    if st.button("🗑️ Hapus", key=f"remove_product_{idx}"):
+                        st.session_state["input_products"].pop(idx)
+                        st.rerun()
+        
+        total_cbm_all = sum([p['total_cbm'] for p in st.session_state["input_products"]])
+        st.info(f"📦 Total CBM semua produk: **{total_cbm_all:.6f} m³**")
+        
+        col_submit1, col_submit2 = st.columns(2)
+        
+        with col_submit1:
+            if st.button("🗑️ BATAL", use_container_width=True, type="secondary"):
+                st.session_state["input_products"] = []
+                st.session_state["knockdown_pieces"] = []
+                st.rerun()
+        
+        with col_submit2:
+            if st.button("📤 SUBMIT ORDER", use_container_width=True, type="primary"):
+                # ===== CHECK FROZEN DATES (ONLY FOR NEW ORDER CREATION) =====
+                is_order_date_frozen, order_reason = is_date_frozen(order_date)
+                is_due_date_frozen, due_reason = is_date_frozen(due_date)
+                
+                if is_order_date_frozen:
+                    st.markdown("""
+                    <div style='background: #FEE2E2; border: 2px solid #EF4444; border-radius: 8px; padding: 20px; margin: 15px 0;'>
+                        <h3 style='color: #DC2626; margin: 0 0 10px 0;'>❌ CANNOT CREATE ORDER</h3>
+                        <p style='color: #991B1B; margin: 5px 0;'>
+                            <strong>Order Date {}</strong> is currently <strong>FROZEN</strong>
+                        </p>
+                        <p style='color: #991B1B; margin: 5px 0;'>
+                            <strong>🔒 Reason:</strong> {}
+                        </p>
+                        <p style='color: #991B1B; margin: 15px 0 0 0; font-size: 0.9rem;'>
+                            💡 Please choose a different Order Date or contact Owner to unfreeze this date
+                        </p>
+                    </div>
+                    """.format(order_date, order_reason), unsafe_allow_html=True)
+                elif is_due_date_frozen:
+                    st.markdown("""
+                    <div style='background: #FEE2E2; border: 2px solid #EF4444; border-radius: 8px; padding: 20px; margin: 15px 0;'>
+                        <h3 style='color: #DC2626; margin: 0 0 10px 0;'>❌ CANNOT CREATE ORDER</h3>
+                        <p style='color: #991B1B; margin: 5px 0;'>
+                            <strong>Due Date {}</strong> is currently <strong>FROZEN</strong>
+                        </p>
+                        <p style='color: #991B1B; margin: 5px 0;'>
+                            <strong>🔒 Reason:</strong> {}
+                        </p>
+                        <p style='color: #991B1B; margin: 15px 0 0 0; font-size: 0.9rem;'>
+                            💡 Please choose a different Due Date or contact Owner to unfreeze this date
+                        </p>
+                    </div>
+                    """.format(due_date, due_reason), unsafe_allow_html=True)
+                else:
+                    # ===== PROCEED WITH NORMAL ORDER CREATION =====
+                    if buyer and st.session_state["input_products"]:
+                        new_order_id = allocate_order_id(order_date, buyer)
+                        
+                        new_orders = []
+                        
+                        for prod_idx, product in enumerate(st.session_state["input_products"]):
+                            # image_path = None
+                            # if product.get("image"):
+                            #     image_path = save_uploaded_image(product["image"], new_order_id, prod_idx)
+                            image_path = ""  # ✅ Default empty string
+                            if product.get("image"):
+                                saved_path = save_uploaded_image(product["image"], new_order_id, prod_idx)
+                                if saved_path:  # ✅ Cek kalau berhasil disimpan
+                                    image_path = saved_path
+                            elif product.get("image_path_from_db"):
+                                image_path = product["image_path_from_db"]  # ✅ Gunakan gambar dari DB                            
+                            initial_history = [add_history_entry(f"{new_order_id}-P{prod_idx+1}", "Order Created", 
+                            f"Product: {product['nama']}, Priority: {prioritas}, Type: {'Knockdown' if product.get('is_knockdown', False) else 'Normal'}")]
+                        
+                            tracking_data = init_tracking_data()
+                            first_stage = get_tracking_stages()[0]
+                            tracking_data[first_stage]["qty"] = product["qty"]
+                            
+                            order_data = {
+                                "Order ID": f"{new_order_id}-P{prod_idx+1}",
+                                "Order Date": order_date,
+                                "Buyer": buyer,
+                                "Produk": product["nama"],
+                                "Qty": product["qty"],
+                                "Material": product["material"],
+                                "Finishing": product["finishing"],
+                                "Description": product["description"],
+                                "Product Size P": product["prod_p"],
+                                "Product Size L": product["prod_l"],
+                                "Product Size T": product["prod_t"],
+                                "Product CBM": product["product_cbm"],
+                                "Max Stack": product.get("max_stack", 1),
+                                "Packing Size P": product["pack_p"],
+                                "Packing Size L": product["pack_l"],
+                                "Packing Size T": product["pack_t"],
+                                "CBM per Pcs": product["cbm_per_pcs"],
+                                "Total CBM": product["total_cbm"],
+                                "Due Date": due_date,
+                                "Prioritas": prioritas,
+                                "Progress": "0%",
+                                "Proses Saat Ini": first_stage,
+                                "Keterangan": product["keterangan"],
+                                "Image Path": image_path if image_path else "",
+                                "Tracking": json.dumps(tracking_data),
+                                "History": json.dumps(initial_history),
+                                "Is Knockdown": product.get("is_knockdown", False),
+                                "Knockdown Pieces": json.dumps(product.get("knockdown_pieces", []))
+                            }
+                            
+                            new_orders.append(order_data)
+                        
+                        new_df = pd.DataFrame(new_orders)
+                        st.session_state["data_produksi"] = pd.concat(
+                            [st.session_state["data_produksi"], new_df], ignore_index=True
+                        )
+                        
+                        if save_data(st.session_state["data_produksi"]):
+                            new_ids = new_df["Order ID"].tolist()
+                            replan_production_schedule(st.session_state["data_produksi"], new_ids)
+                            refresh_mrp_orders(st.session_state["data_produksi"], new_ids)
+                            st.success(f"✅ Order {new_order_id} dengan {len(st.session_state['input_products'])} produk berhasil ditambahkan!")
+                            st.balloons()
+                            st.session_state["input_products"] = []
+                            st.session_state["knockdown_pieces"] = []
+                            st.rerun()
+                    else:
+                        st.warning("⚠️ Harap pilih buyer dan tambahkan minimal 1 produk!")
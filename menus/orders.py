@@ -0,0 +1,248 @@
+import streamlit as st
+import pandas as pd
+import datetime
+import json
+
+from ppic_auth import check_permission
+from ppic_images import show_image_thumbnail
+from ppic_data import save_data, get_buyer_names, calculate_cbm, add_history_entry
+from ppic_planning import replan_production_schedule
+from ppic_mrp import refresh_mrp_orders
+
+
+# ===== MENU: DAFTAR ORDER =====
+def render():
+    st.header("📦 DAFTAR ORDER")
+    
+    df = st.session_state["data_produksi"]
+    
+    if not df.empty:
+        col_f1, col_f2 = st.columns(2)
+        with col_f1:
+            filter_buyer = st.multiselect("Filter Buyer", df["Buyer"].unique().tolist())
+        with col_f2:
+            search_order = st.text_input("🔍 Cari Order ID / Produk")
+        
+        df_filtered = df.copy()
+        if filter_buyer:
+            df_filtered = df_filtered[df_filtered["Buyer"].isin(filter_buyer)]
+        if search_order:
+            df_filtered = df_filtered[
+                df_filtered["Order ID"].str.contains(search_order, case=False, na=False) | 
+                df_filtered["Produk"].str.contains(search_order, case=False, na=False)
+            ]
+        
+        st.markdown("---")
+        st.info(f"📦 Menampilkan {len(df_filtered)} order dari {df_filtered['Buyer'].nunique()} buyer")
+        
+        buyers = df_filtered["Buyer"].unique()
+        
+        for buyer in sorted(buyers):
+            buyer_orders = df_filtered[df_filtered["Buyer"] == buyer]
+            buyer_count = len(buyer_orders)
+            
+            with st.expander(f"👤 **{buyer}** ({buyer_count} orders)", expanded=False):
+                buyer_orders['Order Date'] = pd.to_datetime(buyer_orders['Order Date'])
+                buyer_orders = buyer_orders.sort_values('Order Date', ascending=False)
+                
+                date_groups = buyer_orders.groupby(buyer_orders['Order Date'].dt.date)
+                
+                for order_date, date_orders in date_groups:
+                    today = datetime.date.today()
+                    date_diff = (today - order_date).days
+                    
+                    if date_diff == 0:
+                        date_label = "📅 Hari Ini"
+                    elif date_diff == 1:
+                        date_label = "📅 Kemarin"
+                    elif date_diff <= 7:
+                        date_label = f"📅 {date_diff} hari yang lalu"
+                    else:
+                        date_label = f"📅 {order_date.strftime('%d %b %Y')}"
+                    
+                    with st.expander(f"{date_label} ({len(date_orders)} orders)", expanded=False):
+                        for idx, row in date_orders.iterrows():
+                            with st.expander(f"📦 {row['Order ID']} - {row['Produk']}", expanded=False):
+                                col1, col2, col3 = st.columns([2, 2, 1])
+                                
+                                with col1:
+                                    st.write(f"**Product:** {row['Produk']}")
+                                    st.write(f"**Qty:** {row['Qty']} pcs")
+                                    st.write(f"**Material:** {row.get('Material', '-')}")
+                                    st.write(f"**Finishing:** {row.get('Finishing', '-')}")
+                                    st.write(f"**Product Size:** {row.get('Product Size P', 0)} x {row.get('Product Size L', 0)} x {row.get('Product Size T', 0)} cm")
+                                
+                                with col2:
+                                    st.write(f"**Packing Size:** {row.get('Packing Size P', 0)} x {row.get('Packing Size L', 0)} x {row.get('Packing Size T', 0)} cm")
+                                    st.write(f"**CBM per Pcs:** {row.get('CBM per Pcs', 0):.6f} m³")
+                                    st.write(f"**Total CBM:** {row.get('Total CBM', 0):.4f} m³")
+                                    st.write(f"**Due Date:** {row['Due Date']}")
+                                    st.write(f"**Progress:** {row['Progress']}")
+                                    st.write(f"**Proses:** {row['Proses Saat Ini']}")
+                                
+                                with col3:
+                                    if not show_image_thumbnail(row.get('Image Path'), key=row['Order ID'], caption="Product"):
+                                        st.info("📷 No image")
+                                
+                                if row.get('Description') and row['Description'] != '-':
+                                    st.markdown("---")
+                                    st.markdown(f"**📝 Description:** {row['Description']}")
+                                
+                                if row['Keterangan'] and row['Keterangan'] != '-':
+                                    st.markdown(f"**💬 Keterangan:** {row['Keterangan']}")
+
+                                if row.get('Is Knockdown', False):
+                                    try:
+                                        knockdown_pieces = json.loads(row.get('Knockdown Pieces', '[]'))
+                                        if knockdown_pieces:
+                                            st.markdown("---")
+                                            st.markdown("**🔧 Knockdown Pieces:**")
+                                            for piece_idx, piece in enumerate(knockdown_pieces):
+                                                st.markdown(f"""
+                                                <div style="background: #1F2937; padding: 8px; margin: 4px 0; border-radius: 4px; border-left: 3px solid #3B82F6;">
+                                                    <strong>{piece_idx + 1}. {piece['name']}</strong> (x{piece['qty_per_set']}) - 
+                                                    {piece['p']:.2f} × {piece['l']:.2f} × {piece['t']:.2f} cm = {piece['cbm']:.6f} m³
+                                                </div>
+                                                """, unsafe_allow_html=True)
+                                    except:
+                                        pass
+                                st.markdown("---")
+                                btn_col1, btn_col2, btn_col3 = st.columns(3)
+                                with btn_col1:
+                                    if st.button("✏️ Edit Order", key=f"edit_order_{idx}", use_container_width=True, type="primary",
+                                                 disabled=not check_permission("order.edit")):
+                                        st.session_state["edit_order_mode"] = True
+                                        st.session_state["edit_order_index"] = idx
+                                        st.rerun()
+                                with btn_col2:
+                                    if st.button("⚙️ Edit Progress", key=f"edit_{idx}", use_container_width=True, type="secondary"):
+                                        st.session_state["edit_order_idx"] = idx
+                                        st.session_state["menu"] = "Progress"
+                                        st.rerun()
+                                with btn_col3:
+                                    if st.button("🗑️ Delete Order", key=f"del_{idx}", use_container_width=True, type="secondary",
+                                                 disabled=not check_permission("order.delete")):
+                                        if st.session_state.get(f"confirm_delete_{idx}", False):
+                                            st.session_state["data_produksi"].drop(idx, inplace=True)
+                                            st.session_state["data_produksi"].reset_index(drop=True, inplace=True)
+                                            if save_data(st.session_state["data_produksi"]):
+                                                replan_production_schedule(st.session_state["data_produksi"], [str(row['Order ID'])])
+                                                refresh_mrp_orders(st.session_state["data_produksi"], [str(row['Order ID'])])
+                                            st.success(f"✅ Order {row['Order ID']} berhasil dihapus!")
+                                            del st.session_state[f"confirm_delete_{idx}"]
+                                            st.rerun()
+                                        else:
+                                            st.session_state[f"confirm_delete_{idx}"] = True
+                                            st.warning("⚠️ Klik sekali lagi untuk konfirmasi hapus!")
+                                            st.rerun()
+                
+                # Check if in edit mode for any order
+                if st.session_state.get("edit_order_mode", False) and "edit_order_index" in st.session_state:
+                    edit_idx = st.session_state["edit_order_index"]
+                    edit_row = st.session_state["data_produksi"].loc[edit_idx]
+                    
+                    st.markdown("---")
+                    st.markdown("## ✏️ EDIT ORDER")
+                    st.markdown(f"### Editing: {edit_row['Order ID']} - {edit_row['Produk']}")
+                    
+                    with st.form("edit_order_form"):
+                        col_edit1, col_edit2, col_edit3 = st.columns(3)
+                        
+                        with col_edit1:
+                            st.markdown("**📦 Order Information**")
+                            edit_buyer = st.selectbox("Buyer", get_buyer_names(), 
+                                                     index=get_buyer_names().index(edit_row['Buyer']) if edit_row['Buyer'] in get_buyer_names() else 0,
+                                                     key="edit_buyer")
+                            edit_produk = st.text_input("Nama Produk", value=edit_row['Produk'], key="edit_produk")
+                            edit_qty = st.number_input("Quantity (pcs)", min_value=1, value=int(edit_row['Qty']), key="edit_qty")
+                            edit_due_date = st.date_input("Due Date", value=edit_row['Due Date'], key="edit_due_date")
+                            edit_prioritas = st.selectbox("Prioritas", ["High", "Medium", "Low"],
+                                                         index=["High", "Medium", "Low"].index(edit_row['Prioritas']) if edit_row['Prioritas'] in ["High", "Medium", "Low"] else 0,
+                                                         key="edit_prioritas")
+                        
+                        with col_edit2:
+                            st.markdown("**🔧 Specifications**")
+                            edit_material = st.text_input("Material", value=edit_row.get('Material', ''), key="edit_material")
+                            edit_finishing = st.text_input("Finishing", value=edit_row.get('Finishing', ''), key="edit_finishing")
+                            edit_description = st.text_area("Description", value=edit_row.get('Description', ''), height=100, key="edit_description")
+                            
+                            st.markdown("**Product Size (cm)**")
+                            col_ps1, col_ps2, col_ps3 = st.columns(3)
+                            with col_ps1:
+                                edit_prod_p = st.number_input("P", min_value=0.0, value=float(edit_row.get('Product Size P', 0)), step=0.1, key="edit_prod_p")
+                            with col_ps2:
+                                edit_prod_l = st.number_input("L", min_value=0.0, value=float(edit_row.get('Product Size L', 0)), step=0.1, key="edit_prod_l")
+                            with col_ps3:
+                                edit_prod_t = st.number_input("T", min_value=0.0, value=float(edit_row.get('Product Size T', 0)), step=0.1, key="edit_prod_t")
+                        
+                        with col_edit3:
+                            st.markdown("**📦 Packing Information**")
+                            st.markdown("**Packing Size (cm)**")
+                            col_pack1, col_pack2, col_pack3 = st.columns(3)
+                            with col_pack1:
+                                edit_pack_p = st.number_input("P", min_value=0.0, value=float(edit_row.get('Packing Size P', 0)), step=0.1, key="edit_pack_p")
+                            with col_pack2:
+                                edit_pack_l = st.number_input("L", min_value=0.0, value=float(edit_row.get('Packing Size L', 0)), step=0.1, key="edit_pack_l")
+                            with col_pack3:
+                                edit_pack_t = st.number_input("T", min_value=0.0, value=float(edit_row.get('Packing Size T', 0)), step=0.1, key="edit_pack_t")
+                            
+                            # Calculate new CBM
+                            new_cbm_per_pcs = calculate_cbm(edit_pack_p, edit_pack_l, edit_pack_t)
+                            new_total_cbm = new_cbm_per_pcs * edit_qty
+                            st.info(f"CBM per Pcs: {new_cbm_per_pcs:.6f} m³")
+                            st.info(f"Total CBM: {new_total_cbm:.4f} m³")
+                            
+                            edit_keterangan = st.text_area("Keterangan", value=edit_row.get('Keterangan', ''), height=80, key="edit_keterangan")
+                        
+                        col_submit1, col_submit2 = st.columns(2)
+                        with col_submit1:
+                            submit_edit = st.form_submit_button("💾 Simpan Perubahan", use_container_width=True, type="primary")
+                        with col_submit2:
+                            cancel_edit = st.form_submit_button("❌ Batal", use_container_width=True, type="secondary")
+                        
+                        if submit_edit:
+                            # Update the order data
+                            st.session_state["data_produksi"].at[edit_idx, "Buyer"] = edit_buyer
+                            st.session_state["data_produksi"].at[edit_idx, "Produk"] = edit_produk
+                            st.session_state["data_produksi"].at[edit_idx, "Qty"] = edit_qty
+                            st.session_state["data_produksi"].at[edit_idx, "Due Date"] = edit_due_date
+                            st.session_state["data_produksi"].at[edit_idx, "Prioritas"] = edit_prioritas
+                            st.session_state["data_produksi"].at[edit_idx, "Material"] = edit_material
+                            st.session_state["data_produksi"].at[edit_idx, "Finishing"] = edit_finishing
+                            st.session_state["data_produksi"].at[edit_idx, "Description"] = edit_description
+                            st.session_state["data_produksi"].at[edit_idx, "Product Size P"] = edit_prod_p
+                            st.session_state["data_produksi"].at[edit_idx, "Product Size L"] = edit_prod_l
+                            st.session_state["data_produksi"].at[edit_idx, "Product Size T"] = edit_prod_t
+                            st.session_state["data_produksi"].at[edit_idx, "Packing Size P"] = edit_pack_p
+                            st.session_state["data_produksi"].at[edit_idx, "Packing Size L"] = edit_pack_l
+                            st.session_state["data_produksi"].at[edit_idx, "Packing Size T"] = edit_pack_t
+                            st.session_state["data_produksi"].at[edit_idx, "CBM per Pcs"] = new_cbm_per_pcs
+                            st.session_state["data_produksi"].at[edit_idx, "Total CBM"] = new_total_cbm
+                            st.session_state["data_produksi"].at[edit_idx, "Keterangan"] = edit_keterangan
+                            
+                            # Add history entry
+                            try:
+                                history = json.loads(edit_row["History"]) if edit_row["History"] else []
+                            except:
+                                history = []
+                            
+                            history.append(add_history_entry(edit_row['Order ID'], "Order Edited", 
+                                f"Order data updated: Buyer={edit_buyer}, Product={edit_produk}, Qty={edit_qty}"))
+                            st.session_state["data_produksi"].at[edit_idx, "History"] = json.dumps(history)
+                            
+                            if save_data(st.session_state["data_produksi"]):
+                                replan_production_schedule(st.session_state["data_produksi"], [edit_row['Order ID']])
+                                refresh_mrp_orders(st.session_state["data_produksi"], [edit_row['Order ID']])
+                                st.success(f"✅ Order {edit_row['Order ID']} berhasil diupdate!")
+                                st.session_state["edit_order_mode"] = False
+                                del st.session_state["edit_order_index"]
+                                st.rerun()
+                            else:
+                                st.error("Gagal menyimpan perubahan!")
+                        
+                        if cancel_edit:
+                            st.session_state["edit_order_mode"] = False
+                            del st.session_state["edit_order_index"]
+                            st.rerun()
+    else:
+        st.info("📝 Belum ada order yang diinput.")
@@ -0,0 +1,482 @@
+import streamlit as st
+import pandas as pd
+import datetime
+
+from ppic_auth import check_permission
+from ppic_data import (
+    get_products_by_buyer, get_dataset, create_procurement, set_procurement_status, delete_procurement,
+    get_procurement_index, filter_procurement, get_procurement_lines, summarize_procurement
+)
+from ppic_mrp import get_mrp_gross, calculate_net_requirements, build_procurement_suggestion, material_key
+from ppic_supplier import (
+    suggest_supplier, sync_supplier_lines, get_supplier_performance, get_price_trend, get_priced_materials,
+    rank_suppliers, get_lead_time_histogram
+)
+from ppic_inventory import (
+    get_inventory_balances, get_inventory_as_of, get_material_ledger, post_procurement_status, adjust_stock
+)
+
+
+@st.fragment
+def render_item_editor(proc_buyer, proc_nama_produk, proc_tanggal, proc_notes):
+    """Item list procurement baru; tambah/hapus item hanya rerun fragment ini"""
+    st.markdown("#### 📦 Tambah Item Barang")
+    
+    # Properly aligned columns for item input
+    with st.container():
+        col_item1, col_item2, col_item3, col_item4, col_item5 = st.columns([1, 1, 1, 1, 1])
+        
+        with col_item1:
+            item_name = st.text_input("Nama Barang", placeholder="Contoh: Kayu Jati", key="proc_item_name")
+        
+        with col_item2:
+            item_qty_per_pcs = st.number_input("Jumlah per Pcs", min_value=0.0, value=None, format="%.2f", step=1.0, key="proc_item_qty_per", placeholder="0.00")
+        
+        with col_item3:
+            item_qty_total = st.number_input("Jumlah Total", min_value=0.0, value=None, format="%.2f", step=1.0, key="proc_item_qty_total", placeholder="0.00")
+        
+        with col_item4:
+            item_price = st.number_input("Harga per Unit (Rp)", min_value=0, value=None, step=1000, key="proc_item_price", placeholder="0")
+        
+        with col_item5:
+            supplier_names = [supplier.get("name", "") for supplier in get_dataset("suppliers")]
+            suggestion = suggest_supplier(item_name)
+            suggested = suggestion["supplier"] if suggestion and suggestion["supplier"] in supplier_names else ""
+            item_supplier = st.selectbox(
+                "Supplier", [""] + supplier_names,
+                index=([""] + supplier_names).index(suggested),
+                key=f"proc_item_supplier_{material_key(item_name)}"
+            )
+    
+    if suggestion:
+        st.caption(
+            f"💡 Supplier terbaik untuk {item_name}: **{suggestion['supplier']}** — "
+            f"Rp {suggestion['avg_price']:,.0f}/unit, lead time {suggestion['lead_mean']:.1f} hari, "
+            f"on-time {suggestion['on_time_rate']:.0%}"
+        )
+    
+    if st.button("➕ Tambah Item", use_container_width=True, type="primary", key="add_proc_item_btn"):
+        if item_name:
+            item_total_price = item_price * item_qty_total
+            
+            new_item = {
+                "Nama Barang": item_name,
+                "Jumlah per Pcs": item_qty_per_pcs,
+                "Jumlah Total": item_qty_total,
+                "Harga per Unit": item_price,
+                "Harga Total": item_total_price,
+                "supplier": item_supplier
+            }
+            
+            st.session_state["procurement_items"].append(new_item)
+            st.success(f"✅ Item '{item_name}' ditambahkan!")
+            st.rerun(scope="fragment")
+        else:
+            st.warning("⚠️ Nama barang tidak boleh kosong!")
+    
+    if st.session_state["procurement_items"]:
+        st.markdown("---")
+        st.markdown("#### 📋 Daftar Item dalam Procurement Ini")
+        
+        for idx, item in enumerate(st.session_state["procurement_items"]):
+            col_display1, col_display2 = st.columns([4, 1])
+            
+            with col_display1:
+                st.markdown(f"**{idx + 1}. {item['Nama Barang']}**")
+                st.write(f"Jumlah per Pcs: {item['Jumlah per Pcs']:.2f} | Total: {item['Jumlah Total']:.2f} | Harga: Rp {item['Harga per Unit']:,.0f} | **Total: Rp {item['Harga Total']:,.0f}** | Supplier: {item.get('supplier') or '-'}")
+            
+            with col_display2:
+                if st.button("🗑️", key=f"remove_item_{idx}", use_container_width=True):
+                    st.session_state["procurement_items"].pop(idx)
+                    st.rerun(scope="fragment")
+        
+        # Grand Total
+        grand_total = sum([item["Harga Total"] for item in st.session_state["procurement_items"]])
+        st.markdown(f"### 💰 **Total Biaya: Rp {grand_total:,.0f}**")
+        
+        st.markdown("---")
+        
+        col_submit1, col_submit2 = st.columns(2)
+        
+        with col_submit1:
+            if st.button("🗑️ BATAL & HAPUS SEMUA", use_container_width=True, type="secondary"):
+                st.session_state["procurement_items"] = []
+                st.rerun(scope="fragment")
+        
+        with col_submit2:
+            if st.button("📤 SUBMIT PROCUREMENT", use_container_width=True, type="primary"):
+                if proc_nama_produk and proc_buyer and st.session_state["procurement_items"]:
+                    new_procurement = {
+                        "nama_produk": proc_nama_produk,
+                        "buyer": proc_buyer,
+                        "tanggal": str(proc_tanggal),
+                        "notes": proc_notes,
+                        "status": "Open",
+                        "items": st.session_state["procurement_items"].copy(),
+                        "created_at": str(datetime.datetime.now())
+                    }
+                    
+                    try:
+                        saved = create_procurement(new_procurement)
+                    except ValueError as e:
+                        saved = None
+                        st.error(f"❌ {e}")
+                    if saved:
+                        post_procurement_status(saved, None, saved["status"])
+                        st.success(f"✅ Procurement untuk '{proc_nama_produk}' berhasil ditambahkan!")
+                        st.balloons()
+                        st.session_state["procurement_items"] = []
+                        st.rerun()
+                else:
+                    st.warning("⚠️ Harap pilih buyer, nama produk, dan tambahkan minimal 1 item!")
+    else:
+        st.info("📝 Belum ada item yang ditambahkan. Silakan tambah item menggunakan form di atas.")
+
+
+def render_mrp_tab():
+    """Kebutuhan material bersih dari semua order terbuka (BOM x qty yang belum diproduksi)"""
+    st.markdown("### 🧮 Material Requirements Planning")
+    st.caption("Qty order di tahap Pre Order / Order di Supplier × BOM produk, dikurangi stok on-hand dan on-order dari ledger inventory.")
+    
+    df = st.session_state["data_produksi"]
+    if df.empty:
+        st.info("📝 Belum ada order.")
+        return
+    
+    gross = get_mrp_gross(df)
+    bom_products = {product.get("name") for product in get_dataset("products") if product.get("bom")}
+    missing_bom = sorted(set(df.loc[df["Progress"] != "100%", "Produk"]) - bom_products)
+    if missing_bom:
+        st.warning(f"⚠️ {len(missing_bom)} produk order terbuka belum punya BOM (atur di menu Database): {', '.join(missing_bom[:10])}")
+    
+    if gross.empty:
+        st.info("Tidak ada kebutuhan material: semua order sudah lewat tahap material atau produk belum punya BOM.")
+        return
+    
+    balances = get_inventory_balances()
+    net = calculate_net_requirements(gross, on_hand=balances["on_hand"], on_order=balances["on_order"])
+    shortage = net[net["net"] > 0]
+    
+    col_m1, col_m2, col_m3 = st.columns(3)
+    col_m1.metric("🧱 Material Dibutuhkan", len(net))
+    col_m2.metric("⚠️ Material Kurang", len(shortage))
+    col_m3.metric("💰 Estimasi Biaya", f"Rp {shortage['estimated_cost'].sum():,.0f}")
+    
+    st.dataframe(
+        net[["material", "unit", "gross", "on_hand", "on_order", "net", "orders", "price", "estimated_cost"]].rename(columns={
+            "material": "Material", "unit": "Satuan", "gross": "Kebutuhan Kotor", "on_hand": "On Hand",
+            "on_order": "On Order", "net": "Kebutuhan Bersih", "orders": "Order", "price": "Harga/Unit",
+            "estimated_cost": "Estimasi Biaya"
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    with st.expander("📋 Rincian per Order"):
+        st.dataframe(
+            gross[["order_id", "buyer", "product", "material", "unit", "required"]].rename(columns={
+                "order_id": "Order ID", "buyer": "Buyer", "product": "Produk",
+                "material": "Material", "unit": "Satuan", "required": "Kebutuhan"
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    if not shortage.empty:
+        if st.button("🛒 Buat Procurement dari Kebutuhan Bersih", type="primary", use_container_width=True, key="mrp_create_proc"):
+            suggestion = build_procurement_suggestion(net, gross)
+            for item in suggestion["items"]:
+                item["supplier"] = (suggest_supplier(item["Nama Barang"]) or {}).get("supplier", "")
+            try:
+                saved = create_procurement(suggestion)
+            except ValueError as e:
+                saved = None
+                st.error(f"❌ {e}")
+            if saved:
+                post_procurement_status(saved, None, saved["status"])
+                st.success(f"✅ Procurement MRP {saved['id']} dengan {len(saved['items'])} item dibuat (status Open)!")
+                st.rerun()
+    else:
+        st.success("✅ Semua kebutuhan material sudah tertutup stok dan procurement berjalan.")
+
+
+def render_stock_tab():
+    """Saldo material dari ledger inventory (on hand, reserved untuk order, on order)"""
+    st.markdown("### 📦 Stok Material")
+    st.caption("Saldo diperbarui saat procurement diterima dan saat qty order keluar dari tahap Pre Order / Order di Supplier.")
+    
+    balances = get_inventory_balances()
+    col_s1, col_s2, col_s3 = st.columns(3)
+    col_s1.metric("🧱 Material", len(balances))
+    col_s2.metric("⚠️ Stok Kurang", int((balances["available"] < 0).sum()))
+    col_s3.metric("🚚 Material On Order", int((balances["on_order"] > 0).sum()))
+    
+    col_d1, col_d2 = st.columns([1, 3])
+    with col_d1:
+        as_of = st.date_input("Saldo per tanggal", datetime.date.today(), key="inventory_as_of")
+    view = balances if as_of >= datetime.date.today() else get_inventory_as_of(as_of)
+    
+    if view.empty:
+        st.info("📝 Belum ada mutasi stok. Isi BOM produk di Database atau lakukan stock opname di bawah.")
+    else:
+        st.dataframe(
+            view[["material", "unit", "on_hand", "reserved", "available", "on_order"]].rename(columns={
+                "material": "Material", "unit": "Satuan", "on_hand": "On Hand", "reserved": "Reserved",
+                "available": "Available", "on_order": "On Order"
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    with st.expander("🧮 Stock Opname / Riwayat Material"):
+        materials = balances["material"].tolist()
+        col_o1, col_o2 = st.columns(2)
+        with col_o1:
+            selected = st.selectbox("Material", [""] + materials, key="opname_material")
+            new_material = st.text_input("Atau material baru", key="opname_new_material")
+        material = new_material.strip() or selected
+        with col_o2:
+            current = balances.loc[balances["material"] == material, "on_hand"]
+            counted = st.number_input(
+                "Qty fisik (hasil hitung)", min_value=0.0,
+                value=float(current.iloc[0]) if not current.empty else 0.0, step=1.0, key="opname_qty"
+            )
+            if st.button("💾 Simpan Stock Opname", use_container_width=True, disabled=not material):
+                if adjust_stock(material, counted):
+                    st.success(f"✅ Stok {material} disesuaikan menjadi {counted:,.2f}")
+                    st.rerun()
+                else:
+                    st.info("Qty fisik sama dengan saldo, tidak ada perubahan.")
+        
+        if material:
+            ledger = get_material_ledger(material)
+            if ledger:
+                st.dataframe(
+                    pd.DataFrame(ledger)[["timestamp", "type", "on_hand", "reserved", "on_order", "ref"]],
+                    use_container_width=True,
+                    hide_index=True
+                )
+
+
+PROCUREMENT_STATUSES = ["Open", "Ordered", "Received", "Closed"]
+PROCUREMENT_PAGE_SIZE = 20
+
+def render_procurement_list():
+    """Daftar procurement dengan filter (lewat index) dan paging; aksi memakai ID procurement"""
+    store = st.session_state["procurement"]
+    headers = store["headers"]
+    if headers.empty:
+        st.info("📝 Belum ada data procurement. Silakan tambah procurement baru di tab sebelah.")
+        return
+    
+    st.markdown("### 📊 Daftar Procurement")
+    index = get_procurement_index()
+    col_f1, col_f2, col_f3, col_f4 = st.columns(4)
+    with col_f1:
+        filter_buyer = st.selectbox("Buyer", ["Semua"] + sorted(index["buyer"]), key="proc_filter_buyer")
+    with col_f2:
+        filter_product = st.selectbox("Produk", ["Semua"] + sorted(index["nama_produk"]), key="proc_filter_product")
+    with col_f3:
+        filter_status = st.multiselect("Status", PROCUREMENT_STATUSES, key="proc_filter_status")
+    with col_f4:
+        filter_dates = st.date_input("Tanggal", value=(), key="proc_filter_dates")
+    
+    start = filter_dates[0] if len(filter_dates) > 0 else None
+    end = filter_dates[1] if len(filter_dates) > 1 else start
+    filtered = filter_procurement(
+        buyer=None if filter_buyer == "Semua" else filter_buyer,
+        product=None if filter_product == "Semua" else filter_product,
+        statuses=filter_status,
+        start=start,
+        end=end
+    )
+    
+    summary = summarize_procurement(filtered)
+    col_m1, col_m2, col_m3 = st.columns(3)
+    col_m1.metric("🛒 Procurement", len(filtered))
+    col_m2.metric("💰 Total Biaya", f"Rp {filtered['total_cost'].sum():,.0f}")
+    col_m3.metric("⏳ Belum Diterima", f"Rp {summary.reindex(['Open', 'Ordered'])['total_cost'].sum():,.0f}")
+    
+    pages = max((len(filtered) - 1) // PROCUREMENT_PAGE_SIZE + 1, 1)
+    page = st.number_input(f"Halaman (dari {pages})", min_value=1, max_value=pages, value=1, key="proc_page") if pages > 1 else 1
+    page_rows = filtered.iloc[(page - 1) * PROCUREMENT_PAGE_SIZE:page * PROCUREMENT_PAGE_SIZE]
+    
+    for procurement in page_rows.to_dict("records"):
+        proc_id = procurement["id"]
+        proc_status = procurement["status"]
+        
+        with st.expander(
+            f"🛒 {proc_id} - {procurement['nama_produk']} | Status: {proc_status} | Rp {procurement['total_cost']:,.0f}",
+            expanded=False
+        ):
+            st.markdown(f"**Nama Produk:** {procurement['nama_produk']}")
+            st.markdown(f"**Buyer:** {procurement['buyer']}")
+            st.markdown(f"**Tanggal:** {procurement['tanggal']}")
+            st.markdown(f"**Notes:** {procurement['notes'] or '-'}")
+            
+            st.markdown("---")
+            st.markdown("### 📦 Item Barang Setengah Jadi & Aksesoris")
+            
+            if procurement["item_count"]:
+                st.dataframe(
+                    get_procurement_lines(proc_id)[[
+                        "Nama Barang", "Jumlah per Pcs", "Jumlah Total", "Harga per Unit", "Harga Total",
+                        "supplier", "ordered_at", "received_at"
+                    ]],
+                    column_config={
+                        "Harga per Unit": st.column_config.NumberColumn(format="Rp %,d"),
+                        "Harga Total": st.column_config.NumberColumn(format="Rp %,d"),
+                        "supplier": "Supplier",
+                        "ordered_at": "Dipesan",
+                        "received_at": "Diterima"
+                    },
+                    use_container_width=True,
+                    hide_index=True
+                )
+                st.markdown(f"### 💰 **Total Biaya Procurement: Rp {procurement['total_cost']:,.0f}**")
+            else:
+                st.info("Belum ada item dalam procurement ini.")
+            
+            st.markdown("---")
+            
+            # Update Status
+            col_status1, col_status2, col_status3 = st.columns(3)
+            
+            with col_status1:
+                new_status = st.selectbox(
+                    "Update Status",
+                    PROCUREMENT_STATUSES,
+                    index=PROCUREMENT_STATUSES.index(proc_status),
+                    key=f"status_proc_{proc_id}"
+                )
+            
+            with col_status2:
+                if st.button("💾 Update Status", key=f"update_status_{proc_id}", use_container_width=True):
+                    try:
+                        old_status, record = set_procurement_status(proc_id, new_status)
+                    except ValueError as e:
+                        st.error(f"❌ {e}")
+                        st.stop()
+                    if record is None:
+                        st.warning("⚠️ Procurement ini sudah dihapus oleh user lain.")
+                    else:
+                        post_procurement_status(record, old_status, new_status)
+                        sync_supplier_lines(record)
+                        st.success("✅ Status berhasil diupdate!")
+                        st.rerun()
+            
+            with col_status3:
+                if st.button("🗑️ Hapus Procurement", key=f"delete_proc_{proc_id}", use_container_width=True, type="secondary",
+                             disabled=not check_permission("procurement.delete")):
+                    if st.session_state.get(f"confirm_del_proc_{proc_id}", False):
+                        try:
+                            removed = delete_procurement(proc_id)
+                        except ValueError as e:
+                            st.error(f"❌ {e}")
+                            st.stop()
+                        if removed is not None:
+                            post_procurement_status(removed, removed["status"], None)
+                            sync_supplier_lines(removed, deleted=True)
+                        st.success("✅ Procurement berhasil dihapus!")
+                        del st.session_state[f"confirm_del_proc_{proc_id}"]
+                        st.rerun()
+                    else:
+                        st.session_state[f"confirm_del_proc_{proc_id}"] = True
+                        st.warning("⚠️ Klik sekali lagi untuk konfirmasi hapus!")
+                        st.rerun()
+
+
+def render_supplier_tab():
+    """Performa supplier dari agregat (lead time, on-time, tren harga) tanpa scan riwayat"""
+    st.markdown("### 🏭 Performa Supplier")
+    st.caption("Dihitung dari line procurement yang sudah Received: lead time = tanggal diterima - tanggal dipesan.")
+    
+    performance = get_supplier_performance()
+    if performance.empty:
+        st.info("📝 Belum ada line procurement dengan supplier yang sudah diterima.")
+        return
+    
+    st.dataframe(
+        performance,
+        column_config={
+            "supplier": "Supplier",
+            "received_lines": "Line Diterima",
+            "lead_mean": st.column_config.NumberColumn("Lead Rata-rata (hari)", format="%.1f"),
+            "lead_std": st.column_config.NumberColumn("Std Dev", format="%.1f"),
+            "lead_p50": "P50 (hari)",
+            "lead_p90": "P90 (hari)",
+            "on_time_rate": st.column_config.ProgressColumn("On-Time", format="percent", min_value=0, max_value=1),
+            "promised_lead": "Janji Lead (hari)"
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    col_h1, col_h2 = st.columns(2)
+    with col_h1:
+        supplier = st.selectbox("Distribusi lead time", performance["supplier"].tolist(), key="supplier_hist_select")
+        hist = get_lead_time_histogram(supplier)
+        last_day = max((day for day, count in enumerate(hist) if count), default=0)
+        st.bar_chart(pd.DataFrame({"Line": hist[:last_day + 1]}).rename_axis("Hari"))
+    
+    with col_h2:
+        materials = get_priced_materials()
+        if materials:
+            material = st.selectbox("Tren harga material", materials, key="supplier_price_material")
+            trend = get_price_trend(material)
+            st.line_chart(trend.pivot_table(index="month", columns="supplier", values="avg_price"))
+            ranking = rank_suppliers(material)
+            if not ranking.empty:
+                best = ranking.iloc[0]
+                st.success(f"💡 Rekomendasi: **{best['supplier']}** (Rp {best['avg_price']:,.0f}/unit, on-time {best['on_time_rate']:.0%})")
+
+
+# ===== MENU: PROCUREMENT =====
+def render():
+    st.header("🛒 PROCUREMENT MANAGEMENT")
+    st.markdown("### Pembelian Bahan Baku & Aksesoris")
+    
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📋 Daftar Procurement", "➕ Tambah Procurement Baru", "🧮 MRP", "📦 Stok Material", "🏭 Supplier"])
+    with tab1:
+        render_procurement_list()
+    with tab2:
+        st.markdown("### ➕ Buat Procurement Baru")
+        
+        if "procurement_items" not in st.session_state:
+            st.session_state["procurement_items"] = []
+        
+        st.markdown("#### 📋 Informasi Procurement")
+        col_proc1, col_proc2, col_proc3 = st.columns(3)
+        
+        with col_proc1:
+            df = st.session_state["data_produksi"]
+            buyers = df["Buyer"].unique().tolist() if not df.empty else []
+            proc_buyer = st.selectbox("Buyer", [""] + buyers if buyers else [""], key="proc_buyer_select")
+        
+        with col_proc2:
+            if proc_buyer:
+                buyer_products = get_products_by_buyer(proc_buyer)
+                if buyer_products:
+                    proc_nama_produk = st.selectbox("Nama Produk", [""] + buyer_products, key="proc_product_select")
+                else:
+                    st.info("Buyer ini belum punya order")
+                    proc_nama_produk = st.text_input("Nama Produk (Manual)", placeholder="Ketik nama produk", key="proc_product_manual")
+            else:
+                proc_nama_produk = st.text_input("Nama Produk", placeholder="Pilih buyer terlebih dahulu", disabled=True, key="proc_product_disabled")
+        
+        with col_proc3:
+            proc_tanggal = st.date_input("Tanggal Procurement", datetime.date.today())
+        
+        proc_notes = st.text_area("Catatan Procurement", placeholder="Catatan tambahan...", height=50)
+        
+        st.markdown("---")
+        render_item_editor(proc_buyer, proc_nama_produk, proc_tanggal, proc_notes)
+    
+    with tab3:
+        render_mrp_tab()
+    
+    with tab4:
+        render_stock_tab()
+    
+    with tab5:
+        render_supplier_tab()
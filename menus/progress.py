@@ -0,0 +1,234 @@
+import streamlit as st
+import datetime
+import json
+
+from ppic_data import get_tracking_stages, init_tracking_data, add_history_entry, save_data
+from ppic_planning import replan_production_schedule
+from ppic_mrp import refresh_mrp_orders
+
+
+@st.fragment
+def render_order_move(idx, stages_list, stage_to_progress):
+    """Form pindah qty per order; submit/batal hanya rerun fragment order ini"""
+    order_data = st.session_state["data_produksi"].loc[idx]
+    order_id = order_data["Order ID"]
+    
+    st.markdown(f"### 📦 Order: {order_id}")
+    st.info(f"**Buyer:** {order_data['Buyer']} | **Produk:** {order_data['Produk']} | **Qty Total:** {order_data['Qty']} pcs | **Progress:** {order_data['Progress']}")
+    
+    total_order_qty = order_data["Qty"]
+    
+    try:
+        tracking_data = json.loads(order_data["Tracking"])
+        for stage in stages_list:
+            if stage not in tracking_data:
+                tracking_data[stage] = {"qty": 0}
+    except:
+        tracking_data = init_tracking_data()
+        tracking_data[order_data["Proses Saat Ini"]] = {"qty": total_order_qty}
+    
+    st.subheader("📍 Posisi Qty Saat Ini")
+    
+    cols = st.columns(3)
+    col_idx = 0
+    qty_in_progress = 0
+    for stage in stages_list:
+        qty = tracking_data.get(stage, {}).get("qty", 0)
+        if qty > 0:
+            with cols[col_idx % 3]:
+                st.metric(f"**{stage}**", f"{qty} pcs")
+            col_idx += 1
+            qty_in_progress += qty
+    
+    if qty_in_progress != total_order_qty:
+        st.warning(f"Data Qty tidak sinkron! Qty terlacak: {qty_in_progress}, Total Qty Order: {total_order_qty}")
+    
+    st.markdown("---")
+    st.subheader("🚚 Pindahkan Qty ke Workstation Berikutnya")
+    
+    stages_with_qty = [stage for stage, data in tracking_data.items() if data.get("qty", 0) > 0]
+    
+    if not stages_with_qty:
+        st.warning("Semua Qty sudah 'Selesai' atau belum ada Qty di workstation manapun.")
+    else:
+        # Aligned form columns with proper spacing
+        with st.container():
+            col1, col2, col3 = st.columns([1, 1, 1])
+            
+            with col1:
+                from_stage = st.selectbox("Pindahkan DARI", stages_with_qty, key=f"from_stage_{order_id}")
+            
+            try:
+                from_stage_index = stages_list.index(from_stage)
+                if from_stage_index < len(stages_list) - 1:
+                    to_stage = stages_list[from_stage_index + 1]
+                else:
+                    to_stage = from_stage
+            except:
+                to_stage = stages_list[0]
+            
+            with col2:
+                max_qty_available = tracking_data.get(from_stage, {}).get("qty", 0)
+                qty_to_move = st.number_input(
+                    f"Jumlah Qty (Max: {max_qty_available})", 
+                    min_value=1, 
+                    max_value=max_qty_available, 
+                    value=max_qty_available,
+                    key=f"qty_move_{order_id}"
+                )
+            
+            with col3:
+                st.markdown("**Pindahkan KE:**")
+                if to_stage != from_stage:
+                    st.info(f"**{to_stage}**")
+                else:
+                    st.info("Sudah di workstation terakhir")
+
+        notes = st.text_area("Catatan Update (Opsional)", placeholder="Misal: 5 pcs selesai...", key=f"notes_{order_id}")
+        
+        confirm_key = f"confirm_move_{order_id}"
+        
+        if st.session_state.get(confirm_key, False):
+            st.warning(f"⚠️ KONFIRMASI: Anda akan memindahkan **{qty_to_move} pcs** dari **{from_stage}** ke **{to_stage}**. Pastikan sudah benar!")
+            
+            col_confirm1, col_confirm2 = st.columns(2)
+            
+            with col_confirm1:
+                if st.button("✅ YA, PINDAHKAN", type="primary", use_container_width=True, key=f"yes_move_{order_id}"):
+                    if not to_stage or not from_stage or to_stage == from_stage:
+                        st.error("Tidak dapat memindahkan Qty!")
+                        st.session_state[confirm_key] = False
+                    else:
+                        tracking_data[from_stage]["qty"] -= qty_to_move
+                        tracking_data[to_stage]["qty"] += qty_to_move
+                        
+                        new_proses_saat_ini = "Selesai"
+                        for stage in stages_list:
+                            if tracking_data.get(stage, {}).get("qty", 0) > 0:
+                                new_proses_saat_ini = stage
+                                break
+                        
+                        total_progress_score = 0
+                        for stage, data in tracking_data.items():
+                            qty_in_stage = data.get("qty", 0)
+                            progress_per_stage = stage_to_progress.get(stage, 0)
+                            total_progress_score += (qty_in_stage * progress_per_stage)
+                        
+                        if total_order_qty > 0:
+                            new_progress_percent = total_progress_score / total_order_qty
+                        else:
+                            new_progress_percent = 0
+
+                        if tracking_data["Pengiriman"]["qty"] == total_order_qty:
+                            new_progress_percent = 100
+                            new_proses_saat_ini = "Pengiriman"
+
+                        try:
+                            history = json.loads(order_data["History"]) if order_data["History"] else []
+                        except:
+                            history = []
+                        
+                        update_details = f"Memindahkan {qty_to_move} pcs dari {from_stage} ke {to_stage}. "
+                        update_details += f"Progress baru: {new_progress_percent:.0f}%, "
+                        update_details += f"Proses utama: {new_proses_saat_ini}"
+                        if notes:
+                            update_details += f", Note: {notes}"
+                        
+                        history.append(add_history_entry(order_id, "Partial Qty Moved", update_details))
+                        
+                        st.session_state["data_produksi"].at[idx, "Tracking"] = json.dumps(tracking_data)
+                        st.session_state["data_produksi"].at[idx, "Proses Saat Ini"] = new_proses_saat_ini
+                        st.session_state["data_produksi"].at[idx, "Progress"] = f"{new_progress_percent:.0f}%"
+                        st.session_state["data_produksi"].at[idx, "History"] = json.dumps(history)
+
+                        if notes:
+                            current_keterangan = str(order_data["Keterangan"]) if order_data["Keterangan"] else ""
+                            new_keterangan = f"{current_keterangan}\n[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}] {notes}".strip()
+                            st.session_state["data_produksi"].at[idx, "Keterangan"] = new_keterangan
+                        
+                        if save_data(st.session_state["data_produksi"]):
+                            replan_production_schedule(st.session_state["data_produksi"], [order_id])
+                            refresh_mrp_orders(st.session_state["data_produksi"], [order_id])
+                            st.success(f"✅ Berhasil memindahkan {qty_to_move} pcs dari {from_stage} ke {to_stage}!")
+                            st.balloons()
+                            st.session_state[confirm_key] = False
+                            st.rerun(scope="fragment")
+                        else:
+                            st.error("Gagal menyimpan data!")
+                            st.session_state[confirm_key] = False
+            
+            with col_confirm2:
+                if st.button("❌ BATAL", type="secondary", use_container_width=True, key=f"cancel_move_{order_id}"):
+                    st.session_state[confirm_key] = False
+                    st.rerun(scope="fragment")
+        else:
+            if st.button("💾 Pindahkan Qty", type="primary", use_container_width=True, key=f"submit_move_{order_id}"):
+                st.session_state[confirm_key] = True
+                st.rerun(scope="fragment")
+
+
+def render():
+    st.header("⚙️ UPDATE PROGRESS PRODUKSI")
+    
+    df = st.session_state["data_produksi"]
+    
+    if df.empty:
+        st.warning("📝 Belum ada order untuk diupdate.")
+    else:
+        st.markdown("### 📦 Pilih Order untuk Update")
+        
+        col_select1, col_select2 = st.columns(2)
+        
+        with col_select1:
+            buyers_list = ["-- Pilih Buyer --"] + sorted(df["Buyer"].unique().tolist())
+            selected_buyer = st.selectbox("1️⃣ Pilih Buyer", buyers_list, key="progress_select_buyer")
+        
+        with col_select2:
+            if selected_buyer and selected_buyer != "-- Pilih Buyer --":
+                buyer_df = df[df["Buyer"] == selected_buyer]
+                products_list = ["-- Pilih Produk --"] + sorted(buyer_df["Produk"].unique().tolist())
+                selected_product = st.selectbox("2️⃣ Pilih Produk", products_list, key="progress_select_product")
+            else:
+                st.selectbox("2️⃣ Pilih Produk", ["-- Pilih Buyer Terlebih Dahulu --"], disabled=True, key="progress_select_product_disabled")
+                selected_product = None
+        
+        st.markdown("---")
+        
+        if selected_buyer and selected_buyer != "-- Pilih Buyer --" and selected_product and selected_product != "-- Pilih Produk --":
+            df_filtered = df[(df["Buyer"] == selected_buyer) & (df["Produk"] == selected_product)]
+            
+            if df_filtered.empty:
+                st.warning("⚠️ Tidak ada order yang sesuai dengan pilihan Anda.")
+            else:
+                stage_to_progress = {
+                    "Pre Order": 0, "Order di Supplier": 10, "Warehouse": 20,
+                    "Fitting 1": 30, "Amplas": 40, "Revisi 1": 50,
+                    "Spray": 60, "Fitting 2": 70, "Revisi Fitting 2": 80,
+                    "Packaging": 90, "Pengiriman": 100
+                }
+                stages_list = get_tracking_stages()
+            
+                for order_idx_in_filtered, (idx, order_data) in enumerate(df_filtered.iterrows()):
+                    order_id = order_data["Order ID"]
+                    
+                    # CHECK IF FROZEN - TAMBAHKAN INI
+                    is_frozen = order_data.get("Is Frozen", False)
+                    
+                    if is_frozen:
+                        st.error(f"🔒 **Order {order_id} is FROZEN!**")
+                        st.warning(f"⚠️ This order has been locked by Owner and cannot be modified.")
+                        st.info(f"**Frozen Reason:** {order_data.get('Frozen Reason', 'No reason provided')}")
+                        st.info(f"**Frozen By:** {order_data.get('Frozen By', 'Owner')} on {order_data.get('Frozen At', 'N/A')}")
+                        st.markdown("---")
+                        continue  # Skip this frozen order
+                            
+                stage_to_progress = {
+                    "Pre Order": 0, "Order di Supplier": 10, "Warehouse": 20,
+                    "Fitting 1": 30, "Amplas": 40, "Revisi 1": 50,
+                    "Spray": 60, "Fitting 2": 70, "Revisi Fitting 2": 80,
+                    "Packaging": 90, "Pengiriman": 100
+                }
+                stages_list = get_tracking_stages()
+
+                for idx in df_filtered.index:
+                    render_order_move(idx, stages_list, stage_to_progress)
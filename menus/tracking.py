@@ -0,0 +1,144 @@
+import streamlit as st
+import pandas as pd
+import datetime
+import json
+
+from ppic_data import get_tracking_status_from_progress, get_tracking_stages
+
+
+# ===== MENU: TRACKING PRODUKSI =====
+def render():
+    st.header("🔍 TRACKING PRODUKSI PER WORKSTATION")
+    
+    df = st.session_state["data_produksi"]
+    
+    if not df.empty:
+        # st.markdown("""
+        # <div style='background-color: #1E3A8A; padding: 15px; border-radius: 8px; margin-bottom: 25px;'>
+        #     <h3 style='color: white; text-align: center; margin: 0;'>📋 STATUS TRACKING PER TAHAPAN</h3>
+        # </div>
+        # """, unsafe_allow_html=True)
+        
+        track_col1, track_col2 = st.columns(2)
+        with track_col1:
+            filter_track_buyer = st.multiselect("Filter Buyer", df["Buyer"].unique().tolist(), key="track_buyer_filter")
+        with track_col2:
+            search_track_order = st.text_input("🔍 Cari Order ID", key="track_search")
+        
+        df_track_filtered = df.copy()
+        if filter_track_buyer:
+            df_track_filtered = df_track_filtered[df_track_filtered["Buyer"].isin(filter_track_buyer)]
+        if search_track_order:
+            df_track_filtered = df_track_filtered[df_track_filtered["Order ID"].str.contains(search_track_order, case=False, na=False)]
+        
+        st.markdown("---")
+        
+        sum_col1, sum_col2, sum_col3, sum_col4 = st.columns(4)
+        
+        total_orders_filtered = len(df_track_filtered)
+        pending_count = 0
+        ongoing_count = 0
+        done_count = 0
+        
+        for idx, row in df_track_filtered.iterrows():
+            tracking_status = get_tracking_status_from_progress(row['Progress'])
+            if tracking_status == "Pending":
+                pending_count += 1
+            elif tracking_status == "On Going":
+                ongoing_count += 1
+            elif tracking_status == "Done":
+                done_count += 1
+        
+        sum_col1.metric("📦 Total Orders", total_orders_filtered)
+        sum_col2.metric("⏳ Pending", pending_count)
+        sum_col3.metric("🔄 On Going", ongoing_count)
+        sum_col4.metric("✅ Done", done_count)
+        
+        st.markdown("---")
+        
+        st.subheader("📋 Workstation WIP (Work in Progress)")
+        today = datetime.date.today()
+
+        stages = get_tracking_stages()
+        
+        stage_wip_data = {stage: {"total_qty": 0, "orders": []} for stage in stages}
+        
+        for idx, row in df_track_filtered.iterrows():
+            try:
+                tracking_data = json.loads(row["Tracking"])
+                if not tracking_data:
+                    raise ValueError("Tracking data is empty")
+                    
+                for stage in stages:
+                    qty_in_stage = tracking_data.get(stage, {}).get("qty", 0)
+                    if qty_in_stage > 0:
+                        stage_wip_data[stage]["total_qty"] += qty_in_stage
+                        stage_wip_data[stage]["orders"].append((row, qty_in_stage))
+            except:
+                current_stage = row["Proses Saat Ini"]
+                if current_stage in stage_wip_data:
+                    if get_tracking_status_from_progress(row['Progress']) != "Done":
+                        stage_wip_data[current_stage]["total_qty"] += row["Qty"]
+                        stage_wip_data[current_stage]["orders"].append((row, row["Qty"]))
+
+        cumulative_qty = 0
+        for stage_index, stage in enumerate(stages):
+            data = stage_wip_data[stage]
+            qty_at_this_stage = data["total_qty"]
+            order_count_at_stage = len(data["orders"])
+
+            cumulative_qty += qty_at_this_stage
+            
+            st.markdown(f"### {stage_index + 1}. {stage}")
+            
+            metric_col1, metric_col2 = st.columns(2)
+            metric_col1.metric(f"Qty di Tahap Ini", f"{qty_at_this_stage:,} pcs")
+            metric_col2.metric("Total WIP (Kumulatif)", f"{cumulative_qty:,} pcs")
+            
+            with st.expander(f"Lihat {order_count_at_stage} order di tahap '{stage}'", expanded=False):
+                if order_count_at_stage > 0:
+                    sorted_orders = sorted(data["orders"], key=lambda x: x[0]["Due Date"])
+                    
+                    for order_row, qty_in_stage in sorted_orders:
+                        row = order_row
+                        st.markdown(f"**{row['Order ID']}** - {row['Produk']}")
+                        
+                        det_col1, det_col2, det_col3 = st.columns(3)
+                        det_col1.write(f"**Buyer:** {row['Buyer']}")
+                        det_col2.write(f"**Qty di Tahap Ini:** {qty_in_stage} / {row['Qty']} pcs")
+                        
+                       # FIX: Ensure due_date is datetime.date for comparison
+                        due_date_raw = row['Due Date']
+                        if isinstance(due_date_raw, pd.Timestamp):
+                            due_date = due_date_raw.date()
+                        elif isinstance(due_date_raw, str):
+                            due_date = pd.to_datetime(due_date_raw).date()
+                        else:
+                            due_date = due_date_raw
+                        
+                        days_until_due = (due_date - today).days
+                        if days_until_due < 0:
+                            date_color = "#EF4444"; date_icon = "🔴"
+                        elif days_until_due <= 7:
+                            date_color = "#F59E0B"; date_icon = "🟡"
+                        else:
+                            date_color = "#10B981"; date_icon = "🟢"
+                        det_col3.markdown(f"**Due:** <span style='color: {date_color};'>{date_icon} {str(due_date)}</span>", unsafe_allow_html=True)
+                        
+                        st.progress(int(row['Progress'].rstrip('%')) / 100)
+                        
+                        # Get original index from dataframe
+                        original_idx = df_track_filtered[df_track_filtered['Order ID'] == row['Order ID']].index[0]
+                        
+                        if st.button("⚙️ Update Progress", key=f"track_edit_{row['Order ID']}_{stage}", use_container_width=True, type="secondary"):
+                            st.session_state["edit_order_idx"] = original_idx
+                            st.session_state["menu"] = "Progress"
+                            st.rerun()
+                            
+                        st.divider()
+                else:
+                    st.write(f"Tidak ada Qty di tahap {stage}.")
+            
+    
+    else:
+        st.info("📝 Belum ada order untuk di-tracking.")
@@ -0,0 +1,409 @@
+import streamlit as st
+import pandas as pd
+import json
+import os
+import hashlib
+
+from ppic_config import USERS_DB_PATH, ROLE_PERMISSIONS_PATH
+from ppic_data import atomic_write_json
+
+# ===== USER AUTHENTICATION SYSTEM =====
+PASSWORD_HASH_ALGORITHM = "pbkdf2_sha256"
+PASSWORD_HASH_ITERATIONS = 260000
+LOGIN_MAX_ATTEMPTS = 5
+LOGIN_LOCKOUT_SECONDS = 60
+
+@st.cache_resource
+def get_auth_state():
+    """Shared auth state for all sessions: cached user store and login attempts"""
+    import threading
+    return {"lock": threading.Lock(), "users": None, "mtime": None, "attempts": {}}
+
+def hash_password(password, salt=None, iterations=PASSWORD_HASH_ITERATIONS):
+    """Hash password dengan PBKDF2-SHA256 + salt (format: algoritma$iterasi$salt$hash)"""
+    if salt is None:
+        salt = os.urandom(16).hex()
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), iterations).hex()
+    return f"{PASSWORD_HASH_ALGORITHM}${iterations}${salt}${digest}"
+
+def verify_password(password, stored_hash):
+    """Verify password - returns (valid, needs_rehash). Legacy unsalted SHA256 hashes are still accepted."""
+    import hmac
+    
+    if stored_hash.startswith(PASSWORD_HASH_ALGORITHM + "$"):
+        try:
+            _, iterations, salt, _ = stored_hash.split("$")
+            iterations = int(iterations)
+            candidate = hash_password(password, salt, iterations)
+        except ValueError:
+            return False, False
+        return hmac.compare_digest(candidate, stored_hash), iterations < PASSWORD_HASH_ITERATIONS
+    
+    legacy_hash = hashlib.sha256(password.encode()).hexdigest()
+    return hmac.compare_digest(legacy_hash, stored_hash), True
+
+def get_default_users():
+    return {
+        "owner": {
+            "password": hash_password("owner123"),
+            "role": "owner",
+            "name": "Owner"
+        },
+        "mandor": {
+            "password": hash_password("mandor123"),
+            "role": "mandor",
+            "name": "Mandor Operasional"
+        },
+        "procurement": {
+            "password": hash_password("procurement123"),
+            "role": "procurement",
+            "name": "Admin Procurement"
+        },
+        "admin": {
+            "password": hash_password("admin123"),
+            "role": "admin",
+            "name": "Admin"
+        }
+    }
+
+def load_users():
+    """Load users dari database (cached, dibaca ulang hanya jika file berubah).
+    Raises ValueError when users.json exists but cannot be read: never fall back to the default passwords."""
+    auth_state = get_auth_state()
+    with auth_state["lock"]:
+        try:
+            mtime = os.path.getmtime(USERS_DB_PATH)
+        except OSError:
+            mtime = None
+        
+        if mtime is not None and auth_state["users"] is not None and auth_state["mtime"] == mtime:
+            return auth_state["users"]
+        
+        if mtime is not None:
+            try:
+                with open(USERS_DB_PATH, 'r', encoding='utf-8') as f:
+                    users = json.load(f)
+            except (OSError, ValueError) as e:
+                raise ValueError(f"{USERS_DB_PATH} tidak bisa dibaca ({e})") from e
+            if not isinstance(users, dict):
+                raise ValueError(f"{USERS_DB_PATH} memakai format yang tidak dikenal")
+            auth_state["users"] = users
+            auth_state["mtime"] = mtime
+            return users
+    
+    # Default users (file belum ada)
+    default_users = get_default_users()
+    save_users(default_users)
+    return default_users
+
+def save_users(users_data):
+    """Save users ke database (tmp file + os.replace, file lama tetap utuh jika gagal)"""
+    auth_state = get_auth_state()
+    with auth_state["lock"]:
+        try:
+            atomic_write_json(USERS_DB_PATH, users_data)
+            auth_state["users"] = users_data
+            auth_state["mtime"] = os.path.getmtime(USERS_DB_PATH)
+            return True
+        except:
+            return False
+
+def get_login_lockout_remaining(username):
+    """Seconds until username may try again (0 = not locked)"""
+    auth_state = get_auth_state()
+    with auth_state["lock"]:
+        attempt = auth_state["attempts"].get(username)
+        if not attempt:
+            return 0
+        import time
+        return max(0, int(attempt["locked_until"] - time.time()))
+
+def _register_failed_login(username):
+    import time
+    auth_state = get_auth_state()
+    with auth_state["lock"]:
+        attempt = auth_state["attempts"].setdefault(username, {"count": 0, "locked_until": 0})
+        attempt["count"] += 1
+        if attempt["count"] >= LOGIN_MAX_ATTEMPTS:
+            attempt["count"] = 0
+            attempt["locked_until"] = time.time() + LOGIN_LOCKOUT_SECONDS
+
+def authenticate(username, password):
+    """Authenticate user"""
+    if get_login_lockout_remaining(username) > 0:
+        return False, None, None
+    
+    users = load_users()
+    user = users.get(username)
+    if user:
+        valid, needs_rehash = verify_password(password, user["password"])
+        if valid:
+            get_auth_state()["attempts"].pop(username, None)
+            if needs_rehash:
+                updated_users = {**users, username: {**user, "password": hash_password(password)}}
+                save_users(updated_users)
+            return True, user["role"], user["name"]
+    
+    _register_failed_login(username)
+    return False, None, None
+
+# ===== ROLE PERMISSIONS =====
+MENU_CAPABILITIES = [
+    "Dashboard", "Input", "Orders", "Procurement", "Progress", "Tracking",
+    "Frozen", "Container", "Absensi", "Analytics", "Gantt", "Database"
+]
+ACTION_CAPABILITIES = {
+    "order.edit": "Edit order",
+    "order.delete": "Hapus order",
+    "procurement.delete": "Hapus procurement"
+}
+
+# Default role -> capability table; "*" = semua menu dan aksi.
+# Bisa ditimpa per role lewat role_permissions.json dengan format yang sama.
+DEFAULT_ROLE_PERMISSIONS = {
+    "owner": ["Dashboard", "Orders", "Tracking", "Frozen", "Container", "Database", "Analytics", "Gantt",
+              "order.edit", "order.delete"],
+    "mandor": ["Dashboard", "Progress", "Tracking", "Absensi"],
+    "procurement": ["Dashboard", "Database", "Input", "Procurement", "Absensi", "procurement.delete"],
+    "admin": ["*"]
+}
+
+@st.cache_resource
+def compile_permission_matrix(config_mtime):
+    """Compile role table into {role: frozenset(capabilities)}; cached until the config file changes"""
+    role_permissions = dict(DEFAULT_ROLE_PERMISSIONS)
+    if config_mtime is not None:
+        try:
+            with open(ROLE_PERMISSIONS_PATH, 'r', encoding='utf-8') as f:
+                role_permissions.update(json.load(f))
+        except:
+            pass
+    
+    all_capabilities = frozenset(MENU_CAPABILITIES) | frozenset(ACTION_CAPABILITIES)
+    return {
+        role: all_capabilities if "*" in capabilities else frozenset(capabilities)
+        for role, capabilities in role_permissions.items()
+    }
+
+def get_permission_matrix():
+    try:
+        config_mtime = os.path.getmtime(ROLE_PERMISSIONS_PATH)
+    except OSError:
+        config_mtime = None
+    return compile_permission_matrix(config_mtime)
+
+def get_user_capabilities():
+    """Capabilities of the logged-in user, resolved once per session and role"""
+    user_role = st.session_state.get("user_role")
+    resolved = st.session_state.get("resolved_capabilities")
+    if resolved is None or resolved[0] != user_role:
+        resolved = (user_role, get_permission_matrix().get(user_role, frozenset()))
+        st.session_state["resolved_capabilities"] = resolved
+    return resolved[1]
+
+def check_permission(required_role):
+    """Check if current user has permission for a menu or action"""
+    return required_role in get_user_capabilities()
+
+def get_permission_audit():
+    """Role x capability table (menus and actions) for auditing"""
+    matrix = get_permission_matrix()
+    capabilities = MENU_CAPABILITIES + list(ACTION_CAPABILITIES)
+    audit = pd.DataFrame(
+        [["✅" if capability in matrix[role] else "—" for role in matrix] for capability in capabilities],
+        index=[ACTION_CAPABILITIES.get(capability, capability) for capability in capabilities],
+        columns=[get_role_display_name(role) for role in matrix]
+    )
+    audit.index.name = "Menu / Aksi"
+    return audit
+
+def get_role_display_name(role):
+    """Get display name for role"""
+    role_names = {
+        "owner": "👔 Owner",
+        "mandor": "⚙️ Mandor Operasional",
+        "procurement": "🛒 Admin Procurement",
+        "admin": "👨‍💼 Administrator"
+    }
+    return role_names.get(role, role)
+
+# ===== LOGIN PAGE =====
+def show_login_page():
+    st.markdown("""
+    <style>
+    /* Clean background */
+    .main {
+        background-color: #F8F9FA;
+    }
+    
+    /* Simple centered card */
+    .login-card {
+        max-width: 420px;
+        margin: 80px auto;
+        padding: 40px;
+        background: white;
+        border-radius: 12px;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+    }
+    
+    /* Simple title */
+    .login-title {
+        color: #1F2937;
+        text-align: center;
+        font-size: 1.8rem;
+        margin-bottom: 8px;
+        font-weight: 600;
+    }
+    
+    .login-subtitle {
+        color: #6B7280;
+        text-align: center;
+        font-size: 0.95rem;
+        margin-bottom: 35px;
+    }
+    
+    /* Input fields - simple and clean */
+    .stTextInput > div > div > input {
+        background-color: #F9FAFB !important;
+        border: 1.5px solid #E5E7EB !important;
+        border-radius: 8px !important;
+        padding: 11px 14px !important;
+        font-size: 0.95rem !important;
+        color: #1F2937 !important;
+        transition: all 0.2s ease;
+    }
+    
+    .stTextInput > div > div > input:focus {
+        border-color: #3B82F6 !important;
+        box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1) !important;
+        background-color: white !important;
+    }
+    
+    .stTextInput > div > div > input::placeholder {
+        color: #9CA3AF !important;
+    }
+    
+    /* Labels */
+    .stTextInput > label {
+        color: #374151 !important;
+        font-weight: 500 !important;
+        font-size: 0.9rem !important;
+        margin-bottom: 6px !important;
+    }
+    
+    /* Login button */
+    .stButton button {
+        background: #3B82F6 !important;
+        color: white !important;
+        font-weight: 600 !important;
+        font-size: 0.95rem !important;
+        padding: 11px !important;
+        border-radius: 8px !important;
+        border: none !important;
+        width: 100% !important;
+        margin-top: 8px !important;
+        transition: all 0.2s ease !important;
+    }
+    
+    .stButton button:hover {
+        background: #2563EB !important;
+        box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3);
+        transform: translateY(-1px);
+    }
+    
+    /* Credentials info box */
+    .credentials-box {
+        background: #F9FAFB;
+        border: 1px solid #E5E7EB;
+        border-radius: 8px;
+        padding: 16px;
+        margin-top: 24px;
+        font-size: 0.85rem;
+    }
+    
+    .credentials-box h4 {
+        color: #374151;
+        font-size: 0.9rem;
+        margin: 0 0 10px 0;
+        font-weight: 600;
+    }
+    
+    .credentials-box div {
+        color: #6B7280;
+        line-height: 1.6;
+        margin: 4px 0;
+    }
+    
+    .credentials-box strong {
+        color: #1F2937;
+        font-weight: 600;
+    }
+    
+    /* Alerts */
+    .stAlert {
+        border-radius: 8px;
+        border: none;
+        font-size: 0.9rem;
+    }
+    
+    /* Remove extra padding */
+    .block-container {
+        padding-top: 2rem !important;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    # Simple centered layout
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        # Header
+        st.markdown('<h1 class="login-title">🏭 PT JAVA CONNECTION</h1>', unsafe_allow_html=True)
+        st.markdown('<p class="login-subtitle">Sistem Pencatatan dan Perencanaan Terintegrasi</p>', unsafe_allow_html=True)
+        
+        # Login form
+        with st.form("login_form"):
+            username = st.text_input(
+                "Username", 
+                placeholder="Masukkan username",
+                key="login_username"
+            )
+            password = st.text_input(
+                "Password", 
+                type="password",
+                placeholder="Masukkan password",
+                key="login_password"
+            )
+            
+            submit = st.form_submit_button("Login", use_container_width=True)
+            
+            if submit:
+                if username and password:
+                    try:
+                        success, role, name = authenticate(username, password)
+                    except ValueError as e:
+                        st.error(f"❌ {e}. Login ditolak sampai file user diperbaiki.")
+                        st.stop()
+                    
+                    if success:
+                        st.session_state["logged_in"] = True
+                        st.session_state["username"] = username
+                        st.session_state["user_role"] = role
+                        st.session_state["user_name"] = name
+                        st.session_state["menu"] = "Dashboard"
+                        st.success(f"✅ Login berhasil! Selamat datang, {name}")
+                        st.rerun()
+                    elif get_login_lockout_remaining(username) > 0:
+                        st.error(f"🔒 Terlalu banyak percobaan login. Coba lagi dalam {get_login_lockout_remaining(username)} detik")
+                    else:
+                        st.error("❌ Username atau password salah")
+                else:
+                    st.warning("⚠️ Harap isi username dan password")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+def logout():
+    """Logout user"""
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+    st.rerun()
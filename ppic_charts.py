@@ -0,0 +1,141 @@
+import streamlit as st
+import numpy as np
+import datetime
+import json
+import plotly.graph_objects as go
+
+from ppic_config import TOTAL_STORAGE_AREA_M2
+from ppic_data import get_data_version
+from ppic_planning import GANTT_PRIORITY_COLORS, get_frozen_intervals, GANTT_ROW_HEIGHT
+
+# ===== FIGURE CACHE =====
+FIGURE_CACHE_MAX_ENTRIES = 24
+
+def get_cached_figure(chart_type, params, build_figure):
+    """Return figure spec (dict) from cache keyed by (chart type, params, data version).
+    build_figure is only called on a cache miss; the figure is stored as serialised JSON."""
+    from collections import OrderedDict
+    
+    cache = st.session_state.get("figure_cache")
+    if cache is None:
+        cache = OrderedDict()
+        st.session_state["figure_cache"] = cache
+    
+    cache_key = (chart_type, params, get_data_version())
+    figure_json = cache.get(cache_key)
+    if figure_json is None:
+        figure_json = build_figure().to_json()
+        cache[cache_key] = figure_json
+        # Evict least recently used figures
+        while len(cache) > FIGURE_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(cache_key)
+    
+    return json.loads(figure_json)
+
+def build_gantt_figure(rows, title="Production Schedule"):
+    """Draw all Gantt rows as one batched bar trace plus one progress overlay trace"""
+    durations_ms = ((rows["Finish"] - rows["Start"]).dt.total_seconds() * 1000).clip(lower=86400000)
+    progress_ms = durations_ms * rows["Progress"].clip(0, 100) / 100
+    starts = rows["Start"].dt.strftime('%Y-%m-%d')
+    colors = rows["Prioritas"].map(GANTT_PRIORITY_COLORS)
+    patterns = rows["Frozen Due"].map({True: "/", False: ""})
+    hover_text = (
+        rows["Task"] + "<br>" + starts + " → " + rows["Finish"].dt.strftime('%Y-%m-%d') +
+        "<br>Priority: " + rows["Prioritas"] + " | Progress: " + rows["Progress"].round(0).astype(int).astype(str) + "%" +
+        "<br>Qty: " + rows["Qty"].astype(int).astype(str) + " pcs | Lines: " + rows["Lines"].astype(str) +
+        rows["Frozen Due"].map({True: "<br>❄️ Due date frozen", False: ""})
+    )
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=rows["Task"],
+        x=durations_ms,
+        base=starts,
+        orientation='h',
+        marker=dict(color=colors, opacity=0.35, pattern=dict(shape=patterns, fgcolor="#1E3A8A")),
+        hovertext=hover_text,
+        hoverinfo="text",
+        name="Schedule"
+    ))
+    fig.add_trace(go.Bar(
+        y=rows["Task"],
+        x=progress_ms,
+        base=starts,
+        orientation='h',
+        width=0.35,
+        marker=dict(color=colors),
+        hoverinfo="skip",
+        name="Progress"
+    ))
+    
+    for start_day, end_day in get_frozen_intervals():
+        fig.add_vrect(
+            x0=start_day, x1=end_day + datetime.timedelta(days=1),
+            fillcolor="#93C5FD", opacity=0.2, line_width=0, layer="below"
+        )
+    
+    fig.add_vline(x=datetime.datetime.combine(datetime.date.today(), datetime.time()).timestamp() * 1000,
+                  line=dict(color="#EF4444", width=2, dash="dash"))
+    
+    fig.update_layout(
+        title=title,
+        barmode='overlay',
+        showlegend=False,
+        height=max(300, len(rows) * GANTT_ROW_HEIGHT + 120),
+        xaxis=dict(type='date', title="Timeline", showgrid=True),
+        yaxis=dict(title="", autorange="reversed", showgrid=True),
+        hovermode='closest',
+        margin=dict(t=50, b=40)
+    )
+    return fig
+
+def build_stage_load_figure(stages, dates, load, capacity):
+    """Heatmap of workstation utilisation; overloaded cells marked"""
+    utilisation = np.divide(load, capacity[:, None], out=np.zeros_like(load), where=capacity[:, None] > 0) * 100
+    cell_text = np.where(utilisation > 100, "⚠️", "")
+    fig = go.Figure(go.Heatmap(
+        z=utilisation,
+        x=dates.strftime('%d/%m'),
+        y=stages,
+        text=cell_text,
+        texttemplate="%{text}",
+        customdata=load,
+        colorscale=[[0, "#DBEAFE"], [0.5, "#3B82F6"], [0.5, "#F59E0B"], [1, "#EF4444"]],
+        zmin=0,
+        zmax=200,
+        colorbar=dict(title="Load %"),
+        hovertemplate="%{y} | %{x}<br>Load: %{customdata:.0f} pcs<br>Utilisasi: %{z:.0f}%<extra></extra>"
+    ))
+    fig.update_layout(
+        height=380,
+        yaxis=dict(autorange="reversed"),
+        xaxis_title="",
+        margin=dict(t=10, b=10)
+    )
+    return fig
+
+def build_storage_trend_figure(snapshots, forecast_dates, forecast_area, start_ts):
+    """Utilisation trend from ledger snapshots plus forecast line"""
+    trend_x = [max(entry["timestamp"], start_ts) for entry in snapshots]
+    trend_y = [entry["total_area"] for entry in snapshots]
+    if snapshots:
+        trend_x.append(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        trend_y.append(trend_y[-1])
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=trend_x, y=trend_y, mode="lines", line_shape="hv",
+                             name="Terpakai (m²)", line=dict(color="#3B82F6", width=2)))
+    fig.add_trace(go.Scatter(x=[str(day) for day in forecast_dates], y=list(forecast_area), mode="lines+markers",
+                             name="Forecast (m²)", line=dict(color="#F59E0B", width=2, dash="dash")))
+    fig.add_hline(y=TOTAL_STORAGE_AREA_M2, line=dict(color="#EF4444", dash="dot"),
+                  annotation_text=f"Kapasitas {TOTAL_STORAGE_AREA_M2:.0f} m²")
+    fig.update_layout(
+        height=320,
+        yaxis_title="Floor Area (m²)",
+        xaxis_title="",
+        legend=dict(orientation="h", y=1.1),
+        margin=dict(t=30, b=10)
+    )
+    return fig
@@ -0,0 +1,98 @@
+# ===== KONFIGURASI DATABASE =====
+DATABASE_PATH = "ppic_data.json"
+BUYER_DB_PATH = "buyers.json"
+PRODUCT_DB_PATH = "products.json"
+SUPPLIER_DB_PATH = "suppliers.json"  # NEW
+PROCUREMENT_DB_PATH = "procurement.json"
+CONTAINER_DB_PATH = "containers.json"
+USERS_DB_PATH = "users.json"
+ROLE_PERMISSIONS_PATH = "role_permissions.json"
+WORKERS_DB_PATH = "workers.json"  # NEW
+ATTENDANCE_DB_PATH = "attendance.json"  # NEW
+FROZEN_DATES_DB_PATH = "frozen_dates.json"
+HOLIDAYS_DB_PATH = "holidays.json"
+ORDER_SEQUENCE_PATH = "order_sequence.json"
+STORAGE_LEDGER_DB_PATH = "storage_ledger.jsonl"
+INVENTORY_DB_PATH = "inventory.json"
+INVENTORY_LEDGER_PATH = "inventory_ledger.jsonl"
+INVENTORY_SNAPSHOTS_PATH = "inventory_snapshots.jsonl"
+SUPPLIER_STATS_PATH = "supplier_stats.json"
+IMAGES_DIR = "product_images"
+THUMBNAILS_DIR = "product_images/thumbs"
+
+# Thumbnail untuk list order/database (2x lebar tampilan agar tajam di layar retina)
+THUMBNAIL_SIZE = (300, 300)
+THUMBNAIL_QUALITY = 85
+
+TOTAL_STORAGE_AREA_M2 = 318.0  # Total storage area in square meters
+MAX_STACK_HEIGHT_CM = 200.0  # Tinggi tumpukan maksimum di lantai storage
+
+# Zona storage (total = TOTAL_STORAGE_AREA_M2) dan tahap yang menempatinya
+STORAGE_ZONES = {
+    "Warehouse": {"area": 80.0, "stages": ["Warehouse"]},
+    "Produksi": {"area": 128.0, "stages": ["Fitting 1", "Amplas", "Revisi 1", "Fitting 2", "Revisi Fitting 2"]},
+    "Spray Booth": {"area": 30.0, "stages": ["Spray"]},
+    "Finished Goods": {"area": 80.0, "stages": ["Packaging"]}
+}
+
+# ===== ORDER ID =====
+ORDER_ID_PREFIX = "ORD"
+ORDER_ID_SCOPE = "global"  # "global" (ORD-2401), "year" (ORD-2025-0001) atau "buyer" (ORD-IKEA-0001)
+ORDER_ID_START = 2400  # Nomor terakhir sebelum sequence dipakai (scope global)
+
+# ===== PAYROLL =====
+DEFAULT_HOURLY_RATE = 10840  # Upah per jam (dasar perhitungan lembur)
+DEFAULT_DAILY_WAGE = 79000  # Upah harian reguler
+REGULAR_HOURS_PER_DAY = 7
+PAYROLL_WEEKMASK = "1111110"  # Senin-Sabtu hari kerja
+
+# Tier lembur per hari: (batas jam kumulatif, pengali); None = sisa jam
+OVERTIME_TIERS = [
+    (1, 1.5),
+    (None, 2.0)
+]
+
+# ===== MRP =====
+MRP_DEMAND_STAGES = ["Pre Order", "Order di Supplier"]  # Qty di tahap ini belum memakai material
+MRP_ON_ORDER_STATUSES = ["Open", "Ordered"]  # Procurement yang dihitung sebagai on-order
+INVENTORY_RECEIVED_STATUSES = ["Received", "Closed"]  # Procurement yang barangnya sudah masuk stok
+INVENTORY_SNAPSHOT_EVERY = 500  # Snapshot saldo tiap N entry ledger (selain snapshot harian)
+INVENTORY_LEDGER_INDEX_SIZE = 200  # Offset entry ledger terbaru yang diingat per material (riwayat di layar stok)
+BOM_UNITS = ["pcs", "m3", "m2", "m", "kg", "liter", "set", "lembar"]
+
+# ===== SUPPLIER PERFORMANCE =====
+SUPPLIER_DEFAULT_LEAD_DAYS = 14  # Janji lead time bila supplier belum punya data
+SUPPLIER_LEAD_TIME_BINS = 60  # Histogram lead time per hari; bin terakhir = >= 60 hari
+SUPPLIER_PRICE_WINDOW_MONTHS = 3  # Harga rata-rata N bulan terakhir untuk rekomendasi
+SUPPLIER_SCORE_WEIGHTS = {"price": 0.5, "lead_time": 0.3, "on_time": 0.2}
+
+# ===== BULK ORDER IMPORT =====
+IMPORT_CHUNK_ROWS = 500  # Baris per chunk saat membaca CSV/XLSX
+IMPORT_DEFAULT_LEAD_DAYS = 30  # Due Date kosong = Order Date + N hari (sama seperti form input)
+IMPORT_PRIORITIES = ["High", "Medium", "Low"]
+
+# ===== EXPORT =====
+EXPORT_DIR = "exports"
+EXPORT_CHUNK_ROWS = 5000  # Baris per chunk saat menulis file export
+EXPORT_MAX_WORKERS = 2  # Thread export bersama untuk semua session
+EXPORT_RETENTION_HOURS = 24  # File export lebih tua dari ini dihapus
+EXPORT_POLL_SECONDS = 2  # Interval cek status job yang masih berjalan
+
+# ===== CONTAINER SPECIFICATIONS =====
+CONTAINER_TYPES = {
+    "20 Feet": {
+        "capacity_cbm": 33.0,
+        "max_weight_kg": 24000,
+        "color": "#3B82F6"
+    },
+    "40 Feet": {
+        "capacity_cbm": 67.0,
+        "max_weight_kg": 30000,
+        "color": "#10B981"
+    },
+    "40 HC (High Cube)": {
+        "capacity_cbm": 76.0,
+        "max_weight_kg": 30000,
+        "color": "#8B5CF6"
+    }
+}
@@ -0,0 +1,967 @@
+import streamlit as st
+import pandas as pd
+import datetime
+import contextlib
+import json
+import os
+import re
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: hanya lock antar-session dalam satu proses
+    fcntl = None
+
+from ppic_config import (
+    DATABASE_PATH, BUYER_DB_PATH, PRODUCT_DB_PATH, PROCUREMENT_DB_PATH, CONTAINER_DB_PATH,
+    WORKERS_DB_PATH, ATTENDANCE_DB_PATH, SUPPLIER_DB_PATH, FROZEN_DATES_DB_PATH,
+    HOLIDAYS_DB_PATH, INVENTORY_DB_PATH, ORDER_SEQUENCE_PATH, ORDER_ID_PREFIX, ORDER_ID_SCOPE, ORDER_ID_START,
+    INVENTORY_RECEIVED_STATUSES
+)
+from ppic_images import store_uploaded_image
+
+# ===== FILE LOCK & ATOMIC WRITE =====
+# Dipakai semua read-modify-write file JSON (order sequence, procurement, inventory, supplier stats)
+_file_locks = {}
+_file_locks_guard = threading.Lock()
+
+@contextlib.contextmanager
+def locked_file(path):
+    """Exclusive lock for a read-modify-write of path: thread lock (sessions in this process) + flock on path.lock"""
+    with _file_locks_guard:
+        thread_lock = _file_locks.setdefault(os.path.abspath(path), threading.Lock())
+    with thread_lock, open(path + ".lock", "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def atomic_write_json(path, data, indent=2):
+    """Write to path.tmp, then os.replace: readers see the old or the new file, never half of one"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+    os.replace(tmp_path, path)
+
+# ===== FUNGSI DATABASE - ENHANCED PRODUCTS =====
+def load_data():
+    if os.path.exists(DATABASE_PATH):
+        try:
+            with open(DATABASE_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                df = pd.DataFrame(data)
+                if not df.empty:
+                    df['Order Date'] = pd.to_datetime(df['Order Date']).dt.date
+                    df['Due Date'] = pd.to_datetime(df['Due Date']).dt.date
+                    if 'History' not in df.columns:
+                        df['History'] = df.apply(lambda x: json.dumps([]), axis=1)
+                    if 'Product CBM' not in df.columns:
+                        df['Product CBM'] = 0.0
+                    if 'Is Knockdown' not in df.columns:
+                        df['Is Knockdown'] = False
+                    if 'Knockdown Pieces' not in df.columns:
+                        df['Knockdown Pieces'] = df.apply(lambda x: json.dumps([]), axis=1)
+                return df
+        except Exception as e:
+            st.error(f"Error loading data: {e}")
+    return pd.DataFrame(columns=[
+        "Order ID", "Order Date", "Buyer", "Produk", "Qty", "Due Date", 
+        "Prioritas", "Progress", "Proses Saat Ini", "Keterangan",
+        "Tracking", "History", "Material", "Finishing", "Description",
+        "Product Size P", "Product Size L", "Product Size T", "Product CBM",
+        "Packing Size P", "Packing Size L", "Packing Size T",
+        "CBM per Pcs", "Total CBM", "Image Path", 
+        "Is Knockdown", "Knockdown Pieces"
+    ])
+
+def get_data_version():
+    """Version counter of order data, bumped on every save"""
+    return st.session_state.get("data_version", 0)
+
+def bump_data_version():
+    st.session_state["data_version"] = get_data_version() + 1
+
+def save_data(df):
+    bump_data_version()
+    try:
+        df_copy = df.copy()
+        df_copy['Order Date'] = df_copy['Order Date'].astype(str)
+        df_copy['Due Date'] = df_copy['Due Date'].astype(str)
+        with open(DATABASE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(df_copy.to_dict('records'), f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        st.error(f"Error saving data: {e}")
+        return False
+    
+    # Data order sudah tersimpan: kegagalan hook turunan tidak membatalkan save
+    from ppic_planning import record_storage_snapshot
+    from ppic_inventory import sync_order_materials
+    for hook_name, hook in (("storage snapshot", record_storage_snapshot), ("inventory material", sync_order_materials)):
+        try:
+            hook(df)
+        except Exception as e:
+            st.warning(f"⚠️ Data tersimpan, tetapi update {hook_name} gagal: {e}")
+    return True
+
+# ===== ORDER ID SEQUENCE =====
+def get_order_id_prefix(order_date=None, buyer=None, scope=ORDER_ID_SCOPE):
+    """Sequence key / Order ID prefix for the configured scope"""
+    if scope == "year":
+        year = order_date.year if order_date else datetime.date.today().year
+        return f"{ORDER_ID_PREFIX}-{year}"
+    if scope == "buyer":
+        code = re.sub(r"[^A-Z0-9]", "", str(buyer or "").upper())[:4] or "GEN"
+        return f"{ORDER_ID_PREFIX}-{code}"
+    return ORDER_ID_PREFIX
+
+def _seed_order_sequence(prefix, scope):
+    """Highest number already used under prefix (one-time scan when a sequence is created)"""
+    df = get_dataset("data_produksi")
+    start = ORDER_ID_START if scope == "global" else 0
+    if df.empty:
+        return start
+    numbers = df["Order ID"].astype(str).str.extract(rf"^{re.escape(prefix)}-(\d+)(?:-P\d+)?$")[0]
+    numbers = pd.to_numeric(numbers, errors="coerce").dropna()
+    return max(int(numbers.max()), start) if not numbers.empty else start
+
+def allocate_order_ids(count, order_date=None, buyer=None, scope=ORDER_ID_SCOPE):
+    """Reserve `count` consecutive Order IDs atomically (thread lock + file lock, atomic replace)"""
+    prefix = get_order_id_prefix(order_date, buyer, scope)
+    with locked_file(ORDER_SEQUENCE_PATH):
+        sequences = {}
+        if os.path.exists(ORDER_SEQUENCE_PATH):
+            with open(ORDER_SEQUENCE_PATH, 'r', encoding='utf-8') as f:
+                sequences = json.load(f)
+        if prefix not in sequences:
+            sequences[prefix] = _seed_order_sequence(prefix, scope)
+        sequences[prefix] += count
+        atomic_write_json(ORDER_SEQUENCE_PATH, sequences)
+
+    numbers = range(sequences[prefix] - count + 1, sequences[prefix] + 1)
+    return [f"{prefix}-{number}" if scope == "global" else f"{prefix}-{number:04d}" for number in numbers]
+
+def allocate_order_id(order_date=None, buyer=None, scope=ORDER_ID_SCOPE):
+    """Reserve the next Order ID"""
+    return allocate_order_ids(1, order_date, buyer, scope)[0]
+
+def load_buyers():
+    if os.path.exists(BUYER_DB_PATH):
+        try:
+            with open(BUYER_DB_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                if data and isinstance(data[0], str):
+                    return [{"name": buyer, "address": "", "contact": "", "profile": ""} for buyer in data]
+                return data
+        except:
+            pass
+    return []
+
+def save_buyers(buyers):
+    try:
+        with open(BUYER_DB_PATH, 'w', encoding='utf-8') as f:
+            json.dump(buyers, f, ensure_ascii=False, indent=2)
+        return True
+    except:
+        return False
+
+def get_buyer_names():
+    buyers = get_dataset("buyers")
+    return [b["name"] for b in buyers]
+
+# ===== PRODUCT CATALOGUE =====
+PRODUCT_SCHEMA_VERSION = 2
+
+def _parse_size_string(size_str):
+    """"50 x 40 x 70 cm" -> [50.0, 40.0, 70.0] (0.0 for missing/invalid parts)"""
+    try:
+        sizes = [float(x.strip()) for x in size_str.replace("cm", "").split("x")] if size_str else []
+    except:
+        sizes = []
+    return (sizes + [0.0, 0.0, 0.0])[:3]
+
+def _migrate_product_v1(product):
+    """v0 -> v1: product_size / packing_size strings become numeric P/L/T fields"""
+    if "product_size_p" in product:
+        return product
+    migrated_product = {
+        "name": product.get("name", ""),
+        "material": product.get("material", ""),
+        "finishing": product.get("finishing", ""),
+        "description": product.get("description", ""),
+        "is_knockdown": product.get("is_knockdown", False),
+        "knockdown_pieces": product.get("knockdown_pieces", []),
+        "image_path": product.get("image_path", "")
+    }
+    for prefix, key in [("product_size", "product_size"), ("packing_size", "packing_size")]:
+        p, l, t = _parse_size_string(product.get(key, ""))
+        migrated_product[f"{prefix}_p"] = p
+        migrated_product[f"{prefix}_l"] = l
+        migrated_product[f"{prefix}_t"] = t
+    return migrated_product
+
+def next_product_sku(products):
+    """Next free SKU-nnnn code"""
+    numbers = [int(m.group(1)) for m in (re.match(r"^SKU-(\d+)$", str(p.get("sku", ""))) for p in products) if m]
+    return f"SKU-{max(numbers, default=0) + 1:04d}"
+
+def _assign_missing_skus(products):
+    next_number = int(next_product_sku(products)[len("SKU-"):])
+    for product in products:
+        if not product.get("sku"):
+            product["sku"] = f"SKU-{next_number:04d}"
+            next_number += 1
+
+def compute_product_derived(product):
+    """Derived CBM fields, stored at save time so forms and reports just read them"""
+    product["product_cbm"] = calculate_cbm(product.get("product_size_p"), product.get("product_size_l"), product.get("product_size_t"))
+    product["packing_cbm"] = calculate_cbm(product.get("packing_size_p"), product.get("packing_size_l"), product.get("packing_size_t"))
+    pieces = product.get("knockdown_pieces", []) if product.get("is_knockdown", False) else []
+    product["knockdown_set_cbm"] = sum(piece.get("cbm", 0) for piece in pieces)
+    return product
+
+def migrate_products(data):
+    """Upgrade any older products.json layout to PRODUCT_SCHEMA_VERSION (run once, then saved)"""
+    if isinstance(data, dict):
+        version = data.get("schema_version", 1)
+        products = data.get("products", [])
+    else:
+        version = 0
+        # Format lama berupa list nama saja -> mulai dari kosong
+        products = [] if data and isinstance(data[0], str) else data
+    
+    if version < 1:
+        products = [_migrate_product_v1(product) for product in products]
+    if version < 2:
+        # v2: SKU unik + derived CBM fields
+        _assign_missing_skus(products)
+        for product in products:
+            compute_product_derived(product)
+    return products
+
+def load_products():
+    """Load enhanced product database with full specifications"""
+    if os.path.exists(PRODUCT_DB_PATH):
+        try:
+            with open(PRODUCT_DB_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("schema_version") == PRODUCT_SCHEMA_VERSION:
+                return data.get("products", [])
+            
+            # Migrasi sekali, lalu disimpan dengan schema_version terbaru
+            products = migrate_products(data)
+            save_products(products)
+            return products
+        except:
+            pass
+    return []
+
+def save_products(products):
+    """Save enhanced product database"""
+    _assign_missing_skus(products)
+    for product in products:
+        compute_product_derived(product)
+    st.session_state["products_version"] = st.session_state.get("products_version", 0) + 1
+    try:
+        with open(PRODUCT_DB_PATH, 'w', encoding='utf-8') as f:
+            json.dump({"schema_version": PRODUCT_SCHEMA_VERSION, "products": products}, f, ensure_ascii=False, indent=2)
+        return True
+    except:
+        return False
+
+def save_product_image(uploaded_file, product_name):
+    """Save uploaded product image to database (content-hashed, with thumbnail)"""
+    return store_uploaded_image(uploaded_file)
+
+def get_product_index():
+    """Hash index {"name": {...}, "sku": {...}} of the catalogue, rebuilt only after a save/reload"""
+    products = get_dataset("products")
+    key = (st.session_state.get("products_version", 0), id(products), len(products))
+    cached = st.session_state.get("products_index")
+    if cached is None or cached[0] != key:
+        index = {
+            "name": {product.get("name"): product for product in products},
+            "sku": {product.get("sku"): product for product in products if product.get("sku")}
+        }
+        cached = (key, index)
+        st.session_state["products_index"] = cached
+    return cached[1]
+
+def get_product_by_name(product_name):
+    """Get product details by name"""
+    return get_product_index()["name"].get(product_name)
+
+def get_product_by_sku(sku):
+    """Get product details by SKU"""
+    return get_product_index()["sku"].get(sku)
+
+# ===== PROCUREMENT STORE (HEADER + LINES) =====
+PROCUREMENT_SCHEMA_VERSION = 2
+PROCUREMENT_HEADER_COLUMNS = [
+    "id", "nama_produk", "buyer", "tanggal", "notes", "status", "source",
+    "created_at", "updated_at", "item_count", "total_cost"
+]
+PROCUREMENT_LINE_COLUMNS = [
+    "id", "procurement_id", "Nama Barang", "Jumlah per Pcs", "Jumlah Total", "Harga per Unit", "Harga Total",
+    "supplier", "ordered_at", "received_at"
+]
+PROCUREMENT_LINE_TEXT_COLUMNS = ["supplier", "ordered_at", "received_at"]
+
+def _procurement_line_rows(proc_id, items):
+    rows = []
+    for n, item in enumerate(items, 1):
+        qty = float(item.get("Jumlah Total") or 0)
+        price = float(item.get("Harga per Unit") or 0)
+        total = item.get("Harga Total")
+        rows.append({
+            "id": f"{proc_id}-L{n}",
+            "procurement_id": proc_id,
+            "Nama Barang": str(item.get("Nama Barang") or "").strip(),
+            "Jumlah per Pcs": float(item.get("Jumlah per Pcs") or 0),
+            "Jumlah Total": qty,
+            "Harga per Unit": price,
+            "Harga Total": float(total) if total is not None else qty * price,
+            "supplier": str(item.get("supplier") or "").strip(),
+            "ordered_at": item.get("ordered_at") or "",
+            "received_at": item.get("received_at") or ""
+        })
+    return rows
+
+def _procurement_header_row(proc_id, procurement, lines):
+    created_at = procurement.get("created_at") or str(datetime.datetime.now())
+    return {
+        "id": proc_id,
+        "nama_produk": procurement.get("nama_produk", "-"),
+        "buyer": procurement.get("buyer", "-"),
+        "tanggal": str(procurement.get("tanggal") or created_at[:10]),
+        "notes": procurement.get("notes", ""),
+        "status": procurement.get("status", "Open"),
+        "source": procurement.get("source", "manual"),
+        "created_at": created_at,
+        "updated_at": created_at,
+        "item_count": len(lines),
+        "total_cost": round(sum(line["Harga Total"] for line in lines), 2)
+    }
+
+def migrate_procurement(data):
+    """Legacy list of procurements with nested items -> header/line tables with PRC-xxxx IDs"""
+    headers, lines = [], []
+    for n, procurement in enumerate(data, 1):
+        proc_id = f"PRC-{n:04d}"
+        rows = _procurement_line_rows(proc_id, procurement.get("items", []))
+        headers.append(_procurement_header_row(proc_id, procurement, rows))
+        lines.extend(rows)
+    return {"schema_version": PROCUREMENT_SCHEMA_VERSION, "next_id": len(data) + 1, "headers": headers, "lines": lines}
+
+def _read_procurement_file():
+    """(data in schema v2, migrated?) from procurement.json.
+    Raises ValueError when the file exists but cannot be read, so it is never overwritten."""
+    if not os.path.exists(PROCUREMENT_DB_PATH):
+        return migrate_procurement([]), False
+    try:
+        with open(PROCUREMENT_DB_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"{PROCUREMENT_DB_PATH} tidak bisa dibaca ({e})") from e
+    if isinstance(data, list):
+        return migrate_procurement(data), True
+    if isinstance(data, dict) and data.get("schema_version") == PROCUREMENT_SCHEMA_VERSION:
+        return data, False
+    raise ValueError(f"{PROCUREMENT_DB_PATH} memakai format / schema_version yang tidak dikenal")
+
+def _procurement_store(data):
+    """JSON tables -> {"headers": DataFrame indexed by id, "lines": DataFrame, "next_id"}"""
+    return {
+        "next_id": data["next_id"],
+        "headers": pd.DataFrame(data["headers"], columns=PROCUREMENT_HEADER_COLUMNS).set_index("id", drop=False).rename_axis(None),
+        "lines": pd.DataFrame(data["lines"], columns=PROCUREMENT_LINE_COLUMNS).fillna(
+            {column: "" for column in PROCUREMENT_LINE_TEXT_COLUMNS}
+        )
+    }
+
+def _write_procurement(store):
+    data = {
+        "schema_version": PROCUREMENT_SCHEMA_VERSION,
+        "next_id": store["next_id"],
+        "headers": store["headers"].to_dict("records"),
+        "lines": store["lines"].to_dict("records")
+    }
+    atomic_write_json(PROCUREMENT_DB_PATH, data)
+
+def load_procurement():
+    try:
+        data, migrated = _read_procurement_file()
+    except ValueError as e:
+        # Tampilkan kosong tapi read-only: file asli tidak boleh ditimpa store pengganti ini
+        st.error(f"❌ {e}. Procurement tidak bisa diubah sampai file diperbaiki.")
+        store = _procurement_store(migrate_procurement([]))
+        store["read_only"] = True
+        return store
+    if migrated:
+        try:
+            store = _procurement_store(data)
+            _write_procurement(store)
+            return store
+        except:
+            pass
+    return _procurement_store(data)
+
+def save_procurement(store):
+    """Write the whole store (edits normally go through update_procurement_store)"""
+    if store.get("read_only"):
+        return False
+    st.session_state["procurement_version"] = st.session_state.get("procurement_version", 0) + 1
+    try:
+        _write_procurement(store)
+        return True
+    except:
+        return False
+
+def update_procurement_store(mutate):
+    """Read-modify-write of procurement.json under a thread + file lock.
+    mutate(store) works on the latest file contents, so edits from other sessions are kept.
+    Raises ValueError (nothing written) when the file exists but cannot be read."""
+    with locked_file(PROCUREMENT_DB_PATH):
+        store = _procurement_store(_read_procurement_file()[0])
+        result = mutate(store)
+        _write_procurement(store)
+    st.session_state["procurement"] = store
+    st.session_state["procurement_version"] = st.session_state.get("procurement_version", 0) + 1
+    return result
+
+def get_procurement_record(proc_id, store=None):
+    """Header fields plus "items" (line dicts) of one procurement, None if it no longer exists"""
+    store = store if store is not None else get_dataset("procurement")
+    if proc_id not in store["headers"].index:
+        return None
+    record = store["headers"].loc[proc_id].to_dict()
+    lines = store["lines"]
+    record["items"] = lines[lines["procurement_id"] == proc_id].to_dict("records")
+    return record
+
+def iter_procurement_records():
+    """All procurements as header + items dicts (for one-off full passes)"""
+    store = get_dataset("procurement")
+    items = {proc_id: group.to_dict("records") for proc_id, group in store["lines"].groupby("procurement_id")}
+    for record in store["headers"].to_dict("records"):
+        yield dict(record, items=items.get(record["id"], []))
+
+def create_procurement(procurement):
+    """Store a new procurement (header fields + "items"); returns the saved record"""
+    def mutate(store):
+        proc_id = f"PRC-{store['next_id']:04d}"
+        store["next_id"] += 1
+        rows = _procurement_line_rows(proc_id, procurement.get("items", []))
+        header = pd.DataFrame([_procurement_header_row(proc_id, procurement, rows)]).set_index("id", drop=False).rename_axis(None)
+        store["headers"] = pd.concat([store["headers"], header]) if not store["headers"].empty else header
+        if rows:
+            new_lines = pd.DataFrame(rows, columns=PROCUREMENT_LINE_COLUMNS)
+            store["lines"] = pd.concat([store["lines"], new_lines], ignore_index=True) if not store["lines"].empty else new_lines
+        return get_procurement_record(proc_id, store)
+    return update_procurement_store(mutate)
+
+def set_procurement_status(proc_id, status):
+    """Change status by ID; returns (old_status, record) or (None, None) if it was deleted meanwhile"""
+    def mutate(store):
+        if proc_id not in store["headers"].index:
+            return None, None
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        old_status = store["headers"].at[proc_id, "status"]
+        store["headers"].at[proc_id, "status"] = status
+        store["headers"].at[proc_id, "updated_at"] = now
+
+        # Timestamp per line untuk lead time supplier: dipesan saat Ordered, diterima saat Received
+        lines = store["lines"]
+        mask = lines["procurement_id"] == proc_id
+        if status == "Open":
+            lines.loc[mask, ["ordered_at", "received_at"]] = ""
+        else:
+            lines.loc[mask & (lines["ordered_at"] == ""), "ordered_at"] = (
+                now if status == "Ordered" else str(store["headers"].at[proc_id, "created_at"])[:19]
+            )
+            if status in INVENTORY_RECEIVED_STATUSES:
+                lines.loc[mask & (lines["received_at"] == ""), "received_at"] = now
+            else:
+                lines.loc[mask, "received_at"] = ""
+        return old_status, get_procurement_record(proc_id, store)
+    return update_procurement_store(mutate)
+
+def delete_procurement(proc_id):
+    """Delete header and lines by ID; returns the removed record (None if already gone)"""
+    def mutate(store):
+        record = get_procurement_record(proc_id, store)
+        if record is not None:
+            store["headers"] = store["headers"].drop(index=proc_id)
+            store["lines"] = store["lines"][store["lines"]["procurement_id"] != proc_id].reset_index(drop=True)
+        return record
+    return update_procurement_store(mutate)
+
+def get_procurement_index():
+    """Hash indexes of procurement IDs by buyer / product / status / month, plus line positions per ID"""
+    store = get_dataset("procurement")
+    key = (st.session_state.get("procurement_version", 0), id(store))
+    cached = st.session_state.get("procurement_index")
+    if cached is None or cached[0] != key:
+        headers = store["headers"]
+        index = {
+            "buyer": headers.groupby("buyer").groups,
+            "nama_produk": headers.groupby("nama_produk").groups,
+            "status": headers.groupby("status").groups,
+            "month": headers.groupby(headers["tanggal"].astype(str).str[:7]).groups,
+            "lines": store["lines"].groupby("procurement_id").indices
+        }
+        cached = (key, index)
+        st.session_state["procurement_index"] = cached
+    return cached[1]
+
+def filter_procurement(buyer=None, product=None, statuses=None, start=None, end=None):
+    """Headers matching the filters, newest first; equality filters use the hash indexes"""
+    headers = get_dataset("procurement")["headers"]
+    index = get_procurement_index()
+    ids = None
+    for field, values in (("buyer", [buyer] if buyer else None), ("nama_produk", [product] if product else None), ("status", statuses)):
+        if values:
+            matched = set().union(*(index[field].get(value, []) for value in values))
+            ids = matched if ids is None else ids & matched
+    if start or end:
+        months = [
+            month for month in index["month"]
+            if (not start or month >= str(start)[:7]) and (not end or month <= str(end)[:7])
+        ]
+        matched = set().union(*(index["month"][month] for month in months))
+        ids = matched if ids is None else ids & matched
+    result = headers if ids is None else headers.loc[headers.index.isin(ids)]
+    if start:
+        result = result[result["tanggal"] >= str(start)]
+    if end:
+        result = result[result["tanggal"] <= str(end)]
+    return result.iloc[::-1]
+
+def get_procurement_lines(proc_id):
+    """Lines of one procurement via the line index (no scan of all lines)"""
+    positions = get_procurement_index()["lines"].get(proc_id)
+    lines = get_dataset("procurement")["lines"]
+    return lines.iloc[positions] if positions is not None else lines.iloc[0:0]
+
+def summarize_procurement(headers):
+    """Count and total cost per status from the precomputed header totals"""
+    return headers.groupby("status").agg(count=("id", "size"), total_cost=("total_cost", "sum"))
+
+def load_containers():
+    if os.path.exists(CONTAINER_DB_PATH):
+        try:
+            with open(CONTAINER_DB_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except:
+            pass
+    return []
+
+def save_containers(containers_data):
+    try:
+        with open(CONTAINER_DB_PATH, 'w', encoding='utf-8') as f:
+            json.dump(containers_data, f, ensure_ascii=False, indent=2)
+        return True
+    except:
+        return False
+
+# ===== WORKERS DATABASE FUNCTIONS - NEW =====
+def load_workers():
+    if os.path.exists(WORKERS_DB_PATH):
+        try:
+            with open(WORKERS_DB_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except:
+            pass
+    return []
+
+def save_workers(workers):
+    try:
+        with open(WORKERS_DB_PATH, 'w', encoding='utf-8') as f:
+            json.dump(workers, f, ensure_ascii=False, indent=2)
+        return True
+    except:
+        return False
+
+# ===== ATTENDANCE DATABASE FUNCTIONS - NEW =====
+def load_attendance():
+    if os.path.exists(ATTENDANCE_DB_PATH):
+        try:
+            with open(ATTENDANCE_DB_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except:
+            pass
+    return []
+
+def save_attendance(attendance_data):
+    try:
+        with open(ATTENDANCE_DB_PATH, 'w', encoding='utf-8') as f:
+            json.dump(attendance_data, f, ensure_ascii=False, indent=2)
+        return True
+    except:
+        return False
+
+def get_attendance_by_date(date_str):
+    attendance = get_dataset("attendance")
+    for record in attendance:
+        if record.get("date") == date_str:
+            return record
+    return None
+
+def upsert_attendance_days(days):
+    """Upsert absensi beberapa tanggal sekaligus, lalu tulis file sekali
+
+    days: {date_str: (records_df, summary)} dengan records_df hasil validate_attendance_grid.
+    """
+    attendance = get_dataset("attendance")
+    by_date = {att.get("date"): att for att in attendance}
+    summary_keys = ["total_workers", "hadir", "tidak_hadir", "izin", "sakit", "overtime_hours"]
+
+    for date_str, (records_df, summary) in days.items():
+        records = records_df.set_index("worker_id")[["name", "position", "status", "check_in", "check_out"]].to_dict("index")
+        day_summary = {key: summary[key] for key in summary_keys}
+        existing = by_date.get(date_str)
+        if existing is None:
+            by_date[date_str] = {
+                "date": date_str,
+                "created_at": str(datetime.datetime.now()),
+                "created_by": st.session_state.get("user_name", "Unknown"),
+                **day_summary,
+                "records": records
+            }
+            attendance.append(by_date[date_str])
+        else:
+            merged = existing.get("records", {})
+            for worker_id, record in records.items():
+                merged.setdefault(worker_id, {}).update(record)
+            existing.update(day_summary)
+            existing["records"] = merged
+
+    st.session_state["attendance"] = attendance
+    return save_attendance(attendance)
+
+def upsert_attendance_day(date_str, records_df, summary):
+    """Simpan absensi semua pekerja untuk satu tanggal dengan satu kali tulis file"""
+    return upsert_attendance_days({date_str: (records_df, summary)})
+
+def get_tracking_stages():
+    return [
+        "Pre Order", "Order di Supplier", "Warehouse", "Fitting 1",
+        "Amplas", "Revisi 1", "Spray", "Fitting 2",
+        "Revisi Fitting 2", "Packaging", "Pengiriman"
+    ]
+
+def get_storage_stages():
+    """Stages where items are physically in storage"""
+    return ["Warehouse", "Fitting 1", "Amplas", "Revisi 1", "Spray", "Fitting 2", "Revisi Fitting 2", "Packaging"]
+
+def init_tracking_data():
+    stages = get_tracking_stages()
+    return {stage: {"qty": 0} for stage in stages}
+
+def get_tracking_status_from_progress(progress_str):
+    try:
+        progress_pct = int(progress_str.rstrip('%')) if progress_str else 0
+    except:
+        progress_pct = 0
+    
+    if progress_pct >= 100:
+        return "Done"
+    elif progress_pct > 0:
+        return "On Going"
+    else:
+        return "On Going"
+
+def add_history_entry(order_id, action, details):
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return {
+        "timestamp": timestamp,
+        "action": action,
+        "details": details
+    }
+
+def save_uploaded_image(uploaded_file, order_id, product_idx):
+    """Save an order product image; identical uploads share one stored file"""
+    return store_uploaded_image(uploaded_file)
+
+def calculate_cbm(p, l, t):
+    """Calculate CBM from dimensions in cm with maximum precision"""
+    try:
+        p_val = float(p) if p else 0
+        l_val = float(l) if l else 0
+        t_val = float(t) if t else 0
+        if p_val > 0 and l_val > 0 and t_val > 0:
+            return (p_val * l_val * t_val) / 1000000
+        return 0
+    except:
+        return 0
+
+def calculate_floor_area_m2(p_cm, l_cm):
+    """Calculate floor area in m² from P and L in cm"""
+    try:
+        p_val = float(p_cm) if p_cm else 0
+        l_val = float(l_cm) if l_cm else 0
+        if p_val > 0 and l_val > 0:
+            return (p_val * l_val) / 10000  # cm² to m²
+        return 0
+    except:
+        return 0
+
+def get_products_by_buyer(buyer_name):
+    """Get unique products for a specific buyer from orders"""
+    df = get_dataset("data_produksi")
+    if df.empty or not buyer_name:
+        return []
+    
+    buyer_products = df[df["Buyer"] == buyer_name]["Produk"].unique().tolist()
+    return sorted(buyer_products)
+
+def calculate_production_metrics(df):
+    wip_stages = ["Warehouse", "Fitting 1", "Amplas", "Revisi 1", "Spray", "Fitting 2", "Revisi Fitting 2"]
+    
+    wip_qty = 0
+    wip_cbm = 0
+    finished_qty = 0
+    finished_cbm = 0
+    shipping_qty = 0
+    shipping_cbm = 0
+    
+    for idx, row in df.iterrows():
+        try:
+            tracking_data = json.loads(row["Tracking"])
+            
+            if row.get("Is Knockdown", False):
+                try:
+                    knockdown_pieces = json.loads(row.get("Knockdown Pieces", "[]"))
+                    total_cbm_per_unit = sum([piece.get("cbm", 0) for piece in knockdown_pieces])
+                except:
+                    total_cbm_per_unit = float(row.get("Total CBM", 0)) / max(row.get("Qty", 1), 1)
+            else:
+                total_cbm_per_unit = float(row.get("CBM per Pcs", 0))
+            
+            for stage, data in tracking_data.items():
+                qty = data.get("qty", 0)
+                if stage in wip_stages and qty > 0:
+                    wip_qty += qty
+                    wip_cbm += qty * total_cbm_per_unit
+                elif stage == "Packaging" and qty > 0:
+                    finished_qty += qty
+                    finished_cbm += qty * total_cbm_per_unit
+                elif stage == "Pengiriman" and qty > 0:
+                    shipping_qty += qty
+                    shipping_cbm += qty * total_cbm_per_unit
+        except:
+            pass
+    
+    return wip_qty, wip_cbm, finished_qty, finished_cbm, shipping_qty, shipping_cbm
+
+# ===== FUNGSI DATABASE - SUPPLIERS =====
+def load_suppliers():
+    """Load supplier database"""
+    if os.path.exists(SUPPLIER_DB_PATH):
+        try:
+            with open(SUPPLIER_DB_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except:
+            pass
+    return []
+
+def save_suppliers(suppliers):
+    """Save supplier database"""
+    try:
+        with open(SUPPLIER_DB_PATH, 'w', encoding='utf-8') as f:
+            json.dump(suppliers, f, ensure_ascii=False, indent=2)
+        return True
+    except:
+        return False
+
+def _frozen_day(value):
+    return value if isinstance(value, datetime.date) else datetime.date.fromisoformat(str(value))
+
+def normalize_frozen_intervals(intervals):
+    """Sort intervals and merge overlapping/adjacent ones that share the same reason"""
+    merged = []
+    for interval in sorted(intervals, key=lambda x: (x["start"], x["end"])):
+        if merged:
+            last = merged[-1]
+            adjacent = _frozen_day(interval["start"]) <= _frozen_day(last["end"]) + datetime.timedelta(days=1)
+            if adjacent and interval.get("reason") == last.get("reason"):
+                last["end"] = max(last["end"], interval["end"])
+                continue
+        merged.append(dict(interval))
+    return merged
+
+def migrate_frozen_dates(data):
+    """Convert legacy one-entry-per-date records ({"date": ...}) to intervals"""
+    intervals = []
+    for entry in data:
+        if "date" in entry:
+            interval = {"start": entry["date"], "end": entry["date"]}
+            interval.update({key: value for key, value in entry.items() if key != "date"})
+            intervals.append(interval)
+        elif "start" in entry:
+            intervals.append(entry)
+    return normalize_frozen_intervals(intervals)
+
+def load_frozen_dates():
+    """Load frozen date intervals from database (legacy per-date files are migrated)"""
+    if os.path.exists(FROZEN_DATES_DB_PATH):
+        try:
+            with open(FROZEN_DATES_DB_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            intervals = migrate_frozen_dates(data)
+            if intervals != data:
+                save_frozen_dates(intervals)
+            return intervals
+        except:
+            pass
+    return []
+
+def save_frozen_dates(frozen_dates_data):
+    """Save frozen date intervals to database"""
+    try:
+        with open(FROZEN_DATES_DB_PATH, 'w', encoding='utf-8') as f:
+            json.dump(frozen_dates_data, f, ensure_ascii=False, indent=2)
+        return True
+    except:
+        return False
+
+def freeze_date_range(intervals, start_date, end_date, reason, frozen_by):
+    """Freeze start..end; days that are already frozen keep their reason.
+    Returns (new_intervals, added_days, existing_days)."""
+    start, end = _frozen_day(start_date), _frozen_day(end_date)
+    gaps = []
+    cursor = start
+    for interval in sorted(intervals, key=lambda x: x["start"]):
+        i_start, i_end = _frozen_day(interval["start"]), _frozen_day(interval["end"])
+        if i_end < cursor or i_start > end:
+            continue
+        if i_start > cursor:
+            gaps.append((cursor, i_start - datetime.timedelta(days=1)))
+        cursor = max(cursor, i_end + datetime.timedelta(days=1))
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+
+    added_days = sum((gap_end - gap_start).days + 1 for gap_start, gap_end in gaps)
+    existing_days = (end - start).days + 1 - added_days
+    frozen_at = str(datetime.datetime.now())
+    new_intervals = list(intervals) + [
+        {"start": str(gap_start), "end": str(gap_end), "reason": reason, "frozen_by": frozen_by, "frozen_at": frozen_at}
+        for gap_start, gap_end in gaps
+    ]
+    return normalize_frozen_intervals(new_intervals), added_days, existing_days
+
+def unfreeze_date_range(intervals, start_date, end_date):
+    """Remove start..end from every interval, splitting intervals that straddle it"""
+    start, end = _frozen_day(start_date), _frozen_day(end_date)
+    remaining = []
+    for interval in intervals:
+        i_start, i_end = _frozen_day(interval["start"]), _frozen_day(interval["end"])
+        if i_end < start or i_start > end:
+            remaining.append(interval)
+            continue
+        if i_start < start:
+            remaining.append({**interval, "end": str(start - datetime.timedelta(days=1))})
+        if i_end > end:
+            remaining.append({**interval, "start": str(end + datetime.timedelta(days=1))})
+    return normalize_frozen_intervals(remaining)
+
+def get_frozen_index():
+    """Hashed {date_str: reason} lookup of all frozen days, rebuilt only when intervals change"""
+    intervals = get_dataset("frozen_dates")
+    signature = tuple((i["start"], i["end"], i.get("reason")) for i in intervals)
+    cached = st.session_state.get("frozen_index")
+    if cached is None or cached[0] != signature:
+        index = {}
+        for start, end, reason in signature:
+            for day in pd.date_range(start, end, freq="D").strftime("%Y-%m-%d"):
+                index.setdefault(day, reason or "No reason provided")
+        cached = (signature, index, sorted(index))
+        st.session_state["frozen_index"] = cached
+    return cached[1]
+
+def is_date_frozen(check_date):
+    """Check if a date is frozen - returns True/False and reason"""
+    reason = get_frozen_index().get(str(check_date))
+    if reason is None:
+        return False, ""
+    return True, reason
+
+def get_frozen_date_range():
+    """Get sorted list of all frozen dates"""
+    get_frozen_index()
+    return list(st.session_state["frozen_index"][2])
+
+# ===== HOLIDAY CALENDAR =====
+def load_holidays():
+    """Load hari libur (tanggal merah) untuk kalender payroll"""
+    if os.path.exists(HOLIDAYS_DB_PATH):
+        try:
+            with open(HOLIDAYS_DB_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except:
+            pass
+    return []
+
+def save_holidays(holidays):
+    try:
+        with open(HOLIDAYS_DB_PATH, 'w', encoding='utf-8') as f:
+            json.dump(holidays, f, ensure_ascii=False, indent=2)
+        return True
+    except:
+        return False
+
+def load_inventory():
+    """Materialised material balances (ledger itself is in ppic_inventory)"""
+    if os.path.exists(INVENTORY_DB_PATH):
+        try:
+            with open(INVENTORY_DB_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except:
+            pass
+    return {"seq": 0, "initialized": False, "snapshot_seq": 0, "snapshot_date": "", "balances": {}, "orders": {}}
+
+# ===== DATASET REGISTRY =====
+DATASET_REGISTRY = {
+    "data_produksi": load_data,
+    "buyers": load_buyers,
+    "products": load_products,
+    "suppliers": load_suppliers,
+    "procurement": load_procurement,
+    "containers": load_containers,
+    "workers": load_workers,
+    "attendance": load_attendance,
+    "frozen_dates": load_frozen_dates,
+    "holidays": load_holidays,
+    "inventory": load_inventory
+}
+
+# Dataset yang dipakai langsung oleh tiap menu (helper memuat sisanya lewat get_dataset)
+MENU_DATASETS = {
+    "Dashboard": ["data_produksi", "attendance", "inventory"],
+    "Input": ["data_produksi", "buyers", "products", "frozen_dates"],
+    "Orders": ["data_produksi", "buyers"],
+    "Procurement": ["data_produksi", "procurement", "suppliers", "products", "inventory"],
+    "Progress": ["data_produksi"],
+    "Tracking": ["data_produksi"],
+    "Frozen": ["data_produksi", "frozen_dates"],
+    "Container": ["data_produksi", "containers"],
+    "Absensi": ["workers", "attendance", "holidays"],
+    "Analytics": ["data_produksi"],
+    "Gantt": ["data_produksi", "frozen_dates", "workers", "attendance"],
+    "Database": ["buyers", "products", "suppliers", "workers"]
+}
+
+def get_dataset(name):
+    """Return a dataset from session state, loading it on first access"""
+    if name not in st.session_state:
+        st.session_state[name] = DATASET_REGISTRY[name]()
+    return st.session_state[name]
+
+def preload_datasets(menu):
+    """Load the datasets a menu reads directly from session state"""
+    for name in MENU_DATASETS.get(menu, DATASET_REGISTRY):
+        get_dataset(name)
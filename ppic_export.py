@@ -0,0 +1,192 @@
+import streamlit as st
+import pandas as pd
+import datetime
+import functools
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import openpyxl
+except ImportError:  # Tanpa openpyxl: format XLSX tidak ditawarkan
+    openpyxl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Tanpa pyarrow: format Parquet tidak ditawarkan
+    pa = pq = None
+
+from ppic_config import EXPORT_DIR, EXPORT_CHUNK_ROWS, EXPORT_MAX_WORKERS, EXPORT_RETENTION_HOURS, EXPORT_POLL_SECONDS
+
+# ===== EXPORT ENGINE (BACKGROUND, CHUNKED) =====
+# Filter tanggal + pilihan kolom diterapkan dulu, lalu baris ditulis per chunk ke file di EXPORT_DIR
+# oleh thread background. Download membaca file saat tombol diklik, bukan saat render.
+EXPORT_FORMATS = {
+    "CSV": {"ext": "csv", "mime": "text/csv"},
+    "XLSX": {"ext": "xlsx", "mime": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"},
+    "Parquet": {"ext": "parquet", "mime": "application/vnd.apache.parquet"},
+    "JSON": {"ext": "json", "mime": "application/json"}
+}
+
+def _write_csv(frame, path, chunk_rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for start in range(0, max(len(frame), 1), chunk_rows):
+            frame.iloc[start:start + chunk_rows].to_csv(f, index=False, header=start == 0)
+
+def _write_json(frame, path, chunk_rows):
+    """JSON array of records, written chunk by chunk"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for start in range(0, len(frame), chunk_rows):
+            records = frame.iloc[start:start + chunk_rows].to_json(orient="records", date_format="iso", force_ascii=False)
+            f.write(("," if start else "") + records[1:-1])
+        f.write("]")
+
+def _write_xlsx(frame, path, chunk_rows):
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Export")
+    sheet.append([str(column) for column in frame.columns])
+    for start in range(0, len(frame), chunk_rows):
+        chunk = frame.iloc[start:start + chunk_rows].astype(object)
+        for row in chunk.where(chunk.notna(), None).itertuples(index=False, name=None):
+            sheet.append(row)
+    workbook.save(path)
+
+def _write_parquet(frame, path, chunk_rows):
+    # Schema dari seluruh frame agar chunk yang kebetulan kosong/None tetap bertipe sama
+    schema = pa.Schema.from_pandas(frame, preserve_index=False)
+    with pq.ParquetWriter(path, schema) as writer:
+        for start in range(0, len(frame), chunk_rows):
+            writer.write_table(pa.Table.from_pandas(frame.iloc[start:start + chunk_rows], schema=schema, preserve_index=False))
+
+EXPORT_WRITERS = {"CSV": _write_csv, "XLSX": _write_xlsx, "Parquet": _write_parquet, "JSON": _write_json}
+
+def get_export_formats(formats=None):
+    """Formats whose writer dependency is installed"""
+    unavailable = {"XLSX": openpyxl is None, "Parquet": pq is None}
+    return [name for name in (formats or EXPORT_FORMATS) if not unavailable.get(name, False)]
+
+def select_export_rows(df, columns=None, date_column=None, start=None, end=None):
+    """Push the date filter and column selection down before anything is serialised.
+
+    With pandas copy-on-write the result is a snapshot: later edits to the
+    session order book do not leak into a running export.
+    """
+    mask = slice(None)
+    if date_column and (start or end):
+        dates = pd.to_datetime(df[date_column], errors="coerce")
+        mask = dates.notna()
+        if start:
+            mask &= dates >= pd.Timestamp(start)
+        if end:
+            mask &= dates <= pd.Timestamp(end)
+    columns = [column for column in (columns or df.columns) if column in df.columns]
+    return df.loc[mask, columns]
+
+def run_export(frame, export_format, path, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Write frame to path (worker thread, no Streamlit calls); the file only appears when complete"""
+    tmp_path = f"{path}.tmp"
+    try:
+        EXPORT_WRITERS[export_format](frame, tmp_path, chunk_rows)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return {"rows": len(frame), "bytes": os.path.getsize(path)}
+
+@st.cache_resource
+def get_export_executor():
+    """Background export threads shared by all sessions"""
+    return ThreadPoolExecutor(max_workers=EXPORT_MAX_WORKERS, thread_name_prefix="ppic-export")
+
+def cleanup_exports():
+    """Delete export files older than EXPORT_RETENTION_HOURS"""
+    if not os.path.isdir(EXPORT_DIR):
+        return
+    cutoff = time.time() - EXPORT_RETENTION_HOURS * 3600
+    for name in os.listdir(EXPORT_DIR):
+        path = os.path.join(EXPORT_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+def get_export_job(job_key):
+    return st.session_state.get("export_jobs", {}).get(job_key)
+
+def submit_export(job_key, frame, export_format, file_stem):
+    """Queue a background export; replaces this session's previous job for the same key"""
+    cleanup_exports()
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    jobs = st.session_state.setdefault("export_jobs", {})
+    previous = jobs.get(job_key)
+    if previous and not previous["future"].cancel() and previous["future"].done() and os.path.exists(previous["path"]):
+        os.remove(previous["path"])
+
+    spec = EXPORT_FORMATS[export_format]
+    path = os.path.join(EXPORT_DIR, f"{uuid.uuid4().hex}.{spec['ext']}")
+    jobs[job_key] = {
+        "future": get_export_executor().submit(run_export, frame, export_format, path),
+        "path": path,
+        "format": export_format,
+        "file_name": f"{file_stem}.{spec['ext']}",
+        "mime": spec["mime"],
+        "created_at": datetime.datetime.now()
+    }
+    return jobs[job_key]
+
+def _read_export_file(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+@st.fragment(run_every=EXPORT_POLL_SECONDS)
+def _poll_export_job(job_key):
+    """Polls only while a job is running; a full rerun then shows the download"""
+    job = get_export_job(job_key)
+    if job is None or job["future"].done():
+        st.rerun()
+    st.info(f"⏳ Export {job['format']} sedang diproses di background (dimulai {job['created_at']:%H:%M:%S})...")
+
+def render_export_status(job_key):
+    job = get_export_job(job_key)
+    if job is None:
+        return
+    future = job["future"]
+    if not future.done():
+        _poll_export_job(job_key)
+        return
+    if future.cancelled() or future.exception() is not None:
+        st.error(f"❌ Export gagal: {future.exception() if not future.cancelled() else 'dibatalkan'}")
+        return
+    if not os.path.exists(job["path"]):
+        st.warning("⚠️ File export sudah kedaluwarsa, silakan buat ulang.")
+        return
+    result = future.result()
+    st.download_button(
+        label=f"📥 Download {job['file_name']} ({result['rows']:,} baris, {result['bytes'] / 1024:,.0f} KB)",
+        data=functools.partial(_read_export_file, job["path"]),
+        file_name=job["file_name"],
+        mime=job["mime"],
+        use_container_width=True,
+        key=f"{job_key}_download"
+    )
+
+def render_export_panel(job_key, df, file_stem, date_column=None, formats=None):
+    """Column/date filters, a background export job and the download of the finished file"""
+    col_e1, col_e2, col_e3 = st.columns([3, 2, 1])
+    with col_e1:
+        columns = st.multiselect("Kolom", list(df.columns), default=list(df.columns), key=f"{job_key}_columns")
+    with col_e2:
+        period = st.date_input(f"Filter {date_column}", value=[], key=f"{job_key}_period") if date_column else ()
+    with col_e3:
+        export_format = st.selectbox("Format", get_export_formats(formats), key=f"{job_key}_format")
+
+    if st.button("⚙️ Buat File Export", use_container_width=True, disabled=not columns, key=f"{job_key}_submit"):
+        start, end = (tuple(period) + (None, None))[:2]
+        frame = select_export_rows(df, columns, date_column, start, end or start)
+        submit_export(job_key, frame, export_format, file_stem)
+
+    render_export_status(job_key)
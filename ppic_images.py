@@ -0,0 +1,109 @@
+import streamlit as st
+import hashlib
+import io
+import os
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Tanpa Pillow: simpan original saja, thumbnail = original
+    Image = None
+
+from ppic_config import IMAGES_DIR, THUMBNAILS_DIR, THUMBNAIL_SIZE, THUMBNAIL_QUALITY
+
+# ===== IMAGE PIPELINE (CONTENT-HASHED ORIGINALS + THUMBNAILS) =====
+IMAGE_EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp", "GIF": "gif"}
+
+def _image_extension(data, filename):
+    """Extension from the decoded format, falling back to the uploaded filename"""
+    if Image is not None:
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                if img.format in IMAGE_EXTENSIONS:
+                    return IMAGE_EXTENSIONS[img.format]
+        except Exception:
+            pass
+    ext = os.path.splitext(filename or "")[1].lstrip(".").lower()
+    return "jpg" if ext in ("jpeg", "") else ext
+
+def get_thumbnail_path(image_path):
+    """Thumbnail file for an original: thumbs/<stem>_<width>.jpg"""
+    stem = os.path.splitext(os.path.basename(image_path))[0]
+    return os.path.join(THUMBNAILS_DIR, f"{stem}_{THUMBNAIL_SIZE[0]}.jpg")
+
+def create_thumbnail(image_path):
+    """Resize an original into its thumbnail file; returns the thumbnail path or None"""
+    if Image is None:
+        return None
+    thumb_path = get_thumbnail_path(image_path)
+    # Gambar lama (nama tetap) bisa ditimpa; thumbnail dibuat ulang jika lebih tua
+    if os.path.exists(thumb_path) and os.path.getmtime(thumb_path) >= os.path.getmtime(image_path):
+        return thumb_path
+    try:
+        os.makedirs(THUMBNAILS_DIR, exist_ok=True)
+        with Image.open(image_path) as img:
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail(THUMBNAIL_SIZE)
+            if img.mode in ("RGBA", "LA", "P"):
+                # JPEG tidak punya alpha: tempel di latar putih
+                img = img.convert("RGBA")
+                background = Image.new("RGB", img.size, (255, 255, 255))
+                background.paste(img, mask=img.getchannel("A"))
+                img = background
+            elif img.mode != "RGB":
+                img = img.convert("RGB")
+            tmp_path = thumb_path + ".tmp"
+            img.save(tmp_path, "JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+        os.replace(tmp_path, thumb_path)
+        return thumb_path
+    except Exception:
+        return None
+
+def store_image(data, filename=""):
+    """Save image bytes as IMAGES_DIR/<sha256>.<ext> and build its thumbnail
+
+    Identical uploads hash to the same file, so re-uploading a product photo
+    for another order reuses the stored original instead of writing a copy.
+    """
+    if not data:
+        return None
+    digest = hashlib.sha256(data).hexdigest()[:20]
+    filepath = os.path.join(IMAGES_DIR, f"{digest}.{_image_extension(data, filename)}")
+
+    if not os.path.exists(filepath):
+        os.makedirs(IMAGES_DIR, exist_ok=True)
+        tmp_path = filepath + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, filepath)
+
+    create_thumbnail(filepath)
+    return filepath
+
+def store_uploaded_image(uploaded_file):
+    """Streamlit UploadedFile -> stored original path (None if nothing uploaded)"""
+    if uploaded_file is None:
+        return None
+    return store_image(uploaded_file.getvalue(), uploaded_file.name)
+
+@st.cache_data(show_spinner=False, max_entries=500)
+def _load_thumbnail(image_path, mtime):
+    """Thumbnail bytes, cached per (path, mtime) so list renders skip the disk"""
+    thumb_path = create_thumbnail(image_path)
+    with open(thumb_path or image_path, "rb") as f:
+        return f.read()
+
+def get_thumbnail(image_path):
+    """Thumbnail for st.image; legacy images get their thumbnail generated on first view"""
+    if not image_path or not os.path.exists(image_path):
+        return None
+    return _load_thumbnail(image_path, os.path.getmtime(image_path))
+
+def show_image_thumbnail(image_path, key, caption=None, width=150):
+    """Thumbnail with the full-size original loaded only when toggled"""
+    thumbnail = get_thumbnail(image_path)
+    if thumbnail is None:
+        return False
+    st.image(thumbnail, caption=caption, width=width)
+    if st.toggle("🔍 Gambar asli", key=f"orig_{key}"):
+        st.image(image_path, width="stretch")
+    return True
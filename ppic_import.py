@@ -0,0 +1,321 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import datetime
+import json
+import re
+
+try:
+    import openpyxl
+except ImportError:  # Tanpa openpyxl: hanya import CSV
+    openpyxl = None
+
+from ppic_config import IMPORT_CHUNK_ROWS, IMPORT_DEFAULT_LEAD_DAYS, IMPORT_PRIORITIES
+from ppic_data import (
+    get_dataset, get_product_index, calculate_cbm, is_date_frozen, add_history_entry, init_tracking_data,
+    get_tracking_stages, get_order_id_prefix, allocate_order_ids, save_data
+)
+
+# ===== BULK ORDER IMPORT (CSV / XLSX) =====
+# File PO dibaca per chunk (IMPORT_CHUNK_ROWS baris), tiap chunk divalidasi lalu dibuang;
+# yang disimpan hanya baris valid + laporan error. Semua baris valid masuk dengan satu save_data.
+IMPORT_COLUMN_ALIASES = {
+    "PO": ["po", "po number", "no po", "nomor po", "order ref", "reference"],
+    "Buyer": ["buyer name", "customer", "pembeli"],
+    "Order Date": ["tanggal order", "po date", "tanggal"],
+    "Due Date": ["deadline", "ship date", "tanggal kirim"],
+    "Prioritas": ["priority"],
+    "SKU": ["kode", "kode produk", "item code"],
+    "Produk": ["product", "nama produk", "product name", "item"],
+    "Qty": ["quantity", "jumlah"],
+    "Material": [],
+    "Finishing": [],
+    "Description": ["deskripsi"],
+    "Keterangan": ["notes", "catatan", "remarks"],
+    "Product Size P": ["product p", "prod p"],
+    "Product Size L": ["product l", "prod l"],
+    "Product Size T": ["product t", "prod t"],
+    "Packing Size P": ["packing p", "pack p"],
+    "Packing Size L": ["packing l", "pack l"],
+    "Packing Size T": ["packing t", "pack t"],
+    "Max Stack": []
+}
+IMPORT_FIELDS = list(IMPORT_COLUMN_ALIASES)
+IMPORT_TEXT_FIELDS = ["PO", "Buyer", "Prioritas", "SKU", "Produk", "Material", "Finishing", "Description", "Keterangan"]
+IMPORT_SIZE_FIELDS = {
+    "Product Size P": "product_size_p", "Product Size L": "product_size_l", "Product Size T": "product_size_t",
+    "Packing Size P": "packing_size_p", "Packing Size L": "packing_size_l", "Packing Size T": "packing_size_t"
+}
+IMPORT_ERROR_COLUMNS = ["Baris", "Kolom", "Nilai", "Pesan"]
+
+def _normalize_header(name):
+    return re.sub(r"[^a-z0-9]", "", str(name or "").lower())
+
+def map_import_columns(header):
+    """File header -> data_produksi column; raises ValueError when Qty / product columns are missing"""
+    lookup = {
+        _normalize_header(alias): field
+        for field, aliases in IMPORT_COLUMN_ALIASES.items()
+        for alias in [field] + aliases
+    }
+    mapping = {}
+    for column in header:
+        field = lookup.get(_normalize_header(column))
+        if field and field not in mapping.values():
+            mapping[column] = field
+
+    fields = set(mapping.values())
+    if "Qty" not in fields:
+        raise ValueError("Kolom Qty tidak ditemukan di file")
+    if not fields & {"Produk", "SKU"}:
+        raise ValueError("Kolom Produk atau SKU tidak ditemukan di file")
+    return mapping
+
+def _read_xlsx_chunks(uploaded_file, chunk_rows):
+    if openpyxl is None:
+        raise ValueError("Import Excel butuh openpyxl (pip install openpyxl); gunakan CSV")
+    workbook = openpyxl.load_workbook(uploaded_file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(cell).strip() if cell is not None else "" for cell in next(rows, ())]
+        width = len(header)
+        batch = []
+        for row in rows:
+            batch.append((list(row) + [None] * width)[:width])
+            if len(batch) >= chunk_rows:
+                yield pd.DataFrame(batch, columns=header, dtype=object)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header, dtype=object)
+    finally:
+        workbook.close()
+
+def read_import_chunks(uploaded_file, chunk_rows=IMPORT_CHUNK_ROWS):
+    """Yield the uploaded CSV/XLSX as DataFrames of at most chunk_rows rows (raw header, object cells)"""
+    uploaded_file.seek(0)
+    if str(uploaded_file.name).lower().endswith((".xlsx", ".xlsm")):
+        yield from _read_xlsx_chunks(uploaded_file, chunk_rows)
+        return
+    # sep=None: deteksi otomatis koma / titik koma (CSV dari Excel versi Indonesia)
+    yield from pd.read_csv(
+        uploaded_file, sep=None, engine="python", dtype=str, keep_default_na=False,
+        encoding="utf-8-sig", chunksize=chunk_rows
+    )
+
+def _parse_import_dates(values):
+    """ISO dates first, then day-first (dd/mm/yyyy); Excel date cells pass through"""
+    is_date = values.map(lambda value: isinstance(value, datetime.date))
+    text = values.map(lambda value: value.strip() if isinstance(value, str) else None)
+    iso = pd.to_datetime(text, errors="coerce", format="ISO8601")
+    rest = pd.to_datetime(text.where(iso.isna()), errors="coerce", format="mixed", dayfirst=True)
+    return pd.to_datetime(values.where(is_date)).fillna(iso).fillna(rest)
+
+def _import_context(defaults):
+    """Lookups shared by every chunk: catalogue by lower-case name / SKU, frozen-day cache"""
+    index = get_product_index()
+    return {
+        "defaults": defaults,
+        "names": {str(name).strip().lower(): product for name, product in index["name"].items() if name},
+        "skus": {str(sku).strip().upper(): product for sku, product in index["sku"].items()},
+        "frozen": {}
+    }
+
+def _frozen_reason(context, day):
+    if day not in context["frozen"]:
+        context["frozen"][day] = is_date_frozen(day)[1]
+    return context["frozen"][day]
+
+def validate_import_chunk(chunk, column_map, first_row, context):
+    """Validate one chunk -> (list of order line dicts, list of error dicts)"""
+    data = chunk.rename(columns=column_map).reindex(columns=IMPORT_FIELDS)
+    text = data[IMPORT_TEXT_FIELDS].fillna("").astype(str).apply(lambda column: column.str.strip())
+    filled = data.notna() & (data.astype(str).apply(lambda column: column.str.strip()) != "")
+    defaults = context["defaults"]
+
+    line_numbers = np.arange(len(data)) + first_row
+    order_dates = _parse_import_dates(data["Order Date"])
+    due_dates = _parse_import_dates(data["Due Date"])
+    qty = pd.to_numeric(data["Qty"], errors="coerce")
+    sizes = {field: pd.to_numeric(data[field], errors="coerce") for field in IMPORT_SIZE_FIELDS}
+    max_stack = pd.to_numeric(data["Max Stack"], errors="coerce")
+
+    rows, errors = [], []
+    for i in range(len(data)):
+        if not filled.iloc[i].any():
+            continue  # Baris kosong (sisa format Excel)
+        line = int(line_numbers[i])
+        row_errors = []
+
+        def error(column, value, message):
+            row_errors.append({"Baris": line, "Kolom": column, "Nilai": str(value), "Pesan": message})
+
+        buyer = text["Buyer"].iat[i] or defaults["buyer"]
+        if not buyer:
+            error("Buyer", "", "Buyer kosong dan tidak ada buyer default")
+
+        # Produk: SKU dulu, lalu nama (case-insensitive); produk di luar katalog wajib punya packing size
+        sku, name = text["SKU"].iat[i], text["Produk"].iat[i]
+        product = None
+        if sku:
+            product = context["skus"].get(sku.upper())
+            if product is None:
+                error("SKU", sku, "SKU tidak ada di katalog produk")
+        elif name:
+            product = context["names"].get(name.lower())
+        else:
+            error("Produk", "", "Produk / SKU kosong")
+
+        row_sizes = {}
+        for field, key in IMPORT_SIZE_FIELDS.items():
+            value = sizes[field].iat[i]
+            if filled[field].iat[i] and (pd.isna(value) or value < 0):
+                error(field, data[field].iat[i], "Ukuran harus angka >= 0")
+            row_sizes[field] = float(value) if not pd.isna(value) else float((product or {}).get(key) or 0)
+
+        if product is None and name and not sku and calculate_cbm(
+            row_sizes["Packing Size P"], row_sizes["Packing Size L"], row_sizes["Packing Size T"]
+        ) <= 0:
+            error("Produk", name, "Produk tidak ada di katalog dan packing size tidak diisi")
+
+        quantity = qty.iat[i]
+        if pd.isna(quantity) or quantity <= 0 or quantity != int(quantity):
+            error("Qty", data["Qty"].iat[i], "Qty harus bilangan bulat > 0")
+
+        order_date = order_dates.iat[i].date() if not pd.isna(order_dates.iat[i]) else None
+        if order_date is None:
+            if filled["Order Date"].iat[i]:
+                error("Order Date", data["Order Date"].iat[i], "Format tanggal tidak dikenali")
+            order_date = defaults["order_date"]
+        due_date = due_dates.iat[i].date() if not pd.isna(due_dates.iat[i]) else None
+        if due_date is None:
+            if filled["Due Date"].iat[i]:
+                error("Due Date", data["Due Date"].iat[i], "Format tanggal tidak dikenali")
+            due_date = order_date + datetime.timedelta(days=IMPORT_DEFAULT_LEAD_DAYS)
+        if due_date < order_date:
+            error("Due Date", due_date, "Due Date sebelum Order Date")
+        for column, day in (("Order Date", order_date), ("Due Date", due_date)):
+            reason = _frozen_reason(context, day)
+            if reason:
+                error(column, day, f"Tanggal frozen: {reason}")
+
+        priority = text["Prioritas"].iat[i].title() or defaults["prioritas"]
+        if priority not in IMPORT_PRIORITIES:
+            error("Prioritas", text["Prioritas"].iat[i], f"Prioritas harus salah satu dari {', '.join(IMPORT_PRIORITIES)}")
+
+        if row_errors:
+            errors.extend(row_errors)
+            continue
+
+        product = product or {}
+        is_knockdown = bool(product.get("is_knockdown", False))
+        pieces = product.get("knockdown_pieces", []) if is_knockdown else []
+        if is_knockdown:
+            cbm_per_pcs = float(product.get("knockdown_set_cbm") or sum(piece.get("cbm", 0) for piece in pieces))
+        else:
+            cbm_per_pcs = calculate_cbm(row_sizes["Packing Size P"], row_sizes["Packing Size L"], row_sizes["Packing Size T"])
+        quantity = int(quantity)
+        stack = max_stack.iat[i]
+
+        rows.append({
+            "line": line,
+            # Satu Order ID per PO + Buyer + Order Date: PO sama dari buyer / tanggal lain tidak digabung
+            "group": f"{text['PO'].iat[i]}|{buyer}|{order_date}",
+            "Order Date": order_date,
+            "Buyer": buyer,
+            "Produk": product.get("name") or name,
+            "Qty": quantity,
+            "Material": text["Material"].iat[i] or product.get("material") or "-",
+            "Finishing": text["Finishing"].iat[i] or product.get("finishing") or "-",
+            "Description": text["Description"].iat[i] or product.get("description") or "-",
+            "Product Size P": row_sizes["Product Size P"],
+            "Product Size L": row_sizes["Product Size L"],
+            "Product Size T": row_sizes["Product Size T"],
+            "Product CBM": calculate_cbm(row_sizes["Product Size P"], row_sizes["Product Size L"], row_sizes["Product Size T"]),
+            "Max Stack": int(stack) if not pd.isna(stack) and stack >= 1 else int(product.get("max_stack", 1) or 1),
+            "Packing Size P": 0.0 if is_knockdown else row_sizes["Packing Size P"],
+            "Packing Size L": 0.0 if is_knockdown else row_sizes["Packing Size L"],
+            "Packing Size T": 0.0 if is_knockdown else row_sizes["Packing Size T"],
+            "CBM per Pcs": cbm_per_pcs,
+            "Total CBM": cbm_per_pcs * quantity,
+            "Due Date": due_date,
+            "Prioritas": priority,
+            "Keterangan": text["Keterangan"].iat[i] or "-",
+            "Image Path": product.get("image_path", "") or "",
+            "Is Knockdown": is_knockdown,
+            "Knockdown Pieces": json.dumps(pieces)
+        })
+    return rows, errors
+
+def validate_import(uploaded_file, defaults, chunk_rows=IMPORT_CHUNK_ROWS):
+    """Stream the file chunk by chunk -> {"rows": valid lines, "errors": report, "total": data rows}
+
+    defaults: {"buyer", "order_date", "prioritas"} used where the file has no column / a blank cell.
+    """
+    context = _import_context(defaults)
+    rows, errors = [], []
+    column_map = None
+    first_row = 2  # Baris 1 = header
+    for chunk in read_import_chunks(uploaded_file, chunk_rows):
+        if column_map is None:
+            column_map = map_import_columns(chunk.columns)
+        chunk_rows_valid, chunk_errors = validate_import_chunk(chunk, column_map, first_row, context)
+        rows.extend(chunk_rows_valid)
+        errors.extend(chunk_errors)
+        first_row += len(chunk)
+    if column_map is None:
+        raise ValueError("File kosong")
+
+    error_lines = {error["Baris"] for error in errors}
+    return {
+        "rows": pd.DataFrame(rows),
+        "errors": pd.DataFrame(errors, columns=IMPORT_ERROR_COLUMNS),
+        "columns": column_map,
+        "total": len(rows) + len(error_lines)
+    }
+
+def commit_import(rows):
+    """Insert all validated lines in one save_data.
+
+    Each (PO, Buyer, Order Date) group becomes one Order ID with -P1..Pn lines,
+    like the input form, so every line of an Order ID shares its prefix's buyer and date. Order IDs are reserved per
+    prefix in one block; the in-memory order book only changes if the save succeeds.
+    Returns the new rows, or None if saving failed.
+    """
+    groups = list(rows.groupby("group", sort=False))
+    prefixes = {}
+    for group_key, group in groups:
+        first = group.iloc[0]
+        prefix = get_order_id_prefix(first["Order Date"], first["Buyer"])
+        prefixes.setdefault(prefix, (first["Order Date"], first["Buyer"], []))[2].append(group_key)
+    order_ids = {}
+    for order_date, buyer, group_keys in prefixes.values():
+        order_ids.update(zip(group_keys, allocate_order_ids(len(group_keys), order_date, buyer)))
+
+    first_stage = get_tracking_stages()[0]
+    new_orders = []
+    for group_key, group in groups:
+        order_id = order_ids[group_key]
+        for prod_idx, row in enumerate(group.to_dict("records")):
+            line_id = f"{order_id}-P{prod_idx+1}"
+            tracking_data = init_tracking_data()
+            tracking_data[first_stage]["qty"] = row["Qty"]
+            history = [add_history_entry(line_id, "Order Created",
+                f"Product: {row['Produk']}, Priority: {row['Prioritas']}, Type: {'Knockdown' if row['Is Knockdown'] else 'Normal'}, "
+                f"Import baris {row['line']}")]
+            order = {key: value for key, value in row.items() if key not in ("line", "group")}
+            order.update({
+                "Order ID": line_id,
+                "Progress": "0%",
+                "Proses Saat Ini": first_stage,
+                "Tracking": json.dumps(tracking_data),
+                "History": json.dumps(history)
+            })
+            new_orders.append(order)
+
+    new_df = pd.DataFrame(new_orders)
+    df = get_dataset("data_produksi")
+    combined = pd.concat([df, new_df], ignore_index=True) if not df.empty else new_df
+    if not save_data(combined):
+        return None
+    st.session_state["data_produksi"] = combined
+    return new_df
@@ -0,0 +1,446 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import datetime
+import bisect
+import json
+import os
+
+from ppic_config import (
+    INVENTORY_DB_PATH, INVENTORY_LEDGER_PATH, INVENTORY_SNAPSHOTS_PATH, INVENTORY_SNAPSHOT_EVERY,
+    INVENTORY_LEDGER_INDEX_SIZE, INVENTORY_RECEIVED_STATUSES, MRP_DEMAND_STAGES, MRP_ON_ORDER_STATUSES
+)
+from ppic_data import (
+    get_dataset, get_tracking_stages, load_inventory, iter_procurement_records, locked_file, atomic_write_json
+)
+from ppic_mrp import get_bom_table, material_key
+from ppic_planning import get_tracking_matrix
+
+# ===== MATERIAL INVENTORY LEDGER =====
+# inventory.json      : saldo per material (materialised) + qty order yang sudah diposting
+# inventory_ledger    : semua mutasi (append-only, JSON lines)
+# inventory_snapshots : saldo lengkap per hari / tiap INVENTORY_SNAPSHOT_EVERY entry, untuk query "per tanggal"
+# inventory["ledger_index"] : byte offset entry ledger terbaru per material, untuk riwayat tanpa scan ledger
+BALANCE_FIELDS = ["on_hand", "reserved", "on_order"]
+
+def _write_snapshot(inventory, offset, timestamp):
+    """Full balance copy at ledger position `offset` (entries up to inventory["seq"])"""
+    snapshot = {
+        "seq": inventory["seq"],
+        "timestamp": timestamp,
+        "offset": offset,
+        "balances": inventory["balances"]
+    }
+    with open(INVENTORY_SNAPSHOTS_PATH, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(snapshot, ensure_ascii=False) + "\n")
+    inventory["snapshot_seq"] = inventory["seq"]
+    inventory["snapshot_date"] = timestamp[:10]
+    st.session_state.pop("inventory_snapshots", None)
+
+def _apply_entry(balances, entry):
+    balance = balances.setdefault(entry["material_key"], {
+        "material": entry["material"], "unit": entry["unit"], "on_hand": 0.0, "reserved": 0.0, "on_order": 0.0
+    })
+    if not balance.get("unit") and entry["unit"]:
+        balance["unit"] = entry["unit"]
+    for field in BALANCE_FIELDS:
+        balance[field] = round(balance[field] + entry[field], 6)
+
+def _index_ledger_entry(ledger_index, key, offset):
+    offsets = ledger_index.setdefault(key, [])
+    offsets.append(offset)
+    del offsets[:-INVENTORY_LEDGER_INDEX_SIZE]
+
+def _scan_ledger_index():
+    """One-time pass over the ledger for an inventory.json written before the index existed"""
+    ledger_index = {}
+    if os.path.exists(INVENTORY_LEDGER_PATH):
+        with open(INVENTORY_LEDGER_PATH, 'rb') as f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                if line.strip():
+                    _index_ledger_entry(ledger_index, json.loads(line)["material_key"], offset)
+    return ledger_index
+
+def update_inventory(build_entries):
+    """Post ledger entries under the inventory lock and update the materialised balances.
+
+    build_entries(inventory) receives the latest inventory state from disk and
+    returns the new entries (dicts with material_key/material/unit/type/ref and
+    on_hand/reserved/on_order deltas); it may also update inventory["orders"].
+    """
+    with locked_file(INVENTORY_DB_PATH):
+        inventory = load_inventory()
+        if "ledger_index" not in inventory:
+            inventory["ledger_index"] = _scan_ledger_index()
+        entries = build_entries(inventory)
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        if entries:
+            offset = os.path.getsize(INVENTORY_LEDGER_PATH) if os.path.exists(INVENTORY_LEDGER_PATH) else 0
+            # Snapshot saldo sebelum mutasi pertama hari ini / setiap N entry
+            if inventory["seq"] and (
+                inventory["snapshot_date"] != now[:10] or
+                inventory["seq"] - inventory["snapshot_seq"] >= INVENTORY_SNAPSHOT_EVERY
+            ):
+                _write_snapshot(inventory, offset, now)
+
+            lines = []
+            position = offset
+            for entry in entries:
+                inventory["seq"] += 1
+                entry = dict(entry, seq=inventory["seq"], timestamp=now)
+                _apply_entry(inventory["balances"], entry)
+                lines.append(json.dumps(entry, ensure_ascii=False))
+                _index_ledger_entry(inventory["ledger_index"], entry["material_key"], position)
+                position += len(lines[-1].encode("utf-8")) + 1
+            with open(INVENTORY_LEDGER_PATH, 'a', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
+
+        atomic_write_json(INVENTORY_DB_PATH, inventory)
+
+    st.session_state["inventory"] = inventory
+    return len(entries)
+
+def _entry(key, material, unit, entry_type, ref, on_hand=0.0, reserved=0.0, on_order=0.0):
+    return {
+        "material_key": key, "material": material, "unit": unit, "type": entry_type, "ref": ref,
+        # + 0.0 supaya -0.0 tidak tertulis di ledger
+        "on_hand": round(float(on_hand), 6) + 0.0, "reserved": round(float(reserved), 6) + 0.0,
+        "on_order": round(float(on_order), 6) + 0.0
+    }
+
+# ===== HOOK: PROCUREMENT STATUS =====
+def _procurement_effect(status):
+    """Saldo yang diisi item procurement pada status ini"""
+    if status in MRP_ON_ORDER_STATUSES:
+        return "on_order"
+    if status in INVENTORY_RECEIVED_STATUSES:
+        return "on_hand"
+    return None
+
+def _material_units():
+    return get_bom_table().drop_duplicates("material_key").set_index("material_key")["unit"]
+
+def _procurement_entries(procurement, old_field, new_field, entry_type, units):
+    """One entry per item moving its qty from old_field to new_field"""
+    ref = f"procurement:{procurement.get('id', '-')}"
+    entries = []
+    for item in procurement.get("items", []):
+        qty = float(item.get("Jumlah Total") or 0)
+        key = material_key(item.get("Nama Barang"))
+        if not key or qty <= 0:
+            continue
+        deltas = {field: 0.0 for field in BALANCE_FIELDS}
+        if old_field:
+            deltas[old_field] -= qty
+        if new_field:
+            deltas[new_field] += qty
+        entries.append(_entry(key, str(item.get("Nama Barang")).strip(), units.get(key, ""), entry_type, ref, **deltas))
+    return entries
+
+def post_procurement_status(procurement, old_status, new_status):
+    """Move procurement item qty between on_order and on_hand when its status changes.
+    old_status=None for a new procurement, new_status=None when it is deleted."""
+    if ensure_inventory_initialized():
+        return 0  # Saldo pembuka sudah memuat status procurement saat ini
+    old_field, new_field = _procurement_effect(old_status), _procurement_effect(new_status)
+    if old_field == new_field:
+        return 0
+    if old_field == "on_hand" and new_field is None:
+        return 0  # Barang yang sudah diterima tetap di stok walau procurement dihapus
+
+    if old_field is None:
+        entry_type = "order"
+    elif new_field == "on_hand":
+        entry_type = "receipt"
+    else:
+        entry_type = "cancel" if new_field is None else "reverse"
+    units = _material_units()
+
+    def build_entries(inventory):
+        return _procurement_entries(procurement, old_field, new_field, entry_type, units)
+
+    return update_inventory(build_entries)
+
+# ===== HOOK: ORDER MATERIAL CONSUMPTION =====
+# inventory["orders"][order_id] menyimpan material yang benar-benar sudah diposting
+# ({material_key: [reserved, consumed]}) beserta signature BOM saat posting, sehingga
+# perubahan/penghapusan BOM me-release persis qty yang dulu di-reserve.
+ORDER_BOOK_COLUMNS = ["order_id", "product", "pending", "consumed"]
+
+def get_order_material_qty(df):
+    """(pending, consumed) qty per order line: before vs. past the MRP demand stages"""
+    stages = get_tracking_stages()
+    demand = np.isin(stages, MRP_DEMAND_STAGES)
+    matrix = get_tracking_matrix(df)
+    return matrix[:, demand].sum(axis=1), matrix[:, ~demand].sum(axis=1)
+
+def _bom_lines():
+    """{product: [(material_key, material, unit, qty per pcs)]} and a signature of every product BOM"""
+    lines = {}
+    for row in get_bom_table().itertuples(index=False):
+        lines.setdefault(row.product, []).append((row.material_key, row.material, row.unit, float(row.qty)))
+    signatures = {
+        product: json.dumps(sorted((key, qty) for key, _, _, qty in product_lines))
+        for product, product_lines in lines.items()
+    }
+    return lines, signatures
+
+def _order_book(df):
+    if df.empty:
+        return pd.DataFrame(columns=ORDER_BOOK_COLUMNS)
+    pending, consumed = get_order_material_qty(df)
+    return pd.DataFrame({
+        "order_id": df["Order ID"].astype(str).to_numpy(),
+        "product": df["Produk"].astype(str).to_numpy(),
+        "pending": pending,
+        "consumed": consumed
+    }).drop_duplicates("order_id")
+
+def _posted_orders(orders, bom_lines, signatures):
+    """Posted records keyed by order; the old [product, pending, consumed] format is read
+    as reserved at the current BOM (what it posted unless the BOM changed since)"""
+    for order_id, record in orders.items():
+        if isinstance(record, list):
+            product, pending, consumed = record
+            orders[order_id] = {
+                "product": product, "pending": pending, "consumed": consumed, "bom": signatures.get(product, ""),
+                "materials": {key: [round(pending * qty, 6), 0.0] for key, _, _, qty in bom_lines.get(product, [])}
+            }
+    return orders
+
+def _changed_order_ids(current, orders, signatures):
+    """Order lines whose product, qty split or BOM differs from what was posted (incl. new / removed)"""
+    posted = pd.DataFrame(
+        [(order_id, r["product"], r["pending"], r["consumed"], r["bom"]) for order_id, r in orders.items()],
+        columns=ORDER_BOOK_COLUMNS + ["bom"]
+    )
+    current = current.assign(bom=current["product"].map(signatures).fillna(""))
+    current = current[(current["bom"] != "") | current["order_id"].isin(posted["order_id"])]
+    merged = current.merge(posted, on="order_id", how="outer", suffixes=("", "_prev"))
+    differs = np.zeros(len(merged), dtype=bool)
+    for column in ["product", "pending", "consumed", "bom"]:
+        differs |= (merged[column] != merged[f"{column}_prev"]).fillna(True).to_numpy(dtype=bool)
+    return merged.loc[differs, "order_id"].tolist()
+
+def _order_entries(inventory, current, bom_lines, signatures):
+    """Entries that bring the posted material of every changed order line in line with the order book.
+
+    Reservations are reconciled against exactly what was posted per material.
+    Consumption is posted at the BOM in force when qty leaves the demand stages,
+    and reversed pro rata from what was actually consumed.
+    """
+    orders = _posted_orders(inventory["orders"], bom_lines, signatures)
+    changed = _changed_order_ids(current, orders, signatures)
+    rows = current[current["order_id"].isin(changed)].set_index("order_id").to_dict("index")
+    names = {key: (material, unit) for lines in bom_lines.values() for key, material, unit, _ in lines}
+
+    entries = []
+    for order_id in changed:
+        previous = orders.pop(order_id, None)
+        previous_materials = previous["materials"] if previous else {}
+        row = rows.get(order_id)
+        materials = {}
+        consumed = {}
+
+        if row is not None:
+            lines = bom_lines.get(row["product"], [])
+            if previous and previous["product"] == row["product"]:
+                materials = {key: [0.0, used] for key, (_, used) in previous_materials.items() if used}
+                moved = row["consumed"] - previous["consumed"]
+                if moved > 0:
+                    for key, _, _, qty in lines:
+                        consumed[key] = consumed.get(key, 0.0) + moved * qty
+                elif moved < 0 and previous["consumed"] > 0:
+                    share = min(-moved / previous["consumed"], 1.0)
+                    for key, (_, used) in previous_materials.items():
+                        if used:
+                            consumed[key] = consumed.get(key, 0.0) - used * share
+                for key, qty in consumed.items():
+                    materials.setdefault(key, [0.0, 0.0])[1] += qty
+            # Order baru / produk berubah: qty yang sudah lewat tahap demand dianggap terpakai sebelum ledger
+            for key, _, _, qty in lines:
+                materials.setdefault(key, [0.0, 0.0])[0] = row["pending"] * qty
+
+        for key in sorted(set(materials) | set(previous_materials) | set(consumed)):
+            reserved = materials.get(key, [0.0, 0.0])[0] - previous_materials.get(key, [0.0, 0.0])[0]
+            on_hand = -consumed.get(key, 0.0)
+            if abs(reserved) < 1e-9 and abs(on_hand) < 1e-9:
+                continue
+            balance = inventory["balances"].get(key, {})
+            material, unit = names.get(key, (balance.get("material", key), balance.get("unit", "")))
+            entry_type = "consume" if on_hand else ("reserve" if reserved > 0 else "release")
+            entries.append(_entry(key, material, unit, entry_type, f"order:{order_id}", on_hand=on_hand, reserved=reserved))
+
+        materials = {key: [round(r, 6), round(c, 6)] for key, (r, c) in materials.items() if abs(r) > 1e-9 or abs(c) > 1e-9}
+        if row is not None and (materials or row["product"] in signatures):
+            orders[order_id] = {
+                "product": row["product"], "pending": float(row["pending"]), "consumed": float(row["consumed"]),
+                "bom": signatures.get(row["product"], ""), "materials": materials
+            }
+    return entries
+
+def sync_order_materials(df):
+    """Reserve BOM material for pending qty and consume it when qty leaves the demand stages.
+
+    Only order lines that differ from what was posted get entries, so each save
+    costs one ledger entry per changed order line and material. Orders seen for
+    the first time are treated as having taken their material before the ledger
+    existed: their pending qty is reserved, nothing is consumed.
+    """
+    if ensure_inventory_initialized():
+        return 0  # Saldo pembuka sudah memuat kondisi order saat ini
+    bom_lines, signatures = _bom_lines()
+    current = _order_book(df)
+    posted = _posted_orders(dict(st.session_state["inventory"]["orders"]), bom_lines, signatures)
+    if not _changed_order_ids(current, posted, signatures):
+        return 0
+
+    def build_entries(inventory):
+        return _order_entries(inventory, current, bom_lines, signatures)
+
+    return update_inventory(build_entries)
+
+def adjust_stock(material, counted_qty, ref="stock opname"):
+    """Set physical on-hand qty of a material (stock opname); posts the difference"""
+    ensure_inventory_initialized()
+    key = material_key(material)
+
+    def build_entries(inventory):
+        current = inventory["balances"].get(key, {}).get("on_hand", 0.0)
+        difference = float(counted_qty) - current
+        if not key or abs(difference) < 1e-9:
+            return []
+        unit = inventory["balances"].get(key, {}).get("unit", "")
+        return [_entry(key, str(material).strip(), unit, "adjust", ref, on_hand=difference)]
+
+    return update_inventory(build_entries)
+
+def initialize_inventory():
+    """Opening balances: on-order from Open/Ordered procurement, reservations for open orders.
+    Physical stock starts at zero and is set with a stock opname.
+
+    Everything is posted in one locked update that re-checks the flag on disk, so a
+    session with a stale copy cannot post the opening twice. True if this call did it.
+    """
+    units = _material_units()
+    bom_lines, signatures = _bom_lines()
+    current = _order_book(get_dataset("data_produksi"))
+    procurements = list(iter_procurement_records())
+    opened = []
+
+    def build_entries(inventory):
+        if inventory.get("initialized"):
+            return []
+        inventory["initialized"] = True
+        opened.append(True)
+        entries = []
+        for procurement in procurements:
+            if _procurement_effect(procurement.get("status", "Open")) == "on_order":
+                entries += _procurement_entries(procurement, None, "on_order", "order", units)
+        return entries + _order_entries(inventory, current, bom_lines, signatures)
+
+    update_inventory(build_entries)
+    return bool(opened)
+
+def ensure_inventory_initialized():
+    """Post opening balances on a fresh install; True when that just happened"""
+    if get_dataset("inventory").get("initialized"):
+        return False
+    # Salinan di session bisa basi: baca ulang flag dari disk sebelum posting saldo pembuka
+    inventory = load_inventory()
+    if inventory.get("initialized"):
+        st.session_state["inventory"] = inventory
+        return False
+    return initialize_inventory()
+
+# ===== QUERIES =====
+def get_inventory():
+    """Materialised inventory state (balances, posted order qty, ledger position)"""
+    ensure_inventory_initialized()
+    return st.session_state["inventory"]
+
+def get_material_balance(material):
+    """O(1) balance lookup for one material"""
+    balance = get_inventory()["balances"].get(material_key(material))
+    if balance is None:
+        return {"on_hand": 0.0, "reserved": 0.0, "on_order": 0.0, "available": 0.0}
+    return dict(balance, available=round(balance["on_hand"] - balance["reserved"], 6))
+
+def balances_to_frame(balances):
+    frame = pd.DataFrame.from_dict(balances, orient="index", columns=["material", "unit"] + BALANCE_FIELDS)
+    frame.index.name = "material_key"
+    frame[BALANCE_FIELDS] = frame[BALANCE_FIELDS].astype(float)
+    frame["available"] = frame["on_hand"] - frame["reserved"]
+    return frame
+
+def get_inventory_balances():
+    """All balances as a DataFrame indexed by material_key, cached per ledger seq"""
+    inventory = get_inventory()
+    cached = st.session_state.get("inventory_frame")
+    if cached is None or cached[0] != (inventory["seq"], id(inventory)):
+        cached = ((inventory["seq"], id(inventory)), balances_to_frame(inventory["balances"]))
+        st.session_state["inventory_frame"] = cached
+    return cached[1]
+
+def get_inventory_snapshots():
+    """Snapshot headers (timestamp, seq, ledger offset, file position); balances are read only for the one used"""
+    if "inventory_snapshots" not in st.session_state:
+        snapshots = []
+        if os.path.exists(INVENTORY_SNAPSHOTS_PATH):
+            with open(INVENTORY_SNAPSHOTS_PATH, 'r', encoding='utf-8') as f:
+                while True:
+                    position = f.tell()
+                    line = f.readline()
+                    if not line:
+                        break
+                    if line.strip():
+                        header = json.loads(line)
+                        snapshots.append((header["timestamp"], header["seq"], header["offset"], position))
+        st.session_state["inventory_snapshots"] = snapshots
+    return st.session_state["inventory_snapshots"]
+
+def get_inventory_as_of(as_of_date):
+    """Balances at the end of a date: nearest snapshot before it + the ledger entries after it"""
+    end_ts = f"{as_of_date} 23:59:59"
+    snapshots = get_inventory_snapshots()
+    pos = bisect.bisect_right([snap[0] for snap in snapshots], end_ts) - 1
+
+    balances, offset = {}, 0
+    if pos >= 0:
+        _, _, offset, line_position = snapshots[pos]
+        with open(INVENTORY_SNAPSHOTS_PATH, 'r', encoding='utf-8') as f:
+            f.seek(line_position)
+            balances = json.loads(f.readline())["balances"]
+
+    if os.path.exists(INVENTORY_LEDGER_PATH):
+        with open(INVENTORY_LEDGER_PATH, 'r', encoding='utf-8') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if entry["timestamp"] > end_ts:
+                    break
+                _apply_entry(balances, entry)
+    return balances_to_frame(balances)
+
+def get_material_ledger(material, limit=50):
+    """Latest ledger entries of one material (newest first, at most INVENTORY_LEDGER_INDEX_SIZE).
+    Reads only the indexed lines; the ledger itself is never scanned."""
+    inventory = get_inventory()
+    if "ledger_index" not in inventory:
+        update_inventory(lambda inventory: [])
+        inventory = get_inventory()
+    offsets = inventory["ledger_index"].get(material_key(material), [])[-limit:]
+    entries = []
+    if offsets:
+        with open(INVENTORY_LEDGER_PATH, 'rb') as f:
+            for offset in reversed(offsets):
+                f.seek(offset)
+                entries.append(json.loads(f.readline()))
+    return entries
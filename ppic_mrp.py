@@ -0,0 +1,166 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import datetime
+import json
+
+from ppic_config import MRP_DEMAND_STAGES
+from ppic_data import get_data_version, get_dataset, get_tracking_stages
+from ppic_planning import get_tracking_matrix
+
+# ===== BILL OF MATERIALS =====
+BOM_COLUMNS = ["material", "unit", "qty", "price"]
+GROSS_COLUMNS = ["order_id", "buyer", "product", "material_key", "material", "unit", "required", "price"]
+
+def material_key(name):
+    """Material names are matched case-insensitively ("Kayu Jati" == "kayu jati ")"""
+    return str(name or "").strip().lower()
+
+def normalize_bom(rows):
+    """Clean BOM rows from the editor: drop blank lines, merge duplicate materials"""
+    bom = {}
+    for row in rows:
+        name = str(row.get("material") or "").strip()
+        qty = pd.to_numeric(row.get("qty"), errors="coerce")
+        if not name or pd.isna(qty) or qty <= 0:
+            continue
+        price = pd.to_numeric(row.get("price"), errors="coerce")
+        key = material_key(name)
+        if key in bom:
+            bom[key]["qty"] = round(bom[key]["qty"] + float(qty), 6)
+        else:
+            bom[key] = {
+                "material": name,
+                "unit": row.get("unit") or "pcs",
+                "qty": float(qty),
+                "price": 0.0 if pd.isna(price) else float(price)
+            }
+    return list(bom.values())
+
+def _bom_key():
+    products = get_dataset("products")
+    return (st.session_state.get("products_version", 0), id(products), len(products))
+
+def get_bom_table():
+    """All product BOMs as one table (qty per pcs/set), rebuilt only after a catalogue save"""
+    key = _bom_key()
+    cached = st.session_state.get("bom_table")
+    if cached is None or cached[0] != key:
+        rows = [
+            dict(line, product=product.get("name", ""))
+            for product in get_dataset("products")
+            for line in product.get("bom", [])
+        ]
+        table = pd.DataFrame(rows, columns=["product"] + BOM_COLUMNS)
+        table["material_key"] = table["material"].map(material_key).astype(object)
+        cached = (key, table)
+        st.session_state["bom_table"] = cached
+    return cached[1]
+
+# ===== MRP ENGINE =====
+def _pending_material_qty(tracking_values):
+    """Qty still before production (MRP_DEMAND_STAGES) for a few order lines"""
+    pending = np.zeros(len(tracking_values))
+    for i, tracking_json in enumerate(tracking_values):
+        try:
+            tracking_data = json.loads(tracking_json)
+        except:
+            continue
+        pending[i] = sum(tracking_data.get(stage, {}).get("qty", 0) for stage in MRP_DEMAND_STAGES)
+    return pending
+
+def get_pending_material_qty(df):
+    """Qty per order line that has not consumed material yet, from the cached tracking matrix"""
+    stages = get_tracking_stages()
+    columns = [stages.index(stage) for stage in MRP_DEMAND_STAGES]
+    return get_tracking_matrix(df)[:, columns].sum(axis=1)
+
+def explode_requirements(orders, pending, bom):
+    """Gross requirement per order line x material in one merge over the order book"""
+    demand = pd.DataFrame({
+        "order_id": orders["Order ID"].astype(str).to_numpy(),
+        "buyer": orders["Buyer"].to_numpy(),
+        "product": orders["Produk"].to_numpy(),
+        "pending": pending
+    })
+    demand = demand[demand["pending"] > 0]
+    gross = demand.merge(bom, on="product", how="inner")
+    gross["required"] = gross["pending"] * gross["qty"]
+    return gross[GROSS_COLUMNS]
+
+def build_mrp_state(df):
+    return {
+        "data_version": get_data_version(),
+        "bom_key": _bom_key(),
+        "gross": explode_requirements(df, get_pending_material_qty(df), get_bom_table())
+    }
+
+def get_mrp_gross(df):
+    """Cached gross requirements, rebuilt when orders or BOMs changed outside refresh_mrp_orders"""
+    state = st.session_state.get("mrp_state")
+    if state is None or state["data_version"] != get_data_version() or state["bom_key"] != _bom_key():
+        state = build_mrp_state(df)
+        st.session_state["mrp_state"] = state
+    return state["gross"]
+
+def refresh_mrp_orders(df, changed_order_ids):
+    """Re-explode only the changed order lines after a save.
+    Nothing is computed until the MRP tab has been opened once."""
+    state = st.session_state.get("mrp_state")
+    if state is None:
+        return None
+    if state["bom_key"] != _bom_key() or state["data_version"] < get_data_version() - 1:
+        # Ada perubahan lain yang tidak tercatat: hitung ulang penuh saat dibuka
+        del st.session_state["mrp_state"]
+        return None
+
+    changed = {str(order_id) for order_id in changed_order_ids}
+    rows = df[df["Order ID"].astype(str).isin(changed)]
+    fresh = explode_requirements(rows, _pending_material_qty(rows["Tracking"].tolist()), get_bom_table())
+    kept = state["gross"][~state["gross"]["order_id"].isin(changed)]
+    state["gross"] = pd.concat([kept, fresh], ignore_index=True) if not fresh.empty else kept
+    state["data_version"] = get_data_version()
+    return state
+
+def calculate_net_requirements(gross, on_hand=None, on_order=None):
+    """Net requirement per material = gross - on hand - on order (never below zero)"""
+    summary = gross.groupby("material_key").agg(
+        material=("material", "first"),
+        unit=("unit", "first"),
+        gross=("required", "sum"),
+        orders=("order_id", "nunique"),
+        price=("price", "max")
+    )
+    for column, stock in (("on_hand", on_hand), ("on_order", on_order)):
+        summary[column] = stock.reindex(summary.index).fillna(0.0) if stock is not None else 0.0
+    summary["net"] = (summary["gross"] - summary["on_hand"] - summary["on_order"]).clip(lower=0)
+    summary["estimated_cost"] = summary["net"] * summary["price"]
+    return summary.reset_index().sort_values(["net", "gross"], ascending=False, ignore_index=True)
+
+def build_procurement_suggestion(net, gross):
+    """Open procurement entry covering every material with a net shortage"""
+    short = net[net["net"] > 0]
+    if short.empty:
+        return None
+    buyers = sorted(gross.loc[gross["material_key"].isin(short["material_key"]), "buyer"].astype(str).unique())
+    items = [
+        {
+            "Nama Barang": row["material"],
+            "Jumlah per Pcs": 0.0,
+            "Jumlah Total": round(float(row["net"]), 4),
+            "Harga per Unit": float(row["price"]),
+            "Harga Total": float(row["estimated_cost"])
+        }
+        for _, row in short.iterrows()
+    ]
+    now = datetime.datetime.now()
+    return {
+        "nama_produk": "MRP Suggestion",
+        "buyer": ", ".join(buyers) if buyers else "-",
+        "tanggal": str(now.date()),
+        "notes": f"Kebutuhan bersih material dari MRP run {now.strftime('%Y-%m-%d %H:%M')}",
+        "status": "Open",
+        "items": items,
+        "created_at": str(now),
+        "source": "MRP"
+    }
@@ -0,0 +1,254 @@
+import streamlit as st
+import datetime
+import calendar
+import numpy as np
+import pandas as pd
+
+from ppic_config import (
+    DEFAULT_HOURLY_RATE, DEFAULT_DAILY_WAGE, REGULAR_HOURS_PER_DAY, PAYROLL_WEEKMASK, OVERTIME_TIERS
+)
+from ppic_data import get_dataset, get_frozen_date_range
+
+# ===== OVERTIME CALCULATION FUNCTIONS - NEW =====
+def calculate_overtime_hours(check_in_time, check_out_time):
+    """Calculate overtime hours from check-out time"""
+    try:
+        if isinstance(check_out_time, str):
+            checkout = datetime.datetime.strptime(check_out_time, "%H:%M").time()
+        else:
+            checkout = check_out_time
+        
+        # Regular end time is 16:00
+        regular_end = datetime.time(16, 0)
+        
+        # Convert to datetime for calculation
+        checkout_dt = datetime.datetime.combine(datetime.date.today(), checkout)
+        regular_end_dt = datetime.datetime.combine(datetime.date.today(), regular_end)
+        
+        # Calculate overtime
+        if checkout_dt > regular_end_dt:
+            overtime_delta = checkout_dt - regular_end_dt
+            overtime_hours = overtime_delta.total_seconds() / 3600
+            return overtime_hours
+        return 0.0
+    except:
+        return 0.0
+
+def calculate_overtime_cost(overtime_hours, hourly_rate=DEFAULT_HOURLY_RATE, tiers=OVERTIME_TIERS):
+    """Calculate overtime cost based on labor law (tier table, default 1.5x jam pertama lalu 2.0x)"""
+    if overtime_hours <= 0:
+        return 0
+    return float(calculate_overtime_cost_array(overtime_hours, hourly_rate, tiers))
+
+# ===== ATTENDANCE GRID (VECTORISED) =====
+ATTENDANCE_STATUSES = ["Hadir", "Izin", "Sakit", "Tidak Hadir"]
+DEFAULT_CHECK_IN = "08:00"
+REGULAR_END_MINUTES = 16 * 60  # Jam pulang normal 16:00
+
+def parse_time_minutes(values):
+    """Convert a Series of "HH:MM" strings or time objects to minutes after midnight (NaN if empty/invalid)"""
+    parts = values.astype("string").str.extract(r"^\s*(\d{1,2}):(\d{2})")
+    minutes = parts[0].astype(float) * 60 + parts[1].astype(float)
+    return minutes.where(minutes < 24 * 60)
+
+def format_time_minutes(minutes):
+    """Format minutes after midnight as "HH:MM" strings ("-" when empty)"""
+    valid = minutes.notna()
+    whole = minutes.fillna(0).astype(int)
+    text = (whole // 60).astype(str).str.zfill(2) + ":" + (whole % 60).astype(str).str.zfill(2)
+    return text.where(valid, "-")
+
+def calculate_overtime_cost_array(overtime_hours, hourly_rate=DEFAULT_HOURLY_RATE, tiers=OVERTIME_TIERS):
+    """Vectorised calculate_overtime_cost; hourly_rate may be a scalar or one rate per row"""
+    hours = np.clip(np.asarray(overtime_hours, dtype=float), 0, None)
+    rate = np.asarray(hourly_rate, dtype=float)
+    cost = np.zeros_like(hours)
+    lower = 0.0
+    for upper, multiplier in tiers:
+        upper = np.inf if upper is None else float(upper)
+        cost = cost + np.clip(hours - lower, 0, upper - lower) * rate * multiplier
+        lower = upper
+    return cost
+
+def build_attendance_grid(workers, existing_records):
+    """Build the daily attendance grid (one row per worker) from saved records"""
+    rows = []
+    for idx, worker in enumerate(workers):
+        worker_id = worker.get("id", str(idx))
+        existing = existing_records.get(worker_id, {})
+        rows.append({
+            "worker_id": worker_id,
+            "name": worker.get("name", "Unknown"),
+            "position": worker.get("position", "-"),
+            "status": existing.get("status", "Hadir"),
+            "check_in": existing.get("check_in", DEFAULT_CHECK_IN),
+            "check_out": existing.get("check_out", "-")
+        })
+    
+    grid = pd.DataFrame(rows, columns=["worker_id", "name", "position", "status", "check_in", "check_out"])
+    for col in ["check_in", "check_out"]:
+        minutes = parse_time_minutes(grid[col])
+        times = pd.to_datetime(minutes, unit="m", origin="1970-01-01").dt.time
+        grid[col] = times.astype(object).where(minutes.notna(), None)
+    return grid
+
+def validate_attendance_grid(grid):
+    """Validate status and time order for the whole grid at once and compute overtime
+    
+    Returns (records_df, errors); records_df has "HH:MM" strings plus
+    overtime_hours/overtime_cost/error columns, errors is a list of messages.
+    """
+    df = grid.copy()
+    df["status"] = df["status"].fillna("Tidak Hadir")
+    check_in = parse_time_minutes(df["check_in"])
+    check_out = parse_time_minutes(df["check_out"])
+    
+    hadir = df["status"] == "Hadir"
+    # Hanya status Hadir yang punya jam masuk/pulang
+    check_in = check_in.where(hadir)
+    check_out = check_out.where(hadir)
+    
+    checks = [
+        (~df["status"].isin(ATTENDANCE_STATUSES), "status tidak valid"),
+        (hadir & check_in.isna(), "jam masuk wajib diisi untuk status Hadir"),
+        (check_out.notna() & (check_out <= check_in), "jam pulang harus setelah jam masuk")
+    ]
+    # Satu pesan per baris (error pertama yang ditemukan)
+    df["error"] = ""
+    for mask, message in checks:
+        df.loc[mask & (df["error"] == ""), "error"] = message
+    invalid = df[df["error"] != ""]
+    errors = (invalid["name"].astype(str) + ": " + invalid["error"]).tolist()
+    
+    overtime_minutes = (check_out - REGULAR_END_MINUTES).clip(lower=0).fillna(0)
+    df["check_in"] = format_time_minutes(check_in)
+    df["check_out"] = format_time_minutes(check_out)
+    df["overtime_hours"] = overtime_minutes / 60
+    df["overtime_cost"] = calculate_overtime_cost_array(df["overtime_hours"])
+    return df, errors
+
+def summarize_attendance_grid(records_df):
+    """Status counts and overtime totals for a validated grid"""
+    counts = records_df["status"].value_counts()
+    overtime = records_df["overtime_hours"]
+    return {
+        "total_workers": len(records_df),
+        "hadir": int(counts.get("Hadir", 0)),
+        "tidak_hadir": int(counts.get("Tidak Hadir", 0)),
+        "izin": int(counts.get("Izin", 0)),
+        "sakit": int(counts.get("Sakit", 0)),
+        "overtime_hours": float(overtime.sum()),
+        "overtime_workers": int((overtime > 0).sum()),
+        "overtime_cost": float(records_df["overtime_cost"].sum())
+    }
+
+# ===== PAYROLL ENGINE =====
+def get_payroll_holidays():
+    """Hari libur (holidays.json) + frozen dates, sorted tuple of "YYYY-MM-DD" strings"""
+    dates = {h.get("date") for h in get_dataset("holidays")} | set(get_frozen_date_range())
+    return tuple(sorted(d for d in dates if d))
+
+@st.cache_data(show_spinner=False)
+def count_working_days(start_date, end_date, holidays=()):
+    """Working days (Senin-Sabtu, minus holidays) from start_date to end_date inclusive"""
+    end_exclusive = np.datetime64(end_date, "D") + 1
+    count = np.busday_count(np.datetime64(start_date, "D"), end_exclusive, weekmask=PAYROLL_WEEKMASK, holidays=list(holidays))
+    return max(int(count), 0)
+
+def get_working_days_in_month(year, month):
+    """Calculate working days (Monday-Saturday, minus holidays/frozen days) in a month"""
+    num_days = calendar.monthrange(year, month)[1]
+    return count_working_days(datetime.date(year, month, 1), datetime.date(year, month, num_days), get_payroll_holidays())
+
+def get_worker_rates(workers):
+    """Per-worker hourly_rate/daily_wage from workers.json, falling back to the defaults"""
+    rates = pd.DataFrame(workers, columns=["id", "name", "hourly_rate", "daily_wage"]).rename(columns={"id": "worker_id"})
+    rates["hourly_rate"] = pd.to_numeric(rates["hourly_rate"], errors="coerce").fillna(DEFAULT_HOURLY_RATE)
+    rates["daily_wage"] = pd.to_numeric(rates["daily_wage"], errors="coerce").fillna(DEFAULT_DAILY_WAGE)
+    return rates.drop_duplicates("worker_id")
+
+def flatten_attendance(attendance_list, dates=None, start_date=None, end_date=None):
+    """Saved attendance records as one row per worker per day.
+    Filter by a set of "YYYY-MM-DD" dates and/or an inclusive start/end date range."""
+    start_str = str(start_date) if start_date else ""
+    end_str = str(end_date) if end_date else "9999-12-31"
+    rows = [
+        (att.get("date"), worker_id, record.get("name", "Unknown"), record.get("position", "-"),
+         record.get("status", "Tidak Hadir"), record.get("check_in", "-"), record.get("check_out", "-"))
+        for att in attendance_list
+        if start_str <= att.get("date", "") <= end_str and (dates is None or att.get("date") in dates)
+        for worker_id, record in att.get("records", {}).items()
+    ]
+    return pd.DataFrame(rows, columns=["date", "worker_id", "name", "position", "status", "check_in", "check_out"])
+
+def calculate_payroll_period(attendance_list, workers, start_date, end_date, tiers=OVERTIME_TIERS):
+    """Payroll for every worker over any period in one vectorised pass
+    
+    Returns (per_worker_df, working_days). Overtime tiers are applied per day
+    with each worker's own hourly_rate; regular pay is daily_wage per day Hadir.
+    """
+    working_days = count_working_days(start_date, end_date, get_payroll_holidays())
+    rates = get_worker_rates(workers)
+    days = flatten_attendance(attendance_list, start_date=start_date, end_date=end_date)
+    days = days.merge(rates[["worker_id", "hourly_rate", "daily_wage"]], on="worker_id", how="left")
+    days["hourly_rate"] = days["hourly_rate"].fillna(DEFAULT_HOURLY_RATE)
+    days["daily_wage"] = days["daily_wage"].fillna(DEFAULT_DAILY_WAGE)
+    
+    hadir = days["status"] == "Hadir"
+    check_out = parse_time_minutes(days["check_out"])
+    days["overtime_hours"] = ((check_out - REGULAR_END_MINUTES).clip(lower=0).fillna(0) / 60).where(hadir, 0.0)
+    days["overtime_cost"] = calculate_overtime_cost_array(days["overtime_hours"], days["hourly_rate"], tiers)
+    days["regular_cost"] = days["daily_wage"].where(hadir, 0.0)
+    for status, col in [("Hadir", "hadir"), ("Tidak Hadir", "tidak_hadir"), ("Izin", "izin"), ("Sakit", "sakit")]:
+        days[col] = (days["status"] == status).astype(int)
+    
+    per_worker = days.groupby("worker_id").agg(
+        name=("name", "last"),
+        hadir=("hadir", "sum"),
+        tidak_hadir=("tidak_hadir", "sum"),
+        izin=("izin", "sum"),
+        sakit=("sakit", "sum"),
+        overtime_hours=("overtime_hours", "sum"),
+        overtime_cost=("overtime_cost", "sum"),
+        regular_cost=("regular_cost", "sum")
+    )
+    
+    # Semua pekerja terdaftar tetap muncul walau belum ada absensi
+    registered = rates.set_index("worker_id")
+    per_worker = per_worker.reindex(per_worker.index.union(registered.index))
+    per_worker["name"] = per_worker["name"].fillna(registered["name"])
+    per_worker = per_worker.fillna(0)
+    per_worker["hourly_rate"] = registered["hourly_rate"].reindex(per_worker.index).fillna(DEFAULT_HOURLY_RATE)
+    per_worker["daily_wage"] = registered["daily_wage"].reindex(per_worker.index).fillna(DEFAULT_DAILY_WAGE)
+    per_worker["total_cost"] = per_worker["regular_cost"] + per_worker["overtime_cost"]
+    regular_hours = working_days * REGULAR_HOURS_PER_DAY
+    per_worker["overtime_rate"] = (per_worker["overtime_hours"] / regular_hours * 100) if regular_hours > 0 else 0.0
+    return per_worker.reset_index(), working_days
+
+def calculate_monthly_overtime_metrics(attendance_list, year, month):
+    """Calculate overtime metrics for a specific month"""
+    num_days = calendar.monthrange(year, month)[1]
+    payroll, _ = calculate_payroll_period(
+        attendance_list, get_dataset("workers"),
+        datetime.date(year, month, 1), datetime.date(year, month, num_days)
+    )
+    # Hanya pekerja yang hadir di bulan tersebut
+    payroll = payroll[payroll["hadir"] > 0]
+    
+    total_overtime_cost = float(payroll["overtime_cost"].sum())
+    total_regular_cost = float(payroll["regular_cost"].sum())
+    top_workers = payroll.nlargest(3, "overtime_hours")
+    
+    return {
+        "total_overtime_hours": float(payroll["overtime_hours"].sum()),
+        "total_workers": len(payroll),
+        "workers_with_overtime": int((payroll["overtime_hours"] > 0).sum()),
+        "avg_overtime_rate": float(payroll["overtime_rate"].mean()) if len(payroll) else 0,
+        "total_overtime_cost": total_overtime_cost,
+        "regular_cost": total_regular_cost,
+        "cost_increase_pct": (total_overtime_cost / total_regular_cost * 100) if total_regular_cost > 0 else 0,
+        "top_overtime_workers": [
+            {"name": row.name, "hours": row.overtime_hours, "rate": row.overtime_rate, "cost": row.overtime_cost}
+            for row in top_workers.itertuples()
+        ]
+    }
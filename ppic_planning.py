@@ -0,0 +1,559 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import datetime
+import json
+import os
+
+from ppic_config import (
+    MAX_STACK_HEIGHT_CM, STORAGE_ZONES, STORAGE_LEDGER_DB_PATH, TOTAL_STORAGE_AREA_M2
+)
+from ppic_data import (
+    get_data_version, get_frozen_date_range, get_dataset, get_tracking_stages,
+    get_storage_stages
+)
+
+def calculate_storage_usage(df):
+    """Calculate total storage floor area used (only items in storage stages)"""
+    return sum(data["area"] for data in calculate_storage_snapshot(df).values())
+
+# ===== PRODUCTION CALENDAR DATA =====
+def get_calendar_month_data(df, year, month):
+    """Group orders of one month by Due Date in one pass, cached per (year, month, data version)"""
+    cache = st.session_state.setdefault("calendar_cache", {})
+    data_version = get_data_version()
+    cache_key = (year, month, data_version)
+    if cache_key in cache:
+        return cache[cache_key]
+    
+    due_dates = pd.to_datetime(df["Due Date"])
+    month_mask = (due_dates.dt.year == year) & (due_dates.dt.month == month)
+    df_month = df.loc[month_mask, ["Order ID", "Buyer", "Produk", "Qty", "Progress", "Tracking Status"]].copy()
+    df_month["Due Day"] = due_dates[month_mask].dt.date
+    
+    calendar_data = {}
+    for due_day, orders_on_date in df_month.groupby("Due Day", sort=True):
+        orders = orders_on_date.to_dict("records")
+        done_count = int((orders_on_date["Tracking Status"] == "Done").sum())
+        tooltip_items = [
+            f"{'✅' if order['Tracking Status'] == 'Done' else '🔄'} {order['Order ID']} - {order['Buyer']}"
+            for order in orders
+        ]
+        calendar_data[due_day] = {
+            "orders": orders,
+            "done": done_count,
+            "ongoing": len(orders) - done_count,
+            "tooltip": "\\n".join(tooltip_items)
+        }
+    
+    # Drop entries from older data versions so the cache stays small
+    for key in [k for k in cache if k[2] != data_version]:
+        del cache[key]
+    cache[cache_key] = calendar_data
+    return calendar_data
+
+# ===== GANTT ENGINE =====
+GANTT_PRIORITY_COLORS = {"High": "#EF4444", "Medium": "#F59E0B", "Low": "#3B82F6"}
+GANTT_PRIORITY_RANK = {"High": 0, "Medium": 1, "Low": 2}
+GANTT_LEVELS = ["Order Line", "Order Header", "Buyer"]
+GANTT_ROWS_PER_VIEW = 40
+GANTT_ROW_HEIGHT = 26
+
+def build_gantt_rows(df, level="Order Line"):
+    """Build one Gantt row per order line, order header (ORD-xxxx) or buyer.
+    Progress is qty-weighted, priority is the highest one in the group."""
+    rows = pd.DataFrame({
+        "Order ID": df["Order ID"].astype(str),
+        "Buyer": df["Buyer"].astype(str),
+        "Produk": df["Produk"].astype(str),
+        "Start": pd.to_datetime(df["Order Date"]),
+        "Finish": pd.to_datetime(df["Due Date"]),
+        "Qty": pd.to_numeric(df["Qty"], errors="coerce").fillna(0),
+        "Progress": pd.to_numeric(df["Progress"].astype(str).str.rstrip('%'), errors="coerce").fillna(0),
+        "Priority Rank": df["Prioritas"].map(GANTT_PRIORITY_RANK).fillna(2).astype(int)
+    })
+    
+    if level == "Order Line":
+        rows["Task"] = rows["Order ID"] + " - " + rows["Produk"].str[:30]
+        rows["Lines"] = 1
+    else:
+        if level == "Order Header":
+            rows["Task"] = rows["Order ID"].str.replace(r"-P\d+$", "", regex=True) + " - " + rows["Buyer"]
+        else:
+            rows["Task"] = rows["Buyer"]
+        rows["Weighted"] = rows["Progress"] * rows["Qty"]
+        rows = rows.groupby("Task", sort=False).agg(
+            Start=("Start", "min"),
+            Finish=("Finish", "max"),
+            Qty=("Qty", "sum"),
+            Weighted=("Weighted", "sum"),
+            Progress=("Progress", "mean"),
+            Lines=("Order ID", "count"),
+            **{"Priority Rank": ("Priority Rank", "min")}
+        ).reset_index()
+        has_qty = rows["Qty"] > 0
+        rows.loc[has_qty, "Progress"] = rows.loc[has_qty, "Weighted"] / rows.loc[has_qty, "Qty"]
+    
+    rank_to_priority = {rank: priority for priority, rank in GANTT_PRIORITY_RANK.items()}
+    rows["Prioritas"] = rows["Priority Rank"].map(rank_to_priority)
+    
+    # Bars whose due date falls on a frozen date get a hatch pattern
+    frozen_days = pd.to_datetime(pd.Series(get_frozen_date_range(), dtype="object"))
+    rows["Frozen Due"] = rows["Finish"].dt.normalize().isin(frozen_days)
+    
+    rows = rows.sort_values(["Finish", "Priority Rank", "Task"]).reset_index(drop=True)
+    return rows[["Task", "Start", "Finish", "Qty", "Progress", "Prioritas", "Lines", "Frozen Due"]]
+
+def get_frozen_intervals():
+    """Stored frozen intervals as [start, end] days, merged across reasons"""
+    intervals = []
+    for frozen in sorted(get_dataset("frozen_dates"), key=lambda x: x["start"]):
+        start, end = datetime.date.fromisoformat(frozen["start"]), datetime.date.fromisoformat(frozen["end"])
+        if intervals and (start - intervals[-1][1]).days <= 1:
+            intervals[-1][1] = max(intervals[-1][1], end)
+        else:
+            intervals.append([start, end])
+    return intervals
+
+# ===== PRODUCTION SCHEDULER =====
+# Kapasitas per workstation (pcs/hari) pada headcount penuh
+STAGE_CAPACITY_PCS_PER_DAY = {
+    "Pre Order": 200, "Order di Supplier": 200, "Warehouse": 150,
+    "Fitting 1": 40, "Amplas": 30, "Revisi 1": 40,
+    "Spray": 25, "Fitting 2": 40, "Revisi Fitting 2": 40,
+    "Packaging": 60
+}
+
+def get_headcount_factor(days=7):
+    """Average share of workers present (Hadir) over the latest attendance days"""
+    workers = get_dataset("workers")
+    attendance = get_dataset("attendance")
+    if not workers or not attendance:
+        return 1.0
+    
+    latest_days = sorted(attendance, key=lambda att: att.get("date", ""))[-days:]
+    ratios = []
+    for att in latest_days:
+        hadir = sum(1 for record in att.get("records", {}).values() if record.get("status") == "Hadir")
+        ratios.append(hadir / len(workers))
+    return min(1.0, max(0.1, sum(ratios) / len(ratios)))
+
+def get_remaining_stage_qty(tracking_json):
+    """Qty that still has to pass each processing stage.
+    Pieces sitting in a stage still need that stage; Pengiriman means finished."""
+    stages = get_tracking_stages()[:-1]
+    try:
+        tracking_data = json.loads(tracking_json)
+    except:
+        return {}
+    
+    remaining = {}
+    qty_upstream = 0
+    for stage in stages:
+        qty_upstream += tracking_data.get(stage, {}).get("qty", 0)
+        if qty_upstream > 0:
+            remaining[stage] = qty_upstream
+    return remaining
+
+def _new_schedule_state():
+    frozen_days = set(get_frozen_date_range())
+    factor = get_headcount_factor()
+    return {
+        "today": datetime.date.today(),
+        "frozen_days": frozen_days,
+        "capacity": {stage: cap * factor for stage, cap in STAGE_CAPACITY_PCS_PER_DAY.items()},
+        "headcount_factor": factor,
+        "work_days": [],
+        "ledger": {stage: [] for stage in STAGE_CAPACITY_PCS_PER_DAY},
+        "first_free": {stage: 0 for stage in STAGE_CAPACITY_PCS_PER_DAY},
+        "sequence": [],
+        "allocations": {},
+        "plans": {},
+        "data_version": get_data_version()
+    }
+
+def _get_work_day(state, day_idx):
+    """Working day by index (skip Sunday and frozen dates), extended lazily"""
+    work_days = state["work_days"]
+    while len(work_days) <= day_idx:
+        day = work_days[-1] + datetime.timedelta(days=1) if work_days else state["today"]
+        while day.weekday() == 6 or str(day) in state["frozen_days"]:
+            day += datetime.timedelta(days=1)
+        work_days.append(day)
+    return work_days[day_idx]
+
+def _schedule_sequence(df):
+    """Order lines in dispatch order: earliest due date, then priority"""
+    order_df = pd.DataFrame({
+        "Order ID": df["Order ID"].astype(str),
+        "Due": pd.to_datetime(df["Due Date"]),
+        "Rank": df["Prioritas"].map(GANTT_PRIORITY_RANK).fillna(2)
+    }).drop_duplicates("Order ID", keep="last").sort_values(["Due", "Rank", "Order ID"])
+    return order_df["Order ID"].tolist()
+
+def _plan_order(state, order_id, row):
+    """Forward-load one order stage by stage into the capacity ledger"""
+    allocations = []
+    stage_plan = {}
+    earliest_day = 0
+    
+    for stage, qty in get_remaining_stage_qty(row["Tracking"]).items():
+        capacity = state["capacity"].get(stage, 0)
+        if capacity <= 0:
+            continue
+        ledger = state["ledger"][stage]
+        day_idx = max(earliest_day, state["first_free"][stage])
+        qty_left = qty
+        start_idx = None
+        
+        while qty_left > 0:
+            if len(ledger) <= day_idx:
+                ledger.extend([0.0] * (day_idx + 1 - len(ledger)))
+            free = capacity - ledger[day_idx]
+            if free > 1e-9:
+                take = min(free, qty_left)
+                ledger[day_idx] += take
+                allocations.append((stage, day_idx, take))
+                qty_left -= take
+                if start_idx is None:
+                    start_idx = day_idx
+            if qty_left > 0:
+                day_idx += 1
+        
+        # Geser pointer hari pertama yang masih punya kapasitas
+        first_free = state["first_free"][stage]
+        while first_free < len(ledger) and capacity - ledger[first_free] <= 1e-9:
+            first_free += 1
+        state["first_free"][stage] = first_free
+        
+        stage_plan[stage] = {
+            "start": _get_work_day(state, start_idx),
+            "finish": _get_work_day(state, day_idx),
+            "qty": qty
+        }
+        # Tahap berikutnya mulai setelah tahap ini selesai
+        earliest_day = day_idx + 1
+    
+    due_date = pd.to_datetime(row["Due Date"]).date()
+    planned_finish = max((plan["finish"] for plan in stage_plan.values()), default=None)
+    state["allocations"][order_id] = allocations
+    state["plans"][order_id] = {
+        "stages": stage_plan,
+        "planned_start": min((plan["start"] for plan in stage_plan.values()), default=None),
+        "planned_finish": planned_finish,
+        "due_date": due_date,
+        "late": planned_finish is not None and planned_finish > due_date
+    }
+
+def _release_order(state, order_id):
+    """Give the capacity of an order back to the ledger"""
+    for stage, day_idx, qty in state["allocations"].pop(order_id, []):
+        state["ledger"][stage][day_idx] -= qty
+        if day_idx < state["first_free"][stage]:
+            state["first_free"][stage] = day_idx
+    state["plans"].pop(order_id, None)
+
+def build_production_schedule(df):
+    """Finite-capacity plan for all order lines (EDD forward loading)"""
+    state = _new_schedule_state()
+    rows = {str(row["Order ID"]): row for row in df.to_dict("records")}
+    state["sequence"] = _schedule_sequence(df)
+    for order_id in state["sequence"]:
+        _plan_order(state, order_id, rows[order_id])
+    return state
+
+def replan_production_schedule(df, changed_order_ids):
+    """Re-plan after some orders changed, called right after their save_data.
+    Orders earlier in the dispatch sequence keep their allocations; only the changed
+    orders and those after them are re-planned. Falls back to a full build when the
+    cached plan missed another save."""
+    state = st.session_state.get("production_schedule")
+    # Patch hanya jika plan persis satu save di belakang (save ini); ada save lain -> bangun ulang
+    if state is None or state["data_version"] != get_data_version() - 1 or not _schedule_state_valid(state):
+        state = build_production_schedule(df)
+        st.session_state["production_schedule"] = state
+        return state
+    
+    new_sequence = _schedule_sequence(df)
+    positions = [new_sequence.index(oid) for oid in changed_order_ids if oid in new_sequence]
+    positions += [state["sequence"].index(oid) for oid in changed_order_ids if oid in state["sequence"]]
+    if not positions:
+        state["data_version"] = get_data_version()
+        return state
+    first_pos = min(positions)
+    
+    for order_id in state["sequence"][first_pos:]:
+        _release_order(state, order_id)
+    for order_id in set(state["sequence"]) - set(new_sequence):
+        _release_order(state, order_id)
+    
+    rows = {str(row["Order ID"]): row for row in df.to_dict("records")}
+    for order_id in new_sequence[first_pos:]:
+        _plan_order(state, order_id, rows[order_id])
+    
+    state["sequence"] = new_sequence
+    state["data_version"] = get_data_version()
+    return state
+
+def _schedule_state_valid(state):
+    """Plan is reusable while day, frozen dates and headcount are unchanged"""
+    return (
+        state["today"] == datetime.date.today() and
+        state["frozen_days"] == set(get_frozen_date_range()) and
+        state["headcount_factor"] == get_headcount_factor()
+    )
+
+def get_production_schedule(df):
+    """Cached production plan, rebuilt when data version or planning inputs change"""
+    state = st.session_state.get("production_schedule")
+    if state is None or state["data_version"] != get_data_version() or not _schedule_state_valid(state):
+        state = build_production_schedule(df)
+        st.session_state["production_schedule"] = state
+    return state
+
+# ===== WORKSTATION LOAD PROJECTION =====
+WORKDAY_WEEKMASK = "1111110"  # Senin - Sabtu
+LOAD_HORIZON_OPTIONS = [14, 30, 60]
+
+def _parse_tracking_rows(tracking_values, stages):
+    matrix = np.zeros((len(tracking_values), len(stages)))
+    for i, tracking_json in enumerate(tracking_values):
+        try:
+            tracking_data = json.loads(tracking_json)
+        except:
+            continue
+        matrix[i] = [tracking_data.get(stage, {}).get("qty", 0) for stage in stages]
+    return matrix
+
+def get_tracking_matrix(df):
+    """Qty per order line (rows, in df order) and tracking stage (columns).
+    Rows are matched to the previous call by Order ID; only lines whose Tracking
+    JSON changed (or are new) are parsed again."""
+    stages = tuple(get_tracking_stages())
+    cached = st.session_state.get("tracking_matrix_cache")
+    # Frame yang sama (objek + index) tanpa save sejak panggilan terakhir: pakai langsung
+    if (cached is not None and cached["frame"] is df and cached["index"] is df.index and
+            cached["data_version"] == get_data_version() and cached["stages"] == stages):
+        return cached["matrix"]
+    
+    order_ids = pd.Index(df["Order ID"].astype(str))
+    tracking = df["Tracking"].to_numpy(dtype=object)
+    if cached is None or cached["stages"] != stages or not cached["order_ids"].is_unique:
+        matrix = _parse_tracking_rows(tracking, stages)
+    else:
+        positions = cached["order_ids"].get_indexer(order_ids)
+        unchanged = positions >= 0
+        unchanged[unchanged] = cached["tracking"][positions[unchanged]] == tracking[unchanged]
+        matrix = np.zeros((len(df), len(stages)))
+        matrix[unchanged] = cached["matrix"][positions[unchanged]]
+        changed = np.flatnonzero(~unchanged)
+        if len(changed):
+            matrix[changed] = _parse_tracking_rows(tracking[changed], stages)
+    
+    st.session_state["tracking_matrix_cache"] = {
+        "frame": df, "index": df.index, "data_version": get_data_version(),
+        "stages": stages, "order_ids": order_ids, "tracking": tracking, "matrix": matrix
+    }
+    return matrix
+
+def get_frozen_holidays():
+    """Frozen dates as numpy holidays for busday functions"""
+    return np.array(sorted(d for d in get_frozen_date_range() if d), dtype="datetime64[D]")
+
+def project_stage_load(df, horizon_days=30):
+    """Spread remaining qty of every order over its remaining stages between today and Due Date.
+    Each remaining stage gets an equal consecutive slice of the working days left.
+    Returns (stages, dates, load matrix stage x day, capacity per stage)."""
+    stages = get_tracking_stages()[:-1]
+    n_stages = len(stages)
+    today = np.datetime64(datetime.date.today(), "D")
+    holidays = get_frozen_holidays()
+    
+    # Qty that still has to pass each stage (remaining stages are contiguous up to Packaging)
+    remaining = np.cumsum(get_tracking_matrix(df)[:, :n_stages], axis=1)
+    active = remaining > 0
+    stage_count = active.sum(axis=1)
+    first_stage = n_stages - stage_count
+    
+    due_dates = pd.to_datetime(df["Due Date"], errors="coerce").fillna(pd.Timestamp(today))
+    due_days = due_dates.values.astype("datetime64[D]")
+    working_days = np.busday_count(today, due_days + 1, weekmask=WORKDAY_WEEKMASK, holidays=holidays)
+    working_days = np.maximum(working_days, 1)  # overdue: all load on the first working day
+    
+    position = np.arange(n_stages)[None, :] - first_stage[:, None]
+    slots = np.maximum(stage_count, 1)[:, None]
+    window = working_days[:, None]
+    start = (position * window) // slots
+    end = np.maximum(start + 1, ((position + 1) * window) // slots)
+    daily_qty = np.where(active, remaining / (end - start), 0)
+    
+    # Difference array per stage, then cumulative sum over days
+    mask = active & (start < horizon_days)
+    stage_idx = np.broadcast_to(np.arange(n_stages)[None, :], mask.shape)[mask]
+    width = horizon_days + 1
+    diff = np.bincount(stage_idx * width + start[mask], weights=daily_qty[mask], minlength=n_stages * width)
+    diff -= np.bincount(stage_idx * width + np.minimum(end[mask], horizon_days), weights=daily_qty[mask], minlength=n_stages * width)
+    load = np.cumsum(diff.reshape(n_stages, width), axis=1)[:, :horizon_days]
+    
+    dates = np.busday_offset(today, np.arange(horizon_days), roll="forward", weekmask=WORKDAY_WEEKMASK, holidays=holidays)
+    factor = get_headcount_factor()
+    capacity = np.array([STAGE_CAPACITY_PCS_PER_DAY.get(stage, 0) * factor for stage in stages])
+    return stages, pd.to_datetime(dates), load, capacity
+
+# ===== STORAGE OCCUPANCY LEDGER =====
+STORAGE_FORECAST_DAYS = 14
+STORAGE_TREND_RANGES = {"7 Hari": 7, "30 Hari": 30, "90 Hari": 90}
+
+def get_numeric_column(df, column, default=0.0):
+    """Column as float array; missing column or invalid values -> default"""
+    if column not in df.columns:
+        return np.full(len(df), default, dtype=float)
+    return pd.to_numeric(df[column], errors="coerce").fillna(default).to_numpy(dtype=float)
+
+def get_unit_floor_area(df):
+    """Floor area (m²) per unit for every order line, from Product Size P x L"""
+    prod_p = get_numeric_column(df, "Product Size P")
+    prod_l = get_numeric_column(df, "Product Size L")
+    return np.where((prod_p > 0) & (prod_l > 0), prod_p * prod_l / 10000, 0.0)
+
+def get_unit_cbm(df):
+    """CBM per unit for every order line (CBM per Pcs, fallback Total CBM / Qty)"""
+    cbm_per_pcs = get_numeric_column(df, "CBM per Pcs")
+    total_cbm = get_numeric_column(df, "Total CBM")
+    qty = get_numeric_column(df, "Qty")
+    fallback = np.divide(total_cbm, qty, out=np.zeros_like(total_cbm), where=qty > 0)
+    return np.where(cbm_per_pcs > 0, cbm_per_pcs, fallback)
+
+def get_stack_limit(df):
+    """Units per floor position for every order line.
+    Uses the order's Max Stack (or the product's max_stack), limited by MAX_STACK_HEIGHT_CM / product height."""
+    product_stack = {product.get("name"): product.get("max_stack", 1) for product in get_dataset("products")}
+    stack = get_numeric_column(df, "Max Stack", np.nan)
+    catalog_stack = pd.to_numeric(df["Produk"].map(product_stack), errors="coerce").fillna(1).to_numpy(dtype=float)
+    stack = np.where(np.isnan(stack) | (stack < 1), catalog_stack, stack)
+    
+    prod_t = get_numeric_column(df, "Product Size T")
+    height_limit = np.floor(np.divide(MAX_STACK_HEIGHT_CM, prod_t, out=np.full_like(prod_t, np.inf), where=prod_t > 0))
+    return np.maximum(np.minimum(stack, height_limit), 1)
+
+def calculate_storage_snapshot(df):
+    """Qty, floor area (m²) and CBM per storage stage.
+    Floor area = ceil(qty / stack limit) x product footprint."""
+    stages = get_tracking_stages()
+    storage_stages = get_storage_stages()
+    if df.empty:
+        return {stage: {"qty": 0, "area": 0.0, "cbm": 0.0} for stage in storage_stages}
+    
+    stage_idx = [stages.index(stage) for stage in storage_stages]
+    stage_qty = get_tracking_matrix(df)[:, stage_idx]
+    floor_positions = np.ceil(stage_qty / get_stack_limit(df)[:, None])
+    stage_area = (floor_positions * get_unit_floor_area(df)[:, None]).sum(axis=0)
+    stage_cbm = (stage_qty * get_unit_cbm(df)[:, None]).sum(axis=0)
+    qty_totals = stage_qty.sum(axis=0)
+    
+    return {
+        stage: {"qty": int(qty_totals[i]), "area": round(float(stage_area[i]), 4), "cbm": round(float(stage_cbm[i]), 4)}
+        for i, stage in enumerate(storage_stages)
+    }
+
+def calculate_zone_usage(snapshot):
+    """Used floor area per storage zone from a storage snapshot"""
+    return {
+        zone: {
+            "used": sum(snapshot.get(stage, {}).get("area", 0) for stage in zone_data["stages"]),
+            "area": zone_data["area"]
+        }
+        for zone, zone_data in STORAGE_ZONES.items()
+    }
+
+def load_storage_ledger():
+    """Load occupancy snapshots (JSON lines, oldest first)"""
+    ledger = []
+    if os.path.exists(STORAGE_LEDGER_DB_PATH):
+        try:
+            with open(STORAGE_LEDGER_DB_PATH, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        ledger.append(json.loads(line))
+        except:
+            pass
+    return ledger
+
+def get_storage_ledger():
+    if "storage_ledger" not in st.session_state:
+        st.session_state["storage_ledger"] = load_storage_ledger()
+    return st.session_state["storage_ledger"]
+
+def record_storage_snapshot(df):
+    """Append a snapshot to the ledger when storage occupancy changed"""
+    snapshot = calculate_storage_snapshot(df)
+    ledger = get_storage_ledger()
+    if ledger and ledger[-1]["stages"] == snapshot:
+        return False
+    
+    entry = {
+        "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "stages": snapshot,
+        "total_area": round(sum(data["area"] for data in snapshot.values()), 4),
+        "total_cbm": round(sum(data["cbm"] for data in snapshot.values()), 4)
+    }
+    try:
+        # Append-only, so every save costs one line instead of rewriting history
+        with open(STORAGE_LEDGER_DB_PATH, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    except:
+        return False
+    ledger.append(entry)
+    return True
+
+def get_storage_snapshots(start_ts, end_ts):
+    """Snapshots between two timestamps (inclusive), plus the one in effect at start_ts"""
+    import bisect
+    ledger = get_storage_ledger()
+    timestamps = [entry["timestamp"] for entry in ledger]
+    lo = bisect.bisect_left(timestamps, start_ts)
+    hi = bisect.bisect_right(timestamps, end_ts)
+    return ledger[max(lo - 1, 0):hi]
+
+def forecast_storage_area(df, horizon_days=STORAGE_FORECAST_DAYS):
+    """Daily storage area forecast from the production plan.
+    Pieces enter storage when Warehouse starts and leave when Packaging finishes.
+    Every term uses ceil'd floor positions per order, like calculate_storage_snapshot,
+    so the forecast returns to exactly 0 when everything has left storage."""
+    today = datetime.date.today()
+    stages = get_tracking_stages()
+    warehouse_idx = stages.index("Warehouse")
+    storage_idx = [stages.index(stage) for stage in get_storage_stages()]
+    
+    matrix = get_tracking_matrix(df)
+    stack = get_stack_limit(df)
+    footprint = get_unit_floor_area(df)
+    storage_qty = matrix[:, storage_idx]
+    incoming_qty = matrix[:, :warehouse_idx].sum(axis=1)
+    # Area order sekarang (posisi per tahap) dan setelah semua piece masuk storage
+    order_area = (np.ceil(storage_qty / stack[:, None]) * footprint[:, None]).sum(axis=1)
+    full_area = np.ceil((incoming_qty + storage_qty.sum(axis=1)) / stack) * footprint
+    incoming_area = np.where(incoming_qty > 0, full_area - order_area, 0.0)
+    outgoing_area = np.where(incoming_qty > 0, full_area, order_area)
+    current_area = order_area.sum()
+    
+    # Day offsets of planned arrivals and departures (beyond horizon -> horizon + 1)
+    plans = get_production_schedule(df)["plans"]
+    never = horizon_days + 1
+    arrive_day = np.full(len(df), never)
+    leave_day = np.full(len(df), never)
+    for i, order_id in enumerate(df["Order ID"].astype(str)):
+        stage_plan = plans.get(order_id, {}).get("stages", {})
+        if "Warehouse" in stage_plan:
+            arrive_day[i] = min((stage_plan["Warehouse"]["start"] - today).days, never)
+        if "Packaging" in stage_plan:
+            # Leaves storage the day after Packaging is finished
+            leave_day[i] = min((stage_plan["Packaging"]["finish"] - today).days + 1, never)
+    
+    arrivals = np.bincount(arrive_day, weights=incoming_area, minlength=never + 1)[:horizon_days + 1]
+    departures = np.bincount(leave_day, weights=outgoing_area, minlength=never + 1)[:horizon_days + 1]
+    forecast = current_area + np.cumsum(arrivals - departures)
+    
+    dates = [today + datetime.timedelta(days=i) for i in range(horizon_days + 1)]
+    saturation_date = next((day for day, area in zip(dates, forecast) if area >= TOTAL_STORAGE_AREA_M2), None)
+    return dates, forecast, saturation_date
@@ -0,0 +1,163 @@
+import streamlit as st
+
+# ===== CSS RESPONSIVE & COMPACT =====
+# Dibangun sekali saat modul di-import, setiap rerun cukup mengirim string yang sama
+RESPONSIVE_CSS = """
+    <style>
+    .block-container {
+        padding-top: 3rem !important;
+        padding-bottom: 1rem !important;
+    }
+    
+    h1, h2, h3 {
+        margin-top: 0.5rem !important;
+        margin-bottom: 0.5rem !important;
+    }
+    
+    [data-testid="stButton"] {
+        margin-top: 0 !important;
+        margin-bottom: 0.5rem !important;
+    }
+    
+    .stNumberInput, .stTextInput, .stSelectbox, .stDateInput {
+        margin-bottom: 0.3rem !important;
+    }
+    
+    div[data-testid="column"] {
+        padding: 0 0.5rem !important;
+    }
+    
+    input, select, textarea {
+        tab-index: auto !important;
+    }
+    
+    @media (max-width: 767px) {
+        [data-testid="stSidebar"] {
+            position: fixed;
+            z-index: 999;
+            width: 80vw !important;
+        }
+        .main .block-container {
+            padding: 0.5rem 0.3rem !important;
+        }
+        h1 { font-size: 1.3rem !important; }
+        h2 { font-size: 1.1rem !important; }
+        .stButton button { width: 100% !important; }
+    }
+    
+    .recent-orders-container {
+        max-height: 400px;
+        overflow-y: auto;
+        border: 1px solid #374151;
+        border-radius: 5px;
+        padding: 10px;
+    }
+    
+    .wip-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 1.5rem;
+        border-radius: 10px;
+        color: white;
+        text-align: center;
+    }
+    
+    .finished-card {
+        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+        padding: 1.5rem;
+        border-radius: 10px;
+        color: white;
+        text-align: center;
+    }
+    
+    .shipping-card {
+        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
+        padding: 1.5rem;
+        border-radius: 10px;
+        color: white;
+        text-align: center;
+    }
+    
+    .container-visual {
+        background: #1F2937;
+        border: 2px solid #3B82F6;
+        border-radius: 8px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+    
+    .container-progress {
+        height: 40px;
+        background: #374151;
+        border-radius: 5px;
+        overflow: hidden;
+        position: relative;
+    }
+    
+    .container-fill {
+        height: 100%;
+        background: linear-gradient(90deg, #10B981 0%, #3B82F6 100%);
+        transition: width 0.3s ease;
+    }
+    
+    .knockdown-piece {
+        background: #1F2937;
+        border: 1px solid #3B82F6;
+        border-radius: 8px;
+        padding: 12px;
+        margin: 8px 0;
+    }
+    
+    .piece-badge {
+        background: #3B82F6;
+        color: white;
+        padding: 4px 10px;
+        border-radius: 12px;
+        font-size: 0.85em;
+        font-weight: bold;
+    }
+    
+    .user-info-badge {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 8px 15px;
+        border-radius: 20px;
+        font-size: 0.9rem;
+        display: inline-block;
+        margin: 5px 0;
+    }
+    
+    .order-card {
+        background: #1F2937;
+        border: 1px solid #374151;
+        border-radius: 8px;
+        padding: 12px;
+        margin: 8px 0;
+        transition: all 0.2s ease;
+    }
+    
+    .order-card:hover {
+        border-color: #3B82F6;
+        box-shadow: 0 4px 6px rgba(59, 130, 246, 0.2);
+    }
+    </style>
+    
+    <script>
+    document.addEventListener('DOMContentLoaded', function() {
+        const inputs = document.querySelectorAll('input, select, textarea');
+        inputs.forEach((input, index) => {
+            input.addEventListener('keypress', function(e) {
+                if (e.key === 'Enter') {
+                    e.preventDefault();
+                    const nextInput = inputs[index + 1];
+                    if (nextInput) {
+                        nextInput.focus();
+                    }
+                }
+            });
+        });
+    });
+    </script>
+    """
+
+def inject_responsive_css():
+    st.markdown(RESPONSIVE_CSS, unsafe_allow_html=True)
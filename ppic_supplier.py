@@ -0,0 +1,211 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import datetime
+import json
+import os
+
+from ppic_config import (
+    SUPPLIER_STATS_PATH, SUPPLIER_DEFAULT_LEAD_DAYS, SUPPLIER_LEAD_TIME_BINS,
+    SUPPLIER_PRICE_WINDOW_MONTHS, SUPPLIER_SCORE_WEIGHTS
+)
+from ppic_data import get_dataset, locked_file, atomic_write_json
+from ppic_mrp import material_key
+
+# ===== SUPPLIER PERFORMANCE (INCREMENTAL AGGREGATES) =====
+# supplier_stats.json menyimpan kontribusi per line procurement yang sudah diterima dan
+# agregatnya (lead time histogram, on-time, harga per material/bulan). Setiap perubahan
+# status hanya menambah/mengurangi kontribusi line tersebut, tanpa scan riwayat.
+
+def _empty_supplier_stats():
+    return {"lines": {}, "suppliers": {}, "prices": {}, "names": {}}
+
+def get_supplier_lead_days(supplier_name):
+    """Promised lead time of a supplier (days)"""
+    for supplier in get_dataset("suppliers"):
+        if supplier.get("name") == supplier_name:
+            return int(supplier.get("lead_time_days") or SUPPLIER_DEFAULT_LEAD_DAYS)
+    return SUPPLIER_DEFAULT_LEAD_DAYS
+
+def _parse_timestamp(value):
+    try:
+        return datetime.datetime.fromisoformat(str(value)[:19])
+    except ValueError:
+        return None
+
+def _line_contribution(line):
+    """What one received procurement line adds to the aggregates (None if not countable)"""
+    supplier = str(line.get("supplier") or "").strip()
+    ordered_at = _parse_timestamp(line.get("ordered_at"))
+    received_at = _parse_timestamp(line.get("received_at"))
+    if not supplier or ordered_at is None or received_at is None:
+        return None
+    lead_days = max((received_at - ordered_at).total_seconds() / 86400, 0.0)
+    return {
+        "supplier": supplier,
+        "material_key": material_key(line.get("Nama Barang")),
+        "material": str(line.get("Nama Barang") or "").strip(),
+        "lead_days": round(lead_days, 2),
+        "on_time": lead_days <= get_supplier_lead_days(supplier),
+        "month": ordered_at.strftime("%Y-%m"),
+        "price": float(line.get("Harga per Unit") or 0),
+        "qty": float(line.get("Jumlah Total") or 0)
+    }
+
+def _apply_contribution(stats, contribution, sign):
+    supplier = stats["suppliers"].setdefault(contribution["supplier"], {
+        "count": 0, "lead_sum": 0.0, "lead_sq": 0.0, "on_time": 0, "hist": [0] * (SUPPLIER_LEAD_TIME_BINS + 1)
+    })
+    lead = contribution["lead_days"]
+    supplier["count"] += sign
+    supplier["lead_sum"] = round(supplier["lead_sum"] + sign * lead, 4)
+    supplier["lead_sq"] = round(supplier["lead_sq"] + sign * lead * lead, 4)
+    supplier["on_time"] += sign * int(contribution["on_time"])
+    supplier["hist"][min(int(lead), SUPPLIER_LEAD_TIME_BINS)] += sign
+
+    if contribution["material_key"] and contribution["qty"] > 0:
+        stats["names"].setdefault(contribution["material_key"], contribution["material"])
+        months = stats["prices"].setdefault(contribution["material_key"], {}).setdefault(contribution["supplier"], {})
+        month = months.setdefault(contribution["month"], [0.0, 0.0, 0])
+        month[0] = round(month[0] + sign * contribution["qty"], 6)
+        month[1] = round(month[1] + sign * contribution["qty"] * contribution["price"], 2)
+        month[2] += sign
+        if month[2] <= 0:
+            del months[contribution["month"]]
+
+def _write_supplier_stats(stats):
+    atomic_write_json(SUPPLIER_STATS_PATH, stats, indent=None)
+
+def rebuild_supplier_stats():
+    """Full pass over received procurement lines (first run / repair only)"""
+    stats = _empty_supplier_stats()
+    lines = get_dataset("procurement")["lines"]
+    for line in lines[lines["received_at"] != ""].to_dict("records"):
+        contribution = _line_contribution(line)
+        if contribution:
+            stats["lines"][line["id"]] = contribution
+            _apply_contribution(stats, contribution, 1)
+    _write_supplier_stats(stats)
+    return stats
+
+def _read_supplier_stats():
+    if os.path.exists(SUPPLIER_STATS_PATH):
+        try:
+            with open(SUPPLIER_STATS_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except:
+            pass
+    return None
+
+def get_supplier_stats():
+    if "supplier_stats" not in st.session_state:
+        stats = _read_supplier_stats()
+        st.session_state["supplier_stats"] = stats if stats is not None else rebuild_supplier_stats()
+    return st.session_state["supplier_stats"]
+
+def sync_supplier_lines(record, deleted=False):
+    """Update the aggregates for the lines of one procurement after a status change or delete"""
+    with locked_file(SUPPLIER_STATS_PATH):
+        stats = _read_supplier_stats()
+        if stats is None:
+            stats = rebuild_supplier_stats()
+        changed = False
+        for line in record.get("items", []):
+            old = stats["lines"].get(line["id"])
+            new = None if deleted else _line_contribution(line)
+            if old == new:
+                continue
+            if old:
+                _apply_contribution(stats, old, -1)
+                del stats["lines"][line["id"]]
+            if new:
+                _apply_contribution(stats, new, 1)
+                stats["lines"][line["id"]] = new
+            changed = True
+        if changed:
+            _write_supplier_stats(stats)
+    st.session_state["supplier_stats"] = stats
+    return changed
+
+# ===== QUERIES =====
+def _histogram_percentile(hist, count, q):
+    """Lead time (days) at percentile q from the per-day histogram"""
+    if count <= 0:
+        return None
+    cumulative = np.cumsum(hist)
+    return int(np.searchsorted(cumulative, q * count))
+
+def get_supplier_performance():
+    """Lead-time distribution and on-time rate per supplier, straight from the aggregates"""
+    rows = []
+    for name, agg in get_supplier_stats()["suppliers"].items():
+        count = agg["count"]
+        if count <= 0:
+            continue
+        mean = agg["lead_sum"] / count
+        rows.append({
+            "supplier": name,
+            "received_lines": count,
+            "lead_mean": round(mean, 1),
+            "lead_std": round(float(np.sqrt(max(agg["lead_sq"] / count - mean * mean, 0.0))), 1),
+            "lead_p50": _histogram_percentile(agg["hist"], count, 0.5),
+            "lead_p90": _histogram_percentile(agg["hist"], count, 0.9),
+            "on_time_rate": agg["on_time"] / count,
+            "promised_lead": get_supplier_lead_days(name)
+        })
+    return pd.DataFrame(rows, columns=[
+        "supplier", "received_lines", "lead_mean", "lead_std", "lead_p50", "lead_p90", "on_time_rate", "promised_lead"
+    ]).sort_values("on_time_rate", ascending=False, ignore_index=True)
+
+def get_lead_time_histogram(supplier_name):
+    agg = get_supplier_stats()["suppliers"].get(supplier_name)
+    return list(agg["hist"]) if agg else [0] * (SUPPLIER_LEAD_TIME_BINS + 1)
+
+def get_price_trend(material):
+    """Average unit price per month and supplier for one material"""
+    rows = [
+        {"month": month, "supplier": supplier, "avg_price": values[1] / values[0] if values[0] else 0.0, "qty": values[0]}
+        for supplier, months in get_supplier_stats()["prices"].get(material_key(material), {}).items()
+        for month, values in months.items()
+    ]
+    return pd.DataFrame(rows, columns=["month", "supplier", "avg_price", "qty"]).sort_values(["month", "supplier"], ignore_index=True)
+
+def get_priced_materials():
+    """Display names of materials that have price history"""
+    stats = get_supplier_stats()
+    return sorted(stats["names"].get(key, key) for key, suppliers in stats["prices"].items() if suppliers)
+
+def rank_suppliers(material):
+    """Candidate suppliers for a material, best first (lower score = better)"""
+    stats = get_supplier_stats()
+    candidates = []
+    for supplier, months in stats["prices"].get(material_key(material), {}).items():
+        recent = sorted(months)[-SUPPLIER_PRICE_WINDOW_MONTHS:]
+        qty = sum(months[month][0] for month in recent)
+        if qty <= 0:
+            continue
+        agg = stats["suppliers"].get(supplier, {})
+        count = agg.get("count", 0)
+        candidates.append({
+            "supplier": supplier,
+            "avg_price": sum(months[month][1] for month in recent) / qty,
+            "lead_mean": agg["lead_sum"] / count if count else float(get_supplier_lead_days(supplier)),
+            "on_time_rate": agg["on_time"] / count if count else 0.0
+        })
+    ranking = pd.DataFrame(candidates, columns=["supplier", "avg_price", "lead_mean", "on_time_rate"])
+    if ranking.empty:
+        return ranking.assign(score=pd.Series(dtype=float))
+    weights = SUPPLIER_SCORE_WEIGHTS
+    ranking["score"] = (
+        weights["price"] * ranking["avg_price"] / max(ranking["avg_price"].min(), 1e-9) +
+        weights["lead_time"] * (ranking["lead_mean"] + 1) / (ranking["lead_mean"].min() + 1) +
+        weights["on_time"] * (1 - ranking["on_time_rate"])
+    )
+    return ranking.sort_values("score", ignore_index=True)
+
+def suggest_supplier(material):
+    """Best supplier for a material as a dict, or None without price history"""
+    if not material_key(material):
+        return None
+    ranking = rank_suppliers(material)
+    return ranking.iloc[0].to_dict() if not ranking.empty else None
@@ -0,0 +1,162 @@
+import pandas as pd
+import re
+
+from ppic_payroll import validate_attendance_grid, summarize_attendance_grid, format_time_minutes, flatten_attendance
+
+# ===== TIME-CLOCK IMPORT (FINGERPRINT CSV) =====
+PUNCH_CSV_CHUNKSIZE = 50000
+PUNCH_DEDUP_MINUTES = 5  # Punch berulang dalam 5 menit dianggap satu kali scan
+
+# Nama kolom umum dari export mesin fingerprint (lowercase)
+PUNCH_COLUMN_ALIASES = {
+    "worker_id": ["worker_id", "id", "ac-no.", "ac-no", "ac no", "no.", "no", "pin", "user id", "userid", "enroll id", "badge"],
+    "name": ["name", "nama", "nama pekerja"],
+    "datetime": ["datetime", "date/time", "date time", "timestamp", "waktu", "tanggal jam", "scan time"],
+    "date": ["date", "tanggal", "tgl"],
+    "time": ["time", "jam"]
+}
+
+def detect_punch_columns(columns):
+    """Map the export's column names to worker_id/name/datetime/date/time"""
+    lookup = {str(col).strip().lower(): col for col in columns}
+    mapping = {}
+    for field, aliases in PUNCH_COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in lookup:
+                mapping[field] = lookup[alias]
+                break
+
+    if "worker_id" not in mapping and "name" not in mapping:
+        raise ValueError("Kolom ID atau Nama pekerja tidak ditemukan")
+    if "datetime" not in mapping and not ("date" in mapping and "time" in mapping):
+        raise ValueError("Kolom waktu scan tidak ditemukan (butuh Date/Time atau Date + Time)")
+    return mapping
+
+def build_worker_lookup(workers):
+    """Lookup key -> worker id; matches "WRK-001", enroll number 1 or the worker name"""
+    lookup = {}
+    for idx, worker in enumerate(workers):
+        worker_id = worker.get("id", str(idx))
+        lookup[f"name:{worker.get('name', '').strip().lower()}"] = worker_id
+        lookup[f"id:{worker_id.strip().upper()}"] = worker_id
+        number = re.search(r"(\d+)$", worker_id)
+        if number:
+            lookup.setdefault(f"id:{int(number.group(1))}", worker_id)
+    return lookup
+
+def normalize_punch_chunk(chunk, mapping, lookup, dayfirst=True):
+    """Raw export rows -> (worker_id, date, minute) punches plus unmatched raw keys"""
+    if "datetime" in mapping:
+        stamp_text = chunk[mapping["datetime"]].astype("string")
+    else:
+        stamp_text = chunk[mapping["date"]].astype("string") + " " + chunk[mapping["time"]].astype("string")
+    # ISO (YYYY-MM-DD) dulu tanpa dayfirst, sisanya baru day-first
+    stamp_text = stamp_text.str.strip()
+    iso = pd.to_datetime(stamp_text, errors="coerce", format="ISO8601")
+    rest = pd.to_datetime(stamp_text.where(iso.isna()), errors="coerce", dayfirst=dayfirst, format="mixed")
+    stamps = iso.fillna(rest)
+
+    matched = pd.Series(pd.NA, index=chunk.index, dtype="object")
+    raw_key = pd.Series("", index=chunk.index, dtype="object")
+    if "worker_id" in mapping:
+        raw_id = chunk[mapping["worker_id"]].astype("string").str.strip().str.upper()
+        # Enroll number "0001" cocok dengan WRK-001
+        numeric = pd.to_numeric(raw_id, errors="coerce")
+        id_keys = ("id:" + numeric.astype("Int64").astype("string")).where(numeric.notna(), "id:" + raw_id)
+        matched = id_keys.map(lookup)
+        raw_key = raw_id.fillna("")
+    if "name" in mapping:
+        raw_name = chunk[mapping["name"]].astype("string").str.strip()
+        matched = matched.fillna(("name:" + raw_name.str.lower()).map(lookup))
+        raw_key = raw_key.where(raw_key != "", raw_name.fillna(""))
+
+    valid = stamps.notna() & matched.notna()
+    punches = pd.DataFrame({
+        "worker_id": matched[valid].astype(str),
+        "date": stamps[valid].dt.strftime("%Y-%m-%d"),
+        "minute": stamps[valid].dt.hour * 60 + stamps[valid].dt.minute
+    })
+    unmatched = raw_key[stamps.notna() & matched.isna()].value_counts()
+    return punches, unmatched, int(stamps.isna().sum())
+
+def read_punch_log(source, workers, dayfirst=True, chunksize=PUNCH_CSV_CHUNKSIZE, on_chunk=None):
+    """Stream a punch CSV in chunks and reduce it to first/last punch per worker per day
+
+    Only the per-day aggregate is kept in memory, so exports with many thousands
+    of punches are read without loading the whole file.
+    """
+    lookup = build_worker_lookup(workers)
+    daily_parts = []
+    unmatched_parts = []
+    stats = {"rows": 0, "bad_time": 0}
+
+    reader = pd.read_csv(source, chunksize=chunksize, dtype=str, sep=None, engine="python", skipinitialspace=True)
+    mapping = None
+    for chunk in reader:
+        if mapping is None:
+            mapping = detect_punch_columns(chunk.columns)
+        punches, unmatched, bad_time = normalize_punch_chunk(chunk, mapping, lookup, dayfirst)
+        stats["rows"] += len(chunk)
+        stats["bad_time"] += bad_time
+        unmatched_parts.append(unmatched)
+        daily_parts.append(punches.groupby(["worker_id", "date"])["minute"].agg(["min", "max", "count"]))
+        if on_chunk:
+            on_chunk(stats["rows"])
+
+    if daily_parts:
+        daily = pd.concat(daily_parts).groupby(level=[0, 1]).agg({"min": "min", "max": "max", "count": "sum"}).reset_index()
+    else:
+        daily = pd.DataFrame(columns=["worker_id", "date", "min", "max", "count"])
+    unmatched = pd.concat(unmatched_parts).groupby(level=0).sum() if unmatched_parts else pd.Series(dtype=int)
+    stats["unmatched"] = unmatched.sort_values(ascending=False)
+    return daily, stats
+
+def pair_daily_punches(daily):
+    """First punch = masuk, last punch = pulang; a single scan leaves pulang empty"""
+    has_out = (daily["count"] > 1) & (daily["max"] - daily["min"] >= PUNCH_DEDUP_MINUTES)
+    return pd.DataFrame({
+        "date": daily["date"],
+        "worker_id": daily["worker_id"],
+        "status": "Hadir",
+        "check_in": format_time_minutes(daily["min"].astype(float)),
+        "check_out": format_time_minutes(daily["max"].astype(float).where(has_out))
+    })
+
+def build_import_plan(daily, workers, attendance):
+    """Dry-run diff of imported punches against the attendance store
+
+    Returns (diff_df, days) where days is {date: (records_df, summary)} ready
+    for upsert_attendance_days; rows that fail validation are left out.
+    """
+    imported = pair_daily_punches(daily)
+    worker_info = pd.DataFrame(workers).rename(columns={"id": "worker_id"})
+    worker_info = worker_info.reindex(columns=["worker_id", "name", "position"]).fillna({"position": "-"})
+    imported = imported.merge(worker_info, on="worker_id", how="left")
+    imported, _ = validate_attendance_grid(imported)
+
+    existing = flatten_attendance(attendance, dates=set(imported["date"]))
+    diff = imported.merge(
+        existing[["date", "worker_id", "status", "check_in", "check_out"]],
+        on=["date", "worker_id"], how="left", suffixes=("", "_lama")
+    )
+    is_new = diff["status_lama"].isna()
+    unchanged = (
+        (diff["status"] == diff["status_lama"])
+        & (diff["check_in"] == diff["check_in_lama"])
+        & (diff["check_out"] == diff["check_out_lama"])
+    )
+    diff["action"] = "Update"
+    diff.loc[is_new, "action"] = "Baru"
+    diff.loc[~is_new & unchanged, "action"] = "Sama"
+    diff.loc[diff["error"] != "", "action"] = "Error"
+
+    # Hari yang diimport = record lama + hasil import (import menimpa worker yang sama)
+    to_apply = imported[diff["action"].isin(["Baru", "Update"]).to_numpy()]
+    kept = existing[existing["date"].isin(set(to_apply["date"]))]
+    combined = pd.concat([kept, to_apply[kept.columns]]).drop_duplicates(["date", "worker_id"], keep="last")
+    combined, _ = validate_attendance_grid(combined)
+
+    days = {}
+    for date_str, day_df in combined.groupby("date"):
+        days[date_str] = (day_df, summarize_attendance_grid(day_df))
+    return diff, days